@@ -7,13 +7,46 @@ class Config:
     LLM_API_KEY = os.getenv("LLM_API_KEY")
     LLM_API_URL = os.getenv("LLM_API_URL")
     ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+
+    # LLM HTTP client settings
+    LLM_CONNECT_TIMEOUT = 5  # seconds
+    LLM_READ_TIMEOUT = 60  # seconds between bytes, not for the whole response
+    LLM_POOL_CONNECTIONS = 4  # hosts kept in the pool
+    LLM_POOL_SIZE = 20  # keep-alive connections per host
+    LLM_MAX_RETRIES = 3
+    LLM_BACKOFF_BASE = 0.5  # seconds; doubled each retry, with full jitter
+    LLM_BACKOFF_MAX = 8
+    LLM_RETRY_AFTER_MAX = 30  # longest Retry-After we are willing to wait
+    LLM_MAX_CONCURRENCY = 100  # async LLM requests in flight per event loop
     
+    # Storage settings
+    STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json")  # json or sqlite
+    SQLITE_PATH = os.getenv("SQLITE_PATH")  # defaults to data/foodiespot.db
+    # Append reservation writes to a journal instead of rewriting reservations.json
+    RESERVATION_JOURNAL = os.getenv("RESERVATION_JOURNAL", "false").lower() == "true"
+    JOURNAL_COMPACT_THRESHOLD = 1000  # journal records before folding into a snapshot
+    # Distinguishes processes in reservation ids (0-1023). Unset, each process
+    # leases a free id through a lock file next to the reservation data, which
+    # only coordinates processes on one host: set it per host when several
+    # hosts share a database.
+    WORKER_ID = os.getenv("WORKER_ID")
+
     # Restaurant search settings
     MAX_SEARCH_RESULTS = 5
+    # Weights of the parts of a search result's score (each part lies in 0..1)
+    SEARCH_SCORE_WEIGHTS = {"rating": 1.0, "price_fit": 0.5, "seat_fit": 0.5}
+    # Trigram similarity (0..1) a misspelt name, cuisine or location must reach
+    FUZZY_MATCH_THRESHOLD = 0.3
     
     # Reservation settings
     MIN_PARTY_SIZE = 1
     MAX_PARTY_SIZE = 20
+    MAX_COMBINED_TABLES = 3  # adjacent tables that may be joined for one party
+    DEFAULT_TURN_TIME = 90  # minutes a party keeps its table unless the restaurant says otherwise
+    AVAILABILITY_CACHE_SIZE = 4096  # cached check_availability answers
+    HOLD_TTL_SECONDS = 300  # how long hold_slot keeps tables by default
+    MAX_HOLD_TTL_SECONDS = 1800
+    ALTERNATIVE_SEARCH_DAYS = 7  # days ahead searched when a requested slot is full
     
     # Time slot settings
     TIME_SLOT_INTERVAL = 30  # minutes
\ No newline at end of file
@@ -55,8 +55,13 @@ def main():
                 
             # Get bot response
             with st.chat_message("assistant"):
-                response = st.session_state.llm_manager.process_message(prompt, st.session_state.customer_name)
-                st.markdown(response)
+                # Render the reply as it streams in, with a cursor until it ends
+                placeholder = st.empty()
+                response = ""
+                for chunk in st.session_state.llm_manager.stream_message(prompt, st.session_state.customer_name):
+                    response += chunk
+                    placeholder.markdown(response + "▌")
+                placeholder.markdown(response)
                 st.session_state.messages.append({"role": "assistant", "content": response})
 
 if __name__ == "__main__":
@@ -191,8 +191,20 @@ class FoodieSpotAssistant:
     def _handle_active_restaurant_flow(self, user_message: str) -> str:
         """Handle reservation flow for selected restaurant."""
         try:
-            date, time = user_message.split(' ')
-            datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+            # A number picks one of the alternatives offered last time, which
+            # may be at another restaurant, so switch to it before booking
+            alternatives = self.conversation_state.active_context.get('last_alternatives') or []
+            choice = user_message.strip()
+            if choice.isdigit() and alternatives:
+                if not 1 <= int(choice) <= len(alternatives):
+                    return "Please select a valid option number from the list above."
+                picked = alternatives[int(choice) - 1]
+                self.conversation_state.set_active_restaurant(picked['restaurant_id'])
+                date, time = picked['date'], picked['time']
+            else:
+                date, time = user_message.split(' ')
+                datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
+            self.conversation_state.active_context['last_alternatives'] = []
             
             availability = self.tool_manager.execute_tool(
                 "check_availability",
@@ -220,8 +232,28 @@ class FoodieSpotAssistant:
                     self.conversation_state.reset_context()
                     return f"Perfect! Your reservation is confirmed for {date} at {time}. Your reservation ID is {reservation.id}."
                 
-            return ("I apologize, but that time slot isn't available. "
-                   "Would you like to see alternative times?")
+            alternatives = self.tool_manager.execute_tool(
+                "find_alternatives",
+                {
+                    "restaurant_id": self.conversation_state.active_context['current_restaurant'],
+                    "date": date,
+                    "time": time,
+                    "party_size": self.conversation_state.preferences['party_size']
+                }
+            )
+            if not alternatives:
+                return ("I apologize, but that time slot isn't available, "
+                       "and I couldn't find anything close to it. Would you like to try another day?")
+
+            self.conversation_state.active_context['last_alternatives'] = alternatives
+            options = "\n".join(
+                f"{idx}. {alt['restaurant_name']}: {alt['date']} {alt['time']}"
+                for idx, alt in enumerate(alternatives, 1)
+            )
+            return ("I apologize, but that time slot isn't available. Here are the closest options:\n"
+                   f"{options}\n"
+                   "Reply with the number of an option, or another date and time "
+                   "at this restaurant (YYYY-MM-DD HH:MM).")
         except ValueError:
             return ("Please provide the date and time in the correct format: YYYY-MM-DD HH:MM\n"
                    "For example: 2024-03-20 19:00")
@@ -0,0 +1,173 @@
+import asyncio
+import json as _json
+import ssl
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from app.config import Config
+from core.http_client import RETRY_STATUSES, backoff_delay, retry_after
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class AsyncHTTPError(Exception):
+    """A request failed at the transport level or with an error status."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class AsyncResponse:
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return _json.loads(self.body)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise AsyncHTTPError(f"HTTP {self.status}", self.status)
+
+
+class AsyncHTTPClient:
+    """
+    Minimal HTTP/1.1 client on asyncio streams for JSON POSTs.
+
+    Connections are kept alive and pooled per host. A semaphore bounds the
+    requests in flight, so a burst of conversations queues instead of opening
+    a socket each. Retries follow the same policy as post_with_retries. If
+    the calling task is cancelled the connection in use is closed rather
+    than returned to the pool, since its response may be half read.
+    Bound to the event loop it is first used on.
+    """
+
+    def __init__(self, max_concurrency: int = Config.LLM_MAX_CONCURRENCY, max_idle: int = Config.LLM_POOL_SIZE):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_idle = max_idle
+        self._idle: Dict[Tuple[str, str, int], List[_Connection]] = {}
+
+    async def post(self, url: str, json: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> AsyncResponse:
+        """POST a JSON body, returning the last response whatever its status."""
+        body = _json.dumps(json).encode()
+        for attempt in range(Config.LLM_MAX_RETRIES + 1):
+            last_attempt = attempt == Config.LLM_MAX_RETRIES
+            try:
+                async with self._semaphore:
+                    response = await self._send(url, body, headers or {})
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError) as e:
+                if last_attempt:
+                    raise AsyncHTTPError(f"{type(e).__name__}: {e}") from e
+                await asyncio.sleep(backoff_delay(attempt))
+                continue
+
+            if response.status not in RETRY_STATUSES or last_attempt:
+                return response
+            delay = retry_after(response.headers.get("retry-after"))
+            await asyncio.sleep(backoff_delay(attempt) if delay is None else delay)
+
+    async def aclose(self):
+        """Close every pooled connection."""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for _, writer in connections:
+                writer.close()
+
+    async def _send(self, url: str, body: bytes, headers: Dict[str, str]) -> AsyncResponse:
+        parts = urlsplit(url)
+        secure = parts.scheme == "https"
+        key = (parts.scheme, parts.hostname, parts.port or (443 if secure else 80))
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        reader, writer = await self._connect(key, secure)
+        try:
+            lines = [
+                f"POST {path} HTTP/1.1",
+                f"Host: {parts.netloc}",
+                "Content-Type: application/json",
+                f"Content-Length: {len(body)}",
+                "Connection: keep-alive"
+            ]
+            lines.extend(f"{name}: {value}" for name, value in headers.items() if name.lower() != "content-type")
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+            await writer.drain()
+            response, reusable = await _read_response(reader)
+        except BaseException:
+            # Including cancellation: the connection state is unknown, so drop it
+            writer.close()
+            raise
+
+        idle = self._idle.setdefault(key, [])
+        if reusable and len(idle) < self._max_idle:
+            idle.append((reader, writer))
+        else:
+            writer.close()
+        return response
+
+    async def _connect(self, key: Tuple[str, str, int], secure: bool) -> _Connection:
+        idle = self._idle.get(key, [])
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer
+            writer.close()
+        _, host, port = key
+        return await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=ssl.create_default_context() if secure else None),
+            Config.LLM_CONNECT_TIMEOUT
+        )
+
+
+async def _read_response(reader: asyncio.StreamReader) -> Tuple[AsyncResponse, bool]:
+    """Read one response; also returns whether the connection can be reused."""
+    status_line = await _read_line(reader)
+    version, status = status_line.split(" ", 2)[:2]
+    headers = {}
+    while True:
+        line = await _read_line(reader)
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    reusable = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        chunks = []
+        while True:
+            size = int((await _read_line(reader)).split(";")[0], 16)
+            if size == 0:
+                # Skip trailers up to the blank line ending the message
+                while await _read_line(reader):
+                    pass
+                break
+            chunks.append(await _read(reader.readexactly(size)))
+            await _read_line(reader)
+        body = b"".join(chunks)
+    elif "content-length" in headers:
+        body = await _read(reader.readexactly(int(headers["content-length"])))
+    else:
+        # Delimited by the server closing the connection
+        body = await _read(reader.read())
+        reusable = False
+    return AsyncResponse(int(status), headers, body), reusable
+
+async def _read_line(reader: asyncio.StreamReader) -> str:
+    line = await _read(reader.readuntil(b"\r\n"))
+    return line[:-2].decode("latin-1")
+
+async def _read(awaitable):
+    return await asyncio.wait_for(awaitable, Config.LLM_READ_TIMEOUT)
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncHTTPClient]" = weakref.WeakKeyDictionary()
+
+def get_async_client() -> AsyncHTTPClient:
+    """Client shared by every coroutine on the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = AsyncHTTPClient()
+    return client
@@ -12,6 +12,7 @@ class ConversationState:
             'reservation_attempt': {},
             'modification_request': None,
             'last_search_results': [],
+            'last_alternatives': [],
             'last_interaction_time': None
         }
     
@@ -126,5 +127,6 @@ class ConversationState:
             'reservation_attempt': {},
             'modification_request': None,
             'last_search_results': [],
+            'last_alternatives': [],
             'last_interaction_time': None
         } 
\ No newline at end of file
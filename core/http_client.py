@@ -0,0 +1,108 @@
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.config import Config
+
+# Worth retrying: rate limiting and transient upstream failures
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_session() -> requests.Session:
+    """
+    Process-wide session, so every conversation reuses the same pool of
+    keep-alive connections instead of handshaking on each call.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Retries are done by post_with_retries, which honours Retry-After
+                adapter = HTTPAdapter(
+                    pool_connections=Config.LLM_POOL_CONNECTIONS,
+                    pool_maxsize=Config.LLM_POOL_SIZE,
+                    max_retries=0
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+def post_with_retries(
+    url: str,
+    json: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    stream: bool = False,
+    session: Optional[requests.Session] = None,
+    sleep: Callable[[float], None] = time.sleep
+) -> requests.Response:
+    """
+    POST with connect and read timeouts, retrying connection errors,
+    timeouts and RETRY_STATUSES up to Config.LLM_MAX_RETRIES times. The last
+    response is returned whatever its status; the last exception is raised.
+    """
+    session = session or get_session()
+    timeout = (Config.LLM_CONNECT_TIMEOUT, Config.LLM_READ_TIMEOUT)
+    for attempt in range(Config.LLM_MAX_RETRIES + 1):
+        last_attempt = attempt == Config.LLM_MAX_RETRIES
+        try:
+            response = session.post(url, json=json, headers=headers, timeout=timeout, stream=stream)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if last_attempt:
+                raise
+            sleep(backoff_delay(attempt))
+            continue
+
+        if response.status_code not in RETRY_STATUSES or last_attempt:
+            return response
+        delay = retry_after(response.headers.get("Retry-After"))
+        # Hand the connection back to the pool before waiting
+        response.close()
+        sleep(backoff_delay(attempt) if delay is None else delay)
+
+def backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(max, base * 2**attempt)]."""
+    return random.uniform(0, min(Config.LLM_BACKOFF_MAX, Config.LLM_BACKOFF_BASE * 2 ** attempt))
+
+def retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (seconds or HTTP date), capped."""
+    if not value:
+        return None
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        delay = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), Config.LLM_RETRY_AFTER_MAX)
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Data payloads of a server-sent event stream, one per event. Multi-line
+    data fields are joined with newlines; comments and other fields are skipped.
+    """
+    data = []
+    for line in lines:
+        if not line:
+            if data:
+                yield "\n".join(data)
+                data = []
+            continue
+        if line.startswith("data:"):
+            value = line[5:]
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        yield "\n".join(data)
@@ -1,9 +1,12 @@
 # core/llm_manager.py
 
+import asyncio
 import json
 import requests
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 from app.config import Config
+from core.async_http import AsyncHTTPError, get_async_client
+from core.http_client import iter_sse_data, post_with_retries
 from core.prompt_templates import PromptTemplates
 from .conversation_state import ConversationState
 
@@ -17,6 +20,56 @@ class LLMManager:
     
     def process_message(self, user_message: str, customer_name: str) -> str:
         """Process user message with memory context."""
+        messages = self._prepare_messages(user_message, customer_name)
+        
+        # Get LLM response
+        try:
+            response = self.call_llm_api(messages)
+            self.conversation_state.add_message("assistant", response)
+            return response
+        except Exception as e:
+            error_response = self._error_response(e)
+            self.conversation_state.add_message("assistant", error_response)
+            return error_response
+
+    async def aprocess_message(self, user_message: str, customer_name: str) -> str:
+        """
+        Async process_message for serving many conversations from one event
+        loop. Cancelling the awaiting task abandons the LLM request.
+        """
+        messages = self._prepare_messages(user_message, customer_name)
+        
+        try:
+            response = await self.acall_llm_api(messages)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            response = self._error_response(e)
+        self.conversation_state.add_message("assistant", response)
+        return response
+
+    def stream_message(self, user_message: str, customer_name: str) -> Iterator[str]:
+        """
+        Like process_message, but yields the response in pieces as the LLM
+        generates it. The full response joins the history once the stream ends.
+        """
+        messages = self._prepare_messages(user_message, customer_name)
+        
+        chunks = []
+        try:
+            for chunk in self.stream_llm_api(messages):
+                chunks.append(chunk)
+                yield chunk
+        except Exception as e:
+            error_response = self._error_response(e)
+            chunks.append(error_response)
+            yield error_response
+        finally:
+            # Also runs if the caller stops reading early, keeping what was shown
+            self.conversation_state.add_message("assistant", "".join(chunks))
+
+    def _prepare_messages(self, user_message: str, customer_name: str) -> List[Dict[str, str]]:
+        """Record the user message and build the messages to send to the LLM."""
         # Check for stale context
         if self.conversation_state.is_context_stale():
             self.conversation_state.reset_context()
@@ -26,61 +79,103 @@ class LLMManager:
         self.conversation_state.add_message("user", user_message)
         
         # Build context-aware prompt
-        context_summary = self.conversation_state.summarize_context()
         memory_prompt = self.prompt_templates.build_memory_prompt(
             message=user_message,
             conversation_state=self.conversation_state,
             customer_name=customer_name
         )
         
-        # Prepare messages for LLM
-        messages = [
+        return [
             {"role": "system", "content": self.prompt_templates.SYSTEM_PROMPT},
             {"role": "system", "content": memory_prompt},
             {"role": "user", "content": user_message}
         ]
-        
-        # Get LLM response
-        try:
-            response = self.call_llm_api(messages)
-            self.conversation_state.add_message("assistant", response)
-            return response
-        except Exception as e:
-            error_response = self.prompt_templates.ERROR_RESPONSE.format(
-                error_type=type(e).__name__,
-                recovery_suggestion="Let's start over with your request."
-            )
-            self.conversation_state.add_message("assistant", error_response)
-            return error_response
+
+    def _error_response(self, error: Exception) -> str:
+        return self.prompt_templates.ERROR_RESPONSE.format(
+            error_type=type(error).__name__,
+            recovery_suggestion="Let's start over with your request."
+        )
 
     def call_llm_api(self, messages: List[Dict[str, str]]) -> str:
         """Call the LLM API with messages."""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+            response = post_with_retries(
+                self.api_url,
+                headers=self._headers(),
+                json=self._request_body(messages)
+            )
             
-            data = {
-                "model": self.model,
-                "messages": messages,
-                "temperature": 0.7,
-                "max_tokens": 1000
-            }
+            response.raise_for_status()
+            return response.json()["choices"][0]["message"]["content"]
             
-            response = requests.post(
+        except requests.exceptions.RequestException as e:
+            print(f"Error calling LLM API: {e}")
+            return "I apologize, but I'm having trouble processing your request right now."
+
+    async def acall_llm_api(self, messages: List[Dict[str, str]]) -> str:
+        """Async call_llm_api on the event loop's shared client."""
+        try:
+            response = await get_async_client().post(
                 self.api_url,
-                headers=headers,
-                json=data
+                headers=self._headers(),
+                json=self._request_body(messages)
             )
             
             response.raise_for_status()
             return response.json()["choices"][0]["message"]["content"]
             
-        except requests.exceptions.RequestException as e:
+        except AsyncHTTPError as e:
             print(f"Error calling LLM API: {e}")
             return "I apologize, but I'm having trouble processing your request right now."
 
+    def stream_llm_api(self, messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Call the LLM API with stream enabled, yielding content as it arrives."""
+        try:
+            response = post_with_retries(
+                self.api_url,
+                headers=self._headers(),
+                json=self._request_body(messages, stream=True),
+                stream=True
+            )
+        except requests.exceptions.RequestException as e:
+            print(f"Error calling LLM API: {e}")
+            yield "I apologize, but I'm having trouble processing your request right now."
+            return
+
+        with response:
+            try:
+                response.raise_for_status()
+                # Event streams are always UTF-8, whatever the headers say
+                response.encoding = "utf-8"
+                for data in iter_sse_data(response.iter_lines(decode_unicode=True)):
+                    if data == "[DONE]":
+                        break
+                    choices = json.loads(data).get("choices") or [{}]
+                    content = choices[0].get("delta", {}).get("content")
+                    if content:
+                        yield content
+            except requests.exceptions.RequestException as e:
+                print(f"Error calling LLM API: {e}")
+                yield "I apologize, but I'm having trouble processing your request right now."
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+
+    def _request_body(self, messages: List[Dict[str, str]], stream: bool = False) -> Dict[str, Any]:
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": 1000
+        }
+        if stream:
+            data["stream"] = True
+        return data
+
     def parse_tool_call(self, response: str) -> Optional[Dict[str, Any]]:
         """Parse tool calling format from LLM response."""
         try:
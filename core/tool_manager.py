@@ -1,22 +1,46 @@
 from typing import Any, Dict, List, Optional
 from models.restaurant import Restaurant
 from models.reservation import Reservation
-from tools.search import search_restaurants
-from tools.availability import check_availability
+from tools.search import (
+    search_restaurants,
+    search_restaurants_page,
+    search_restaurants_by_description,
+    find_restaurants_by_name
+)
+from tools.availability import check_availability, check_availability_many
+from tools.alternatives import find_alternatives
+from tools.planner import find_tables
+from tools.holds import hold_slot, confirm_hold, release_hold
+from tools.waitlist import join_waitlist, leave_waitlist
 from tools.reservation import (
     make_reservation,
+    make_reservations_batch,
     modify_reservation,
-    cancel_reservation
+    cancel_reservation,
+    list_customer_reservations
 )
 
 class ToolManager:
     def __init__(self):
         self.tools = {
             "search_restaurants": search_restaurants,
+            "search_restaurants_page": search_restaurants_page,
+            "search_restaurants_by_description": search_restaurants_by_description,
+            "find_restaurants_by_name": find_restaurants_by_name,
             "check_availability": check_availability,
+            "check_availability_many": check_availability_many,
+            "find_alternatives": find_alternatives,
+            "find_tables": find_tables,
             "make_reservation": make_reservation,
+            "make_reservations_batch": make_reservations_batch,
             "modify_reservation": modify_reservation,
-            "cancel_reservation": cancel_reservation
+            "cancel_reservation": cancel_reservation,
+            "list_customer_reservations": list_customer_reservations,
+            "hold_slot": hold_slot,
+            "confirm_hold": confirm_hold,
+            "release_hold": release_hold,
+            "join_waitlist": join_waitlist,
+            "leave_waitlist": leave_waitlist
         }
     
     def execute_tool(self, tool_name: str, parameters: Dict) -> Any:
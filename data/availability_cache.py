@@ -0,0 +1,93 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from models.reservation import Reservation
+
+
+class AvailabilityCache:
+    """
+    Bounded LRU cache of availability answers.
+
+    Keys are tuples starting with (restaurant_id, date) and each entry remembers
+    the restaurant object it was computed for, so a catalog reload misses
+    instead of serving answers for old tables or hours. Writes drop only the
+    entries for the (restaurant_id, date) they touch, through ``apply``. An
+    answer computed while a write landed is not stored, since it may predate it.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+        # (restaurant_id, date) -> keys cached for that day
+        self._by_day: Dict[Tuple[str, str], Dict[Hashable, None]] = {}
+        self._generation = 0
+
+    def get(self, key: Tuple, restaurant: object) -> Tuple[Optional[List[str]], int]:
+        """
+        Look up a cached answer. Returns it (or None on a miss) together with a
+        generation to pass to ``put`` once the answer has been computed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is restaurant:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return list(entry[1]), self._generation
+            self.misses += 1
+            return None, self._generation
+
+    def put(self, key: Tuple, restaurant: object, value: List[str], generation: int):
+        """Store an answer unless a write has invalidated anything since ``generation``."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (restaurant, list(value))
+            self._entries.move_to_end(key)
+            self._by_day.setdefault(key[:2], {})[key] = None
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                day = self._by_day.get(evicted[:2])
+                if day is not None:
+                    day.pop(evicted, None)
+                    if not day:
+                        del self._by_day[evicted[:2]]
+
+    def invalidate(self, restaurant_id: str, date: str):
+        """Drop every answer for a restaurant on a date."""
+        with self._lock:
+            self._generation += 1
+            for key in self._by_day.pop((restaurant_id, date), {}):
+                self._entries.pop(key, None)
+
+    def apply(self, old: Optional[Reservation], new: Optional[Reservation]):
+        """Reservation listener: invalidate the days a write moved a booking from and to."""
+        for reservation in (old, new):
+            if reservation is not None:
+                self.invalidate(reservation.restaurant_id, reservation.date)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counts and current size, for sizing ``max_entries``."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries
+            }
+
+    def invalidate_all(self):
+        """Drop every answer, keeping the counters."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._by_day.clear()
+
+    def clear(self):
+        self.invalidate_all()
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,50 @@
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from models.restaurant import Restaurant
+
+
+class RestaurantCatalog:
+    """
+    Parsed restaurants cached until their source changes.
+
+    ``load`` builds the restaurant list and ``signature`` returns a cheap token
+    describing the source (file mtime and size, or a database counter). The list
+    is rebuilt only when the token changes or ``invalidate()`` is called, and is
+    shared between callers, so treat the returned objects as read-only.
+    ``version`` increases on every rebuild and can key structures derived from
+    the catalog.
+    """
+
+    def __init__(self, load: Callable[[], List[Restaurant]], signature: Callable[[], Hashable]):
+        self._load = load
+        self._signature = signature
+        self._lock = threading.Lock()
+        self._current_signature = None
+        self._restaurants: Optional[List[Restaurant]] = None
+        self._by_id: Dict[str, Restaurant] = {}
+        self.version = 0
+
+    def _refresh(self) -> Tuple[List[Restaurant], Dict[str, Restaurant]]:
+        signature = self._signature()
+        with self._lock:
+            if self._restaurants is None or signature != self._current_signature:
+                restaurants = self._load()
+                self._restaurants = restaurants
+                self._by_id = {r.id: r for r in restaurants}
+                self._current_signature = signature
+                self.version += 1
+            return self._restaurants, self._by_id
+
+    def restaurants(self) -> List[Restaurant]:
+        """Get every restaurant, reloading first if the source changed."""
+        return self._refresh()[0]
+
+    def get(self, restaurant_id: str) -> Optional[Restaurant]:
+        """Get a restaurant by id."""
+        return self._refresh()[1].get(restaurant_id)
+
+    def invalidate(self):
+        """Force a reload on next access."""
+        with self._lock:
+            self._restaurants = None
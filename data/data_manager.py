@@ -1,13 +1,148 @@
 
 import json
 import os
-from typing import List
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from app.config import Config
 from models.restaurant import Restaurant, Table
 from models.reservation import Reservation
+from data.catalog import RestaurantCatalog
+from data.file_lock import FileLock
+from data.reservation_store import ReservationStore
+from data.sqlite_store import SQLiteStore
+from data.unit_of_work import UnitOfWork
+from utils.id_generator import MAX_WORKER_ID, IdGenerator, default_worker_id
 
 DATA_DIR = os.path.join(os.path.dirname(__file__))
 RESTAURANTS_FILE = os.path.join(DATA_DIR, 'restaurants.json')
 RESERVATIONS_FILE = os.path.join(DATA_DIR, 'reservations.json')
+SQLITE_FILE = Config.SQLITE_PATH or os.path.join(DATA_DIR, 'foodiespot.db')
+
+def create_reservation_store():
+    """Create the reservation store for the configured storage backend."""
+    if Config.STORAGE_BACKEND == "sqlite":
+        return SQLiteStore(SQLITE_FILE)
+    if Config.STORAGE_BACKEND == "json":
+        # Loaded lazily on first access, then kept in memory with its indexes
+        return ReservationStore(
+            RESERVATIONS_FILE,
+            journal=Config.RESERVATION_JOURNAL,
+            compact_threshold=Config.JOURNAL_COMPACT_THRESHOLD
+        )
+    raise ValueError(f"Unknown storage backend: {Config.STORAGE_BACKEND}")
+
+reservation_store = create_reservation_store()
+
+def store_directory() -> str:
+    """Directory of the reservation store, for shared files that sit beside it."""
+    path = getattr(reservation_store, 'filepath', None) or reservation_store.db_path
+    return os.path.dirname(os.path.abspath(path))
+
+# Sortable, collision-free reservation ids; created on first use, once the
+# worker id is known
+_reservation_ids: Optional[IdGenerator] = None
+_reservation_ids_lock = threading.Lock()
+_worker_lease: Optional[FileLock] = None
+
+def lease_worker_id(directory: str, preferred: int) -> Tuple[int, FileLock]:
+    """
+    Claim a worker id no other live process on this host holds, starting
+    from preferred. Each id is a lock file in directory, held for the life of
+    the returned lock; the OS releases it when the process exits.
+    """
+    for offset in range(MAX_WORKER_ID + 1):
+        worker_id = (preferred + offset) & MAX_WORKER_ID
+        lease = FileLock(os.path.join(directory, 'workers', f'{worker_id}.lock'))
+        if lease.acquire(blocking=False):
+            return worker_id, lease
+    raise RuntimeError("Every worker id is leased; set WORKER_ID explicitly")
+
+def _worker_id() -> int:
+    global _worker_lease
+    if Config.WORKER_ID:
+        return default_worker_id(Config.WORKER_ID)
+    worker_id, _worker_lease = lease_worker_id(store_directory(), default_worker_id())
+    return worker_id
+
+def _reset_ids_after_fork():
+    # A forked child would otherwise share its parent's worker id and clock
+    # state; the lease it inherited still belongs to the parent
+    global _reservation_ids, _worker_lease
+    _reservation_ids = None
+    _worker_lease = None
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ids_after_fork)
+
+def new_reservation_id() -> str:
+    """Issue a unique, time-ordered reservation id."""
+    global _reservation_ids
+    if _reservation_ids is None:
+        with _reservation_ids_lock:
+            if _reservation_ids is None:
+                _reservation_ids = IdGenerator(_worker_id(), prefix="res_")
+    return _reservation_ids.next_id()
+
+# Called as listener(old, new) after every reservation write
+ReservationListener = Callable[[Optional[Reservation], Optional[Reservation]], None]
+_reservation_listeners: List[ReservationListener] = []
+
+def add_reservation_listener(listener: ReservationListener):
+    """Register a callback that keeps derived state in step with reservation writes."""
+    _reservation_listeners.append(listener)
+
+def _notify_reservation_listeners(old: Optional[Reservation], new: Optional[Reservation]):
+    for listener in _reservation_listeners:
+        listener(old, new)
+
+# Called when another process changed reservations, so derived state must be rebuilt
+_reload_listeners: List[Callable[[], None]] = []
+
+def add_reload_listener(listener: Callable[[], None]):
+    """Register a callback that drops derived state when the store reloads."""
+    _reload_listeners.append(listener)
+
+# One transaction at a time per process; its staged writes are visible to readers
+_transaction_lock = threading.RLock()
+_active_transaction: Optional[UnitOfWork] = None
+
+@contextmanager
+def transaction() -> Iterator[UnitOfWork]:
+    """
+    Run a read-check-write sequence as one unit of work.
+
+    Holds the store's cross-process write lock (a lock file, or an IMMEDIATE
+    SQLite transaction) for the whole block, so no other session can book the
+    same table between the availability check and the write. Writes made
+    through the yielded UnitOfWork, or through save_reservation and
+    update_reservation inside the block, are persisted with a single write when
+    the block exits and rolled back if it raises. Nested calls join the
+    enclosing transaction.
+    """
+    global _active_transaction
+    with _transaction_lock:
+        if _active_transaction is not None:
+            yield _active_transaction
+            return
+        with reservation_store.transaction() as changed:
+            if changed:
+                for listener in _reload_listeners:
+                    listener()
+            uow = UnitOfWork(reservation_store, _notify_reservation_listeners)
+            _active_transaction = uow
+            try:
+                yield uow
+                uow.commit()
+            except BaseException:
+                uow.rollback()
+                raise
+            finally:
+                _active_transaction = None
+
+def _reservations():
+    """The open transaction, so reads see its staged writes, or else the store."""
+    return _active_transaction or reservation_store
 
 def load_json(filepath: str) -> List[dict]:
     """Load data from JSON file."""
@@ -22,9 +157,25 @@ def save_json(filepath: str, data: List[dict]):
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=2)
 
-def get_restaurants() -> List[Restaurant]:
-    """Get list of restaurants."""
-    data = load_json(RESTAURANTS_FILE)
+def load_restaurant_records() -> List[dict]:
+    """Load raw restaurant records from the configured backend."""
+    if isinstance(reservation_store, SQLiteStore):
+        return reservation_store.restaurant_records()
+    return load_json(RESTAURANTS_FILE)
+
+def restaurants_signature():
+    """Cheap token that changes whenever the restaurant data changes."""
+    if isinstance(reservation_store, SQLiteStore):
+        return reservation_store.catalog_version()
+    try:
+        stat = os.stat(RESTAURANTS_FILE)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def build_restaurants() -> List[Restaurant]:
+    """Parse every restaurant record into Restaurant objects."""
+    data = load_restaurant_records()
     return [
         Restaurant(
             id=r['id'],
@@ -36,27 +187,60 @@ def get_restaurants() -> List[Restaurant]:
             tables=[Table(**t) for t in r['tables']],
             operating_hours=r['operating_hours'],
             rating=r['rating'],
-            description=r['description']
+            description=r['description'],
+            turn_times=r.get('turn_times', {})
         )
         for r in data
     ]
 
+restaurant_catalog = RestaurantCatalog(build_restaurants, restaurants_signature)
+
+def get_restaurants() -> List[Restaurant]:
+    """Get list of restaurants. The list is cached and shared; do not mutate it."""
+    return restaurant_catalog.restaurants()
+
+def get_restaurant(restaurant_id: str) -> Optional[Restaurant]:
+    """Get a single restaurant by id."""
+    return restaurant_catalog.get(restaurant_id)
+
+def invalidate_restaurants():
+    """Drop the cached catalog so the next lookup reloads it."""
+    restaurant_catalog.invalidate()
+
 def get_reservations() -> List[Reservation]:
     """Get list of reservations."""
-    data = load_json(RESERVATIONS_FILE)
-    return [Reservation(**r) for r in data]
+    return _reservations().all()
+
+def get_reservation(reservation_id: str) -> Optional[Reservation]:
+    """Get a single reservation by id."""
+    return _reservations().get(reservation_id)
+
+def get_restaurant_reservations(
+    restaurant_id: str,
+    date: str,
+    status: Optional[str] = None
+) -> List[Reservation]:
+    """Get reservations for a restaurant on a given date."""
+    return _reservations().for_restaurant(restaurant_id, date, status)
+
+def get_reservations_by_restaurant_date(
+    restaurant_ids: Iterable[str],
+    dates: Iterable[str],
+    status: Optional[str] = None
+) -> Dict[Tuple[str, str], List[Reservation]]:
+    """Get reservations for several restaurants and dates at once, keyed by (restaurant_id, date)."""
+    return _reservations().for_restaurants(restaurant_ids, dates, status)
+
+def get_customer_reservations(customer_id: str, status: Optional[str] = None) -> List[Reservation]:
+    """Get reservations made by a customer, ordered by date and time."""
+    return _reservations().for_customer(customer_id, status)
 
 def save_reservation(reservation: Reservation):
     """Save a new reservation."""
-    reservations = get_reservations()
-    reservations.append(reservation)
-    save_json(RESERVATIONS_FILE, [r.to_dict() for r in reservations])
+    with transaction() as uow:
+        uow.add(reservation)
 
 def update_reservation(updated_reservation: Reservation):
     """Update an existing reservation."""
-    reservations = get_reservations()
-    reservations = [
-        updated_reservation if r.id == updated_reservation.id else r
-        for r in reservations
-    ]
-    save_json(RESERVATIONS_FILE, [r.to_dict() for r in reservations])
\ No newline at end of file
+    with transaction() as uow:
+        uow.update(updated_reservation)
@@ -0,0 +1,95 @@
+import threading
+import time
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.hold import Hold
+from models.reservation import Reservation
+from utils.timer_wheel import TimerWheel
+
+
+class HoldRegistry:
+    """
+    Tentative holds on tables, kept in memory until confirmed, released or
+    expired.
+
+    Expiry runs on a TimerWheel advanced lazily by ``expire()``, which the
+    availability code calls before it reads, so lapsed holds are dropped in
+    O(1) each without scanning. ``on_change(old, new)`` is called outside the
+    registry lock whenever a hold appears or disappears, with holds converted
+    to "held" reservations, so availability structures can follow along.
+    Holds are per process; they are not persisted.
+    """
+
+    def __init__(
+        self,
+        on_change: Callable[[Optional[Reservation], Optional[Reservation]], None],
+        clock: Callable[[], float] = time.time,
+        tick_seconds: float = 1.0
+    ):
+        self._on_change = on_change
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._wheel = TimerWheel(tick_seconds=tick_seconds, clock=clock)
+        self._holds: Dict[str, Hold] = {}
+        self._by_day: Dict[Tuple[str, str], Dict[str, None]] = {}
+
+    def place(self, hold: Hold):
+        """Start holding tables until ``hold.expires_at``."""
+        hold = replace(hold, table_ids=list(hold.table_ids))
+        with self._lock:
+            if hold.id in self._holds:
+                raise ValueError(f"Hold {hold.id} already exists")
+            self._holds[hold.id] = hold
+            self._by_day.setdefault((hold.restaurant_id, hold.date), {})[hold.id] = None
+            self._wheel.schedule(hold.id, hold.expires_at)
+        self._on_change(None, hold.as_reservation())
+
+    def get(self, hold_id: str) -> Optional[Hold]:
+        """Get a live hold by id."""
+        self.expire()
+        with self._lock:
+            hold = self._holds.get(hold_id)
+            return replace(hold, table_ids=list(hold.table_ids)) if hold else None
+
+    def release(self, hold_id: str) -> Optional[Hold]:
+        """Drop a hold and return it, or None if it is unknown or already lapsed."""
+        with self._lock:
+            hold = self._drop(hold_id)
+            if hold is not None:
+                self._wheel.cancel(hold_id)
+        if hold is not None:
+            self._on_change(hold.as_reservation(), None)
+        return hold
+
+    def expire(self) -> List[Hold]:
+        """Drop holds whose time is up and return them."""
+        with self._lock:
+            expired = [self._drop(hold_id) for hold_id in self._wheel.advance()]
+        expired = [hold for hold in expired if hold is not None]
+        for hold in expired:
+            self._on_change(hold.as_reservation(), None)
+        return expired
+
+    def for_day(self, restaurant_id: str, date: str) -> List[Reservation]:
+        """Live holds for a restaurant on a date, as "held" reservations."""
+        with self._lock:
+            ids = self._by_day.get((restaurant_id, date), {})
+            return [self._holds[hold_id].as_reservation() for hold_id in ids]
+
+    def clear(self):
+        with self._lock:
+            for hold_id in list(self._holds):
+                self._wheel.cancel(hold_id)
+            self._holds.clear()
+            self._by_day.clear()
+
+    def _drop(self, hold_id: str) -> Optional[Hold]:
+        hold = self._holds.pop(hold_id, None)
+        if hold is not None:
+            key = (hold.restaurant_id, hold.date)
+            ids = self._by_day[key]
+            ids.pop(hold_id, None)
+            if not ids:
+                del self._by_day[key]
+        return hold
@@ -0,0 +1,42 @@
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.data_manager import load_json, RESTAURANTS_FILE, RESERVATIONS_FILE, SQLITE_FILE
+from data.reservation_store import ReservationStore
+from data.sqlite_store import SQLiteStore
+
+
+def migrate_json_to_sqlite(
+    db_path: str = SQLITE_FILE,
+    restaurants_file: str = RESTAURANTS_FILE,
+    reservations_file: str = RESERVATIONS_FILE
+) -> tuple[int, int]:
+    """
+    Copy restaurants and reservations from the JSON files into SQLite.
+
+    Reservations are read through ReservationStore so any journal is replayed
+    first. Rows are inserted or replaced by id, so running it twice is safe.
+    Returns the number of restaurants and reservations copied.
+    """
+    restaurants = load_json(restaurants_file)
+    reservations = ReservationStore(reservations_file, journal=True).all()
+
+    store = SQLiteStore(db_path)
+    try:
+        store.save_restaurants(restaurants)
+        store.import_reservations(reservations)
+    finally:
+        store.close()
+    return len(restaurants), len(reservations)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate FoodieSpot JSON data to SQLite.")
+    parser.add_argument("--db", default=SQLITE_FILE, help="SQLite database to create or update")
+    args = parser.parse_args()
+
+    restaurant_count, reservation_count = migrate_json_to_sqlite(args.db)
+    print(f"Migrated {restaurant_count} restaurants and {reservation_count} reservations to {args.db}")
@@ -0,0 +1,375 @@
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from models.reservation import Reservation
+from models.restaurant import Restaurant
+from utils.time_utils import time_to_minutes
+
+# Reservation statuses that keep a table; "held" marks a tentative hold
+OCCUPYING_STATUSES = ("confirmed", "held")
+
+
+class TableSchedule:
+    """
+    Booked [start, end) intervals on one table, in minutes since midnight.
+
+    Intervals are kept sorted by start alongside a running maximum of their
+    ends, so whether a window is free is a single binary search: the window
+    [s, e) overlaps a booking only if some interval starting before ``e`` ends
+    after ``s``.
+    """
+
+    def __init__(self):
+        self.starts = np.empty(0, dtype=np.int32)
+        self.ends = np.empty(0, dtype=np.int32)
+        self.reach = np.empty(0, dtype=np.int32)
+        self.ids: List[str] = []
+
+    def add(self, start: int, end: int, reservation_id: str):
+        i = int(np.searchsorted(self.starts, start, side='right'))
+        self.starts = np.insert(self.starts, i, start)
+        self.ends = np.insert(self.ends, i, end)
+        self.reach = np.maximum.accumulate(self.ends)
+        self.ids.insert(i, reservation_id)
+
+    def remove(self, reservation_id: str):
+        i = self.ids.index(reservation_id)
+        self.starts = np.delete(self.starts, i)
+        self.ends = np.delete(self.ends, i)
+        self.reach = np.maximum.accumulate(self.ends) if self.ends.size else self.ends
+        del self.ids[i]
+
+    def without(self, reservation_id: str) -> 'TableSchedule':
+        """Copy of this schedule with one reservation left out."""
+        schedule = TableSchedule()
+        schedule.starts, schedule.ends = self.starts, self.ends
+        schedule.reach, schedule.ids = self.reach, list(self.ids)
+        schedule.remove(reservation_id)
+        return schedule
+
+    def is_free(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """For each [start, end) window, whether it overlaps no booking."""
+        if not self.ids:
+            return np.ones(len(starts), dtype=bool)
+        before_end = np.searchsorted(self.starts, ends, side='left')
+        latest_end = self.reach[np.maximum(before_end - 1, 0)]
+        return (before_end == 0) | (latest_end <= starts)
+
+
+class DayOccupancy:
+    """
+    Table assignments for one restaurant on one day.
+
+    Every confirmed reservation holds one table, or a run of adjacent tables
+    (neighbours in the restaurant's table list) for parties no single table
+    fits, from its start time until its turn time has elapsed. New parties get
+    the smallest table that is free for their whole stay, falling back to the
+    smallest adjacent combination. Availability is read from the per-table
+    schedules for all candidate times at once.
+    """
+
+    def __init__(self, restaurant: Restaurant, default_turn_time: int, combine_limit: int = 3):
+        tables = restaurant.tables
+        self.restaurant_key = _restaurant_key(restaurant)
+        self.default_turn_time = default_turn_time
+        # turn_times maps the smallest party size a duration applies to -> minutes
+        turn_times = sorted((int(size), minutes) for size, minutes in restaurant.turn_times.items())
+        self._turn_sizes = [size for size, _ in turn_times]
+        self._turn_minutes = [minutes for _, minutes in turn_times]
+        self.table_ids = [t.id for t in tables]
+        self.seats = np.array([t.seats for t in tables], dtype=np.int32)
+        self.schedules = [TableSchedule() for _ in tables]
+        self.combinations = _adjacent_combinations(self.seats, combine_limit)
+        self.max_party_size = max(
+            [int(self.seats.max(initial=0))] + [total for _, total in self.combinations]
+        )
+        # reservation id -> indexes of the tables it holds
+        self._assignments: Dict[str, Tuple[int, ...]] = {}
+
+    def turn_time(self, party_size: int) -> int:
+        """Minutes a party of this size keeps its tables."""
+        i = bisect_right(self._turn_sizes, party_size) - 1
+        return self._turn_minutes[i] if i >= 0 else self.default_turn_time
+
+    def _free_matrix(
+        self,
+        starts: Sequence[int],
+        party_size: int,
+        ignore: Optional[str]
+    ) -> np.ndarray:
+        starts = np.asarray(starts, dtype=np.int32)
+        ends = starts + self.turn_time(party_size)
+        held = self._assignments.get(ignore, ())
+        columns = [
+            (schedule.without(ignore) if i in held else schedule).is_free(starts, ends)
+            for i, schedule in enumerate(self.schedules)
+        ]
+        if not columns:
+            return np.zeros((len(starts), 0), dtype=bool)
+        return np.column_stack(columns)
+
+    def can_seat(
+        self,
+        starts: Sequence[int],
+        party_size: int,
+        ignore: Optional[str] = None
+    ) -> np.ndarray:
+        """For each start minute, whether a free table or adjacent combination seats the party."""
+        free = self._free_matrix(starts, party_size, ignore)
+        ok = (free & (self.seats >= party_size)).any(axis=1)
+        for indexes, total in self.combinations:
+            if total >= party_size:
+                ok |= free[:, indexes].all(axis=1)
+        return ok
+
+    def allocate(
+        self,
+        start: int,
+        party_size: int,
+        ignore: Optional[str] = None
+    ) -> Optional[List[str]]:
+        """Pick tables for a party arriving at minute ``start``, or None if nothing fits."""
+        indexes = self._allocate_indexes(start, party_size, ignore)
+        return [self.table_ids[i] for i in indexes] if indexes is not None else None
+
+    def tables_free(
+        self,
+        table_ids: List[str],
+        start: int,
+        party_size: int,
+        ignore: Optional[str] = None
+    ) -> bool:
+        """Whether every one of the given tables is free for a party arriving at minute ``start``."""
+        indexes = self._indexes_of(table_ids)
+        if indexes is None:
+            return False
+        return bool(self._free_matrix([start], party_size, ignore)[0][list(indexes)].all())
+
+    def _allocate_indexes(
+        self,
+        start: int,
+        party_size: int,
+        ignore: Optional[str] = None
+    ) -> Optional[Tuple[int, ...]]:
+        free = self._free_matrix([start], party_size, ignore)[0]
+        fitting = np.flatnonzero(free & (self.seats >= party_size))
+        if fitting.size:
+            # argmin returns the first of equal sizes, keeping table order as tie-break
+            return (int(fitting[np.argmin(self.seats[fitting])]),)
+        # Combinations are sorted smallest first, so the first fit is the best fit
+        for indexes, total in self.combinations:
+            if total >= party_size and free[indexes].all():
+                return tuple(int(i) for i in indexes)
+        return None
+
+    def add(self, reservation: Reservation):
+        """Record a reservation on its assigned tables, assigning some if it has none."""
+        self.remove(reservation.id)
+        start = time_to_minutes(reservation.time)
+        indexes = self._indexes_of(reservation.table_ids)
+        if indexes is None:
+            indexes = self._allocate_indexes(start, reservation.party_size)
+        if indexes is None:
+            # Booked before tables were tracked and overbooked since; park it on the
+            # table that fits it most closely so the conflict stays visible.
+            indexes = (self._closest_table(reservation.party_size),)
+
+        end = start + self.turn_time(reservation.party_size)
+        for i in indexes:
+            self.schedules[i].add(start, end, reservation.id)
+        self._assignments[reservation.id] = indexes
+
+    def remove(self, reservation_id: str):
+        for i in self._assignments.pop(reservation_id, ()):
+            self.schedules[i].remove(reservation_id)
+
+    def _indexes_of(self, table_ids: List[str]) -> Optional[Tuple[int, ...]]:
+        if not table_ids or any(t not in self.table_ids for t in table_ids):
+            return None
+        return tuple(self.table_ids.index(t) for t in table_ids)
+
+    def _closest_table(self, party_size: int) -> int:
+        fitting = np.flatnonzero(self.seats >= party_size)
+        if fitting.size:
+            return int(fitting[np.argmin(self.seats[fitting])])
+        return int(np.argmax(self.seats))
+
+
+class OccupancyIndex:
+    """
+    Lazily built DayOccupancy structures keyed by (restaurant_id, date).
+
+    They are kept up to date through ``apply``, which the data layer calls after
+    every reservation write, and the least recently used days are evicted once
+    ``max_days`` are held. A day built while a write landed is returned but not
+    kept, since the reservations it was built from may predate the write.
+    """
+
+    def __init__(self, default_turn_time: int, combine_limit: int = 3, max_days: int = 1024):
+        self.default_turn_time = default_turn_time
+        self.combine_limit = combine_limit
+        self.max_days = max_days
+        self._lock = threading.Lock()
+        self._days: OrderedDict = OrderedDict()
+        # Bumped by every write, so a day built from an older fetch is not kept
+        self._generation = 0
+
+    def get(
+        self,
+        restaurant: Restaurant,
+        date: str,
+        load_reservations: Callable[[], List[Reservation]]
+    ) -> DayOccupancy:
+        """Get the occupancy for a restaurant and date, building it on first use."""
+        return self.get_many(
+            [(restaurant, date)],
+            lambda keys: {(restaurant.id, date): load_reservations()}
+        )[0]
+
+    def get_many(
+        self,
+        pairs: Sequence[Tuple[Restaurant, str]],
+        load_reservations: Callable[[List[Tuple[str, str]]], Dict[Tuple[str, str], List[Reservation]]]
+    ) -> List[DayOccupancy]:
+        """
+        Get the occupancy for each (restaurant, date) pair. Reservations for all
+        pairs not yet held are fetched with a single call, keyed by
+        (restaurant_id, date). The fetch runs outside the index lock, since it
+        may wait on the store's file lock, which writers take before this one.
+        """
+        with self._lock:
+            days: List[Optional[DayOccupancy]] = []
+            missing = []
+            for restaurant, date in pairs:
+                key = (restaurant.id, date)
+                day = self._days.get(key)
+                if day is not None and day.restaurant_key == _restaurant_key(restaurant):
+                    self._days.move_to_end(key)
+                else:
+                    day = None
+                    missing.append(key)
+                days.append(day)
+            if not missing:
+                return days
+            generation = self._generation
+
+        loaded = load_reservations(missing)
+
+        with self._lock:
+            # A write since the fetch may be missing from it, so keep nothing new
+            keep = generation == self._generation
+            for i, (restaurant, date) in enumerate(pairs):
+                if days[i] is not None:
+                    continue
+                key = (restaurant.id, date)
+                day = self._days.get(key)
+                if day is None or day.restaurant_key != _restaurant_key(restaurant):
+                    day = DayOccupancy(restaurant, self.default_turn_time, self.combine_limit)
+                    for reservation in loaded.get(key, []):
+                        if reservation.status in OCCUPYING_STATUSES:
+                            day.add(reservation)
+                    if keep:
+                        self._days[key] = day
+                days[i] = day
+
+            while len(self._days) > self.max_days:
+                self._days.popitem(last=False)
+            return days
+
+    def apply(self, old: Optional[Reservation], new: Optional[Reservation]):
+        """Move a reservation from its old placement to its new one."""
+        with self._lock:
+            self._generation += 1
+            if old is not None:
+                day = self._days.get((old.restaurant_id, old.date))
+                if day is not None:
+                    day.remove(old.id)
+            if new is not None and new.status in OCCUPYING_STATUSES:
+                day = self._days.get((new.restaurant_id, new.date))
+                if day is not None:
+                    day.add(new)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._days.clear()
+
+
+# Width of each (day, table) lane in can_seat_many; larger than any booking end
+_LANE_MINUTES = 4 * 24 * 60
+
+def can_seat_many(days: Sequence[DayOccupancy], starts: Sequence[int], party_size: int) -> np.ndarray:
+    """
+    Whether each day can seat the party at each start minute, in one pass.
+
+    Every (day, table) schedule is laid end to end on a single axis by shifting
+    its minutes into its own lane, so one searchsorted over the concatenation
+    answers every (day, table, start) probe. Adjacent-table combinations are
+    then reduced from the same free matrix. Returns a days x starts array.
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    result = np.zeros((len(days), len(starts)), dtype=bool)
+    schedules = [schedule for day in days for schedule in day.schedules]
+    if not schedules or not len(starts):
+        return result
+
+    tables_per_day = np.array([len(day.schedules) for day in days])
+    first_row = np.concatenate([[0], np.cumsum(tables_per_day)[:-1]])
+    row_day = np.repeat(np.arange(len(days)), tables_per_day)
+    lanes = np.arange(len(schedules), dtype=np.int64) * _LANE_MINUTES
+    counts = np.array([len(s.ids) for s in schedules])
+
+    # Lanes increase monotonically, so a running max over the shifted ends never
+    # carries one table's bookings into the next table's lane.
+    booked_starts = np.concatenate([s.starts for s in schedules]).astype(np.int64) + np.repeat(lanes, counts)
+    booked_reach = np.maximum.accumulate(
+        np.concatenate([s.ends for s in schedules]).astype(np.int64) + np.repeat(lanes, counts)
+    ) if counts.sum() else booked_starts
+
+    turn_times = np.array([day.turn_time(party_size) for day in days], dtype=np.int64)
+    window_starts = lanes[:, None] + starts[None, :]
+    window_ends = window_starts + turn_times[row_day][:, None]
+    if booked_starts.size:
+        before_end = np.searchsorted(booked_starts, window_ends, side='left')
+        latest_end = booked_reach[np.maximum(before_end - 1, 0)]
+        free = (before_end == 0) | (latest_end <= window_starts)
+    else:
+        free = np.ones(window_starts.shape, dtype=bool)
+
+    seats = np.concatenate([day.seats for day in days])
+    np.logical_or.at(result, row_day, free & (seats >= party_size)[:, None])
+
+    combos = [
+        (d, first_row[d] + indexes)
+        for d, day in enumerate(days)
+        for indexes, total in day.combinations
+        if total >= party_size
+    ]
+    if combos:
+        members = np.concatenate([rows for _, rows in combos])
+        offsets = np.concatenate([[0], np.cumsum([len(rows) for _, rows in combos])[:-1]])
+        combo_free = np.logical_and.reduceat(free[members], offsets, axis=0)
+        np.logical_or.at(result, np.array([d for d, _ in combos]), combo_free)
+
+    return result
+
+def _restaurant_key(restaurant: Restaurant) -> tuple:
+    """What a DayOccupancy depends on; a change means it must be rebuilt."""
+    return (
+        tuple((t.id, t.seats) for t in restaurant.tables),
+        tuple(sorted(restaurant.turn_times.items()))
+    )
+
+def _adjacent_combinations(seats: np.ndarray, limit: int) -> List[Tuple[np.ndarray, int]]:
+    """Runs of 2..limit neighbouring tables, smallest total first."""
+    runs = [
+        (np.arange(start, start + length), int(seats[start:start + length].sum()))
+        for length in range(2, limit + 1)
+        for start in range(len(seats) - length + 1)
+    ]
+    runs.sort(key=lambda run: (run[1], len(run[0])))
+    return runs
@@ -0,0 +1,383 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.reservation import Reservation
+from data.file_lock import FileLock
+
+
+class ReservationStore:
+    """
+    In-memory reservation table backed by a JSON file.
+
+    The file is parsed once on first access. Reservations are then served from
+    hash indexes keyed by id, by (restaurant_id, date) and by customer_id, which
+    are maintained in place on every write. Reads hand out copies so callers can
+    mutate what they get back without corrupting the indexes.
+
+    In journal mode writes no longer rewrite the whole file. Each create, modify
+    or cancel is appended to a JSONL journal next to the snapshot and fsynced,
+    and loading replays the journal on top of the snapshot. Once the journal
+    holds ``compact_threshold`` records a background thread folds it into a new
+    snapshot, so write cost stays flat as the history grows.
+
+    Writes from several processes are serialised by a lock file next to the
+    snapshot. ``transaction()`` holds it and first reloads if another process
+    changed the files since this one last read or wrote them. Loads hold it
+    too, so they never see a snapshot and journal from different moments.
+    """
+
+    def __init__(self, filepath: str, journal: bool = False, compact_threshold: int = 1000):
+        self.filepath = filepath
+        self.journal = journal
+        self.compact_threshold = compact_threshold
+        self.journal_path = os.path.splitext(filepath)[0] + '.journal.jsonl'
+        # The journal is renamed here while a compaction writes the snapshot
+        self._compacting_path = self.journal_path + '.compacting'
+        self._file_lock = FileLock(filepath + '.lock')
+        # Held for a whole compaction, so a leftover compacting file can be
+        # told apart from one another process is still folding
+        self._compactor_lock = FileLock(filepath + '.compact.lock')
+        # Stat of the files as of our last load or write, to spot other writers
+        self._disk_signature = None
+        self._lock = threading.RLock()
+        self._compaction_lock = threading.Lock()
+        self._journal_file = None
+        self._journal_records = 0
+        self._compaction_scheduled = False
+        self._loaded = False
+        self._by_id: Dict[str, Reservation] = {}
+        # dicts used as insertion-ordered sets of reservation ids
+        self._by_restaurant_date: Dict[Tuple[str, str], Dict[str, None]] = {}
+        self._by_customer: Dict[str, Dict[str, None]] = {}
+
+    # Loading
+
+    def _ensure_loaded(self):
+        # Call before taking self._lock; the file lock always comes first
+        if not self._loaded:
+            with self._file_lock, self._compaction_lock, self._lock:
+                if not self._loaded:
+                    self._load()
+
+    def reload(self):
+        """Discard the in-memory state and re-read the snapshot and journal."""
+        with self._file_lock, self._compaction_lock, self._lock:
+            self._load()
+
+    def _load(self):
+        self._close_journal()
+        self._by_id.clear()
+        self._by_restaurant_date.clear()
+        self._by_customer.clear()
+        for record in self._read_file():
+            self._index(Reservation(**record))
+
+        # A leftover compacting file means a compaction was interrupted
+        # before its snapshot landed, so its records come first.
+        replayed = 0
+        for path in (self._compacting_path, self.journal_path):
+            for entry in _read_journal(path):
+                self._replace(Reservation(**entry['reservation']))
+                replayed += 1
+        self._journal_records = replayed
+        self._loaded = True
+
+        if os.path.exists(self._compacting_path) or (replayed and not self.journal):
+            # Only fold when no compaction is running, or both would write the snapshot
+            if self._compactor_lock.acquire(blocking=False):
+                try:
+                    self._fold_journal()
+                finally:
+                    self._compactor_lock.release()
+        self._disk_signature = self._stat_files()
+
+    def _read_file(self) -> List[dict]:
+        if not os.path.exists(self.filepath):
+            return []
+        with open(self.filepath, 'r') as f:
+            return json.load(f)
+
+    def _write_file(self):
+        _write_snapshot(self.filepath, [r.to_dict() for r in self._by_id.values()])
+
+    def _stat_files(self) -> tuple:
+        signature = []
+        for path in (self.filepath, self.journal_path, self._compacting_path):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    # Transactions
+
+    @contextmanager
+    def transaction(self):
+        """
+        Hold the cross-process write lock for the enclosed block. Yields True
+        if the state was reloaded because another process wrote in the
+        meantime, so callers can drop anything derived from the old state.
+        """
+        with self._file_lock:
+            with self._compaction_lock:
+                with self._lock:
+                    changed = self._loaded and self._stat_files() != self._disk_signature
+                    if changed:
+                        self._load()
+            yield changed
+
+    def write_batch(self, changes: List[Tuple[Optional[Reservation], Reservation]]):
+        """
+        Apply (old, new) pairs with a single write; old is None for new
+        reservations. Call inside ``transaction()``.
+        """
+        self._ensure_loaded()
+        with self._lock:
+            records = []
+            for old, new in changes:
+                current = self._by_id.get(new.id)
+                if old is None and current is not None:
+                    raise ValueError(f"Reservation {new.id} already exists")
+                if old is not None and current is None:
+                    raise ValueError(f"Reservation {new.id} does not exist")
+                if current is None:
+                    op = 'create'
+                elif new.status == 'cancelled' and current.status != 'cancelled':
+                    op = 'cancel'
+                else:
+                    op = 'modify'
+                records.append((op, new))
+
+            # Validated up front so a bad change leaves memory and disk untouched
+            for op, reservation in records:
+                if op == 'create':
+                    self._index(_copy(reservation))
+                else:
+                    self._replace(_copy(reservation))
+            self._persist(records)
+
+    # Journal
+
+    def _persist(self, records: List[Tuple[str, Reservation]]):
+        if not self.journal:
+            self._write_file()
+            self._disk_signature = self._stat_files()
+            return
+
+        if self._journal_file is None:
+            os.makedirs(os.path.dirname(self.journal_path), exist_ok=True)
+            self._journal_file = open(self.journal_path, 'a')
+        self._journal_file.write(''.join(
+            json.dumps({'op': op, 'reservation': reservation.to_dict()}) + '\n'
+            for op, reservation in records
+        ))
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+        self._disk_signature = self._stat_files()
+
+        self._journal_records += len(records)
+        if self._journal_records >= self.compact_threshold and not self._compaction_scheduled:
+            self._compaction_scheduled = True
+            threading.Thread(target=self.compact, daemon=True).start()
+
+    def _close_journal(self):
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+
+    def _fold_journal(self):
+        """Write a snapshot of the current state and drop every journal file."""
+        self._close_journal()
+        self._write_file()
+        for path in (self._compacting_path, self.journal_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._journal_records = 0
+
+    def compact(self):
+        """
+        Fold the journal into a new snapshot.
+
+        The file lock is only held to rotate the journal and, at the end, to
+        swap in the new snapshot. The snapshot is serialised in between, so
+        writers in every process carry on appending to a fresh journal.
+        """
+        with self._compactor_lock:
+            self._ensure_loaded()
+            with self._file_lock, self._compaction_lock, self._lock:
+                self._compaction_scheduled = False
+                if self._stat_files() != self._disk_signature:
+                    # Another process wrote since we last looked; fold its records in too
+                    self._load()
+                self._close_journal()
+                if not os.path.exists(self.journal_path):
+                    return
+                os.replace(self.journal_path, self._compacting_path)
+                records = [r.to_dict() for r in self._by_id.values()]
+                self._journal_records = 0
+                self._disk_signature = self._stat_files()
+
+            tmp_path = _write_snapshot_tmp(self.filepath, records, self.filepath + '.compacting.tmp')
+
+            with self._file_lock, self._compaction_lock, self._lock:
+                # Writes from other processes since the rotation still need a reload
+                current = self._stat_files() == self._disk_signature
+                os.replace(tmp_path, self.filepath)
+                os.remove(self._compacting_path)
+                if current:
+                    self._disk_signature = self._stat_files()
+
+    # Index maintenance
+
+    def _index(self, reservation: Reservation):
+        # Assigning over an existing key keeps its position in file order
+        self._by_id[reservation.id] = reservation
+        key = (reservation.restaurant_id, reservation.date)
+        self._by_restaurant_date.setdefault(key, {})[reservation.id] = None
+        self._by_customer.setdefault(reservation.customer_id, {})[reservation.id] = None
+
+    def _replace(self, reservation: Reservation):
+        current = self._by_id.get(reservation.id)
+        if current is not None and (
+            current.restaurant_id != reservation.restaurant_id
+            or current.date != reservation.date
+            or current.customer_id != reservation.customer_id
+        ):
+            self._unindex(current)
+        self._index(reservation)
+
+    def _unindex(self, reservation: Reservation):
+        """Drop a reservation from the secondary indexes only."""
+        key = (reservation.restaurant_id, reservation.date)
+        _discard(self._by_restaurant_date, key, reservation.id)
+        _discard(self._by_customer, reservation.customer_id, reservation.id)
+
+    def _select(self, ids: Iterable[str], status: Optional[str]) -> List[Reservation]:
+        return [
+            _copy(self._by_id[rid]) for rid in ids
+            if status is None or self._by_id[rid].status == status
+        ]
+
+    # Queries
+
+    def get(self, reservation_id: str) -> Optional[Reservation]:
+        """Get a reservation by id."""
+        self._ensure_loaded()
+        with self._lock:
+            reservation = self._by_id.get(reservation_id)
+            return _copy(reservation) if reservation else None
+
+    def all(self) -> List[Reservation]:
+        """Get every reservation in insertion order."""
+        self._ensure_loaded()
+        with self._lock:
+            return self._select(self._by_id, None)
+
+    def for_restaurant(
+        self,
+        restaurant_id: str,
+        date: str,
+        status: Optional[str] = None
+    ) -> List[Reservation]:
+        """Get reservations for a restaurant on a date, optionally by status."""
+        self._ensure_loaded()
+        with self._lock:
+            ids = self._by_restaurant_date.get((restaurant_id, date), {})
+            return self._select(ids, status)
+
+    def for_restaurants(
+        self,
+        restaurant_ids: Iterable[str],
+        dates: Iterable[str],
+        status: Optional[str] = None
+    ) -> Dict[Tuple[str, str], List[Reservation]]:
+        """Get reservations for every restaurant and date pair, keyed by the pair."""
+        dates = list(dates)
+        self._ensure_loaded()
+        with self._lock:
+            grouped = {}
+            for restaurant_id in restaurant_ids:
+                for date in dates:
+                    ids = self._by_restaurant_date.get((restaurant_id, date))
+                    if ids:
+                        grouped[(restaurant_id, date)] = self._select(ids, status)
+            return grouped
+
+    def for_customer(self, customer_id: str, status: Optional[str] = None) -> List[Reservation]:
+        """Get reservations made by a customer, optionally by status, ordered by date and time."""
+        self._ensure_loaded()
+        with self._lock:
+            ids = sorted(
+                self._by_customer.get(customer_id, {}),
+                key=lambda rid: (self._by_id[rid].date, self._by_id[rid].time)
+            )
+            return self._select(ids, status)
+
+    # Writes
+
+    def add(self, reservation: Reservation):
+        """Add a new reservation."""
+        with self.transaction():
+            self.write_batch([(None, reservation)])
+
+    def update(self, reservation: Reservation) -> bool:
+        """Replace an existing reservation. Returns False if the id is unknown."""
+        with self.transaction():
+            current = self.get(reservation.id)
+            if current is None:
+                return False
+            self.write_batch([(current, reservation)])
+            return True
+
+    def cancel(self, reservation_id: str) -> Optional[Reservation]:
+        """Mark a reservation as cancelled and return the updated copy."""
+        with self.transaction():
+            reservation = self.get(reservation_id)
+            if reservation is None:
+                return None
+            reservation.status = "cancelled"
+            self.update(reservation)
+            return reservation
+
+
+def _copy(reservation: Reservation) -> Reservation:
+    return replace(reservation, table_ids=list(reservation.table_ids))
+
+def _read_journal(path: str) -> List[dict]:
+    if not os.path.exists(path):
+        return []
+    entries = []
+    with open(path, 'r') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append; it was never acknowledged
+                break
+    return entries
+
+def _write_snapshot(filepath: str, records: List[dict]):
+    """Atomically replace the snapshot file."""
+    os.replace(_write_snapshot_tmp(filepath, records, filepath + '.tmp'), filepath)
+
+def _write_snapshot_tmp(filepath: str, records: List[dict], tmp_path: str) -> str:
+    """Write and fsync a snapshot next to filepath, ready to be renamed over it."""
+    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    with open(tmp_path, 'w') as f:
+        json.dump(records, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp_path
+
+def _discard(index: Dict, key, reservation_id: str):
+    ids = index.get(key)
+    if ids is None:
+        return
+    ids.pop(reservation_id, None)
+    if not ids:
+        del index[key]
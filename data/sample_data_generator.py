@@ -53,6 +53,10 @@ def generate_sample_restaurants(count: int = 30) -> List[dict]:
             for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
         }
 
+        # Larger parties linger longer; keys are the smallest party size each applies to
+        base_turn = random.choice([75, 90])
+        turn_times = {"1": base_turn, "5": base_turn + 15, "7": base_turn + 30}
+
         restaurant = {
             'id': f"rest_{i+1}",
             'name': name,
@@ -63,7 +67,8 @@ def generate_sample_restaurants(count: int = 30) -> List[dict]:
             'tables': tables,
             'operating_hours': operating_hours,
             'rating': round(random.uniform(3.5, 5.0), 1),
-            'description': f"A {cuisine.lower()} restaurant offering authentic cuisine in a {random.choice(['casual', 'cozy', 'elegant', 'modern'])} atmosphere."
+            'description': f"A {cuisine.lower()} restaurant offering authentic cuisine in a {random.choice(['casual', 'cozy', 'elegant', 'modern'])} atmosphere.",
+            'turn_times': turn_times
         }
         restaurants.append(restaurant)
 
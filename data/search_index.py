@@ -0,0 +1,140 @@
+import heapq
+from bisect import bisect_right
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.restaurant import Restaurant
+from data.trigram_index import TrigramIndex
+
+
+class RestaurantSearchIndex:
+    """
+    Inverted index over a fixed list of restaurants.
+
+    Cuisine and location map to posting bitsets (NumPy bool arrays, one bit
+    per restaurant in catalog order). Price has one bitset per distinct price
+    covering every restaurant at or below it, and the largest table of each
+    restaurant is kept as a column. A query ANDs the bitsets it needs, so its
+    cost does not depend on how many tables each restaurant has. Build one per
+    catalog version; the index does not follow later changes.
+
+    Names, cuisines and locations also get trigram indexes. With ``fuzzy`` a
+    cuisine or location that matches nothing exactly falls back to the
+    postings of every value similar enough to it, and ``find_by_name`` looks
+    restaurants up by approximate name.
+    """
+
+    def __init__(self, restaurants: List[Restaurant]):
+        self.restaurants = list(restaurants)
+        size = len(self.restaurants)
+        self._all = np.ones(size, dtype=bool)
+
+        self._cuisine: Dict[str, np.ndarray] = {}
+        self._location: Dict[str, np.ndarray] = {}
+        for i, restaurant in enumerate(self.restaurants):
+            self._posting(self._cuisine, restaurant.cuisine.lower(), size)[i] = True
+            self._posting(self._location, restaurant.location.lower(), size)[i] = True
+
+        self._cuisine_terms = TrigramIndex(list(self._cuisine))
+        self._location_terms = TrigramIndex(list(self._location))
+        self._names = TrigramIndex([r.name for r in self.restaurants])
+
+        prices = np.array([r.price_range for r in self.restaurants], dtype=np.int64)
+        self.price_range = prices
+        self.rating = np.array([r.rating for r in self.restaurants], dtype=np.float64)
+        self._prices = sorted(set(prices.tolist()))
+        self._price_at_most = [prices <= price for price in self._prices]
+
+        self.max_table_size = np.array(
+            [max((t.seats for t in r.tables), default=0) for r in self.restaurants],
+            dtype=np.int64
+        )
+
+    @staticmethod
+    def _posting(postings: Dict[str, np.ndarray], key: str, size: int) -> np.ndarray:
+        posting = postings.get(key)
+        if posting is None:
+            posting = postings[key] = np.zeros(size, dtype=bool)
+        return posting
+
+    def match(
+        self,
+        cuisine: Optional[str] = None,
+        location: Optional[str] = None,
+        price_range: Optional[int] = None,
+        seating_required: Optional[int] = None,
+        fuzzy: bool = False,
+        threshold: float = 0.3
+    ) -> np.ndarray:
+        """
+        Bitset of restaurants meeting every given criterion. With fuzzy, a
+        cuisine or location with no exact match matches every value whose
+        trigram similarity to it is at least threshold.
+        """
+        mask = self._all
+        if cuisine:
+            matched = self._cuisine.get(cuisine.lower())
+            if matched is None:
+                matched = self._similar(self._cuisine, self._cuisine_terms, cuisine, fuzzy, threshold)
+            mask = mask & matched
+        if location:
+            # Locations match on substring, so OR the postings of every location containing it
+            needle = location.lower()
+            matched = ~self._all
+            for key, posting in self._location.items():
+                if needle in key:
+                    matched = matched | posting
+            if not matched.any():
+                matched = self._similar(self._location, self._location_terms, location, fuzzy, threshold)
+            mask = mask & matched
+        if price_range:
+            position = bisect_right(self._prices, price_range)
+            mask = mask & (self._price_at_most[position - 1] if position else ~self._all)
+        if seating_required:
+            mask = mask & (self.max_table_size >= seating_required)
+        return mask
+
+    def _similar(
+        self,
+        postings: Dict[str, np.ndarray],
+        terms: TrigramIndex,
+        value: str,
+        fuzzy: bool,
+        threshold: float
+    ) -> np.ndarray:
+        matched = ~self._all
+        if fuzzy:
+            for position, _ in terms.lookup(value, threshold):
+                matched = matched | postings[terms.terms[position]]
+        return matched
+
+    def find_by_name(self, name: str, threshold: float = 0.3) -> List[Tuple[Restaurant, float]]:
+        """(restaurant, similarity) for names similar to the given one, most similar first."""
+        return [(self.restaurants[i], similarity) for i, similarity in self._names.lookup(name, threshold)]
+
+    def scores(
+        self,
+        price_range: Optional[int] = None,
+        seating_required: Optional[int] = None,
+        weights: Optional[Dict[str, float]] = None
+    ) -> np.ndarray:
+        """
+        Score every restaurant as a weighted sum of its rating (out of 5), how
+        close its price is to the requested ceiling and how snugly its largest
+        table fits the party. Each part lies in [0, 1]; parts for criteria not
+        given score 0.
+        """
+        weights = weights or {}
+        score = weights.get("rating", 1.0) * self.rating / 5
+        if price_range:
+            price_fit = 1 - np.abs(price_range - self.price_range) / max(price_range, 1)
+            score = score + weights.get("price_fit", 0.0) * np.clip(price_fit, 0, 1)
+        if seating_required:
+            seat_fit = seating_required / np.maximum(self.max_table_size, seating_required)
+            score = score + weights.get("seat_fit", 0.0) * seat_fit
+        return score
+
+    def top(self, mask: np.ndarray, scores: np.ndarray, k: int) -> List[int]:
+        """Positions of the k best-scoring matches; ties keep catalog order."""
+        return heapq.nlargest(k, np.flatnonzero(mask).tolist(), key=scores.__getitem__)
@@ -0,0 +1,342 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from models.reservation import Reservation
+
+RESERVATION_COLUMNS = (
+    'id', 'restaurant_id', 'customer_id', 'date', 'time', 'party_size', 'status', 'table_ids'
+)
+
+# Columns added after the first release, applied to existing databases on connect
+ADDED_COLUMNS = {
+    'restaurants': [('turn_times', "TEXT NOT NULL DEFAULT '{}'")],
+    'reservations': [('table_ids', "TEXT NOT NULL DEFAULT '[]'")],
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS restaurants (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL,
+    cuisine TEXT NOT NULL,
+    price_range INTEGER NOT NULL,
+    seating_capacity INTEGER NOT NULL,
+    tables TEXT NOT NULL,
+    operating_hours TEXT NOT NULL,
+    rating REAL NOT NULL,
+    description TEXT NOT NULL,
+    turn_times TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE TABLE IF NOT EXISTS reservations (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    restaurant_id TEXT NOT NULL,
+    customer_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time TEXT NOT NULL,
+    party_size INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    table_ids TEXT NOT NULL DEFAULT '[]'
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta VALUES ('catalog_version', 0);
+INSERT OR IGNORE INTO meta VALUES ('reservations_version', 0);
+
+CREATE TRIGGER IF NOT EXISTS restaurants_inserted AFTER INSERT ON restaurants BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'catalog_version';
+END;
+CREATE TRIGGER IF NOT EXISTS restaurants_updated AFTER UPDATE ON restaurants BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'catalog_version';
+END;
+CREATE TRIGGER IF NOT EXISTS restaurants_deleted AFTER DELETE ON restaurants BEGIN
+    UPDATE meta SET value = value + 1 WHERE key = 'catalog_version';
+END;
+
+CREATE INDEX IF NOT EXISTS idx_reservations_restaurant_date_status
+    ON reservations (restaurant_id, date, status);
+DROP INDEX IF EXISTS idx_reservations_customer;
+CREATE INDEX IF NOT EXISTS idx_reservations_customer_date
+    ON reservations (customer_id, date, time);
+"""
+
+
+class SQLiteStore:
+    """
+    Restaurants and reservations kept in a local SQLite database.
+
+    Offers the same reservation interface as ReservationStore, but each query
+    is answered by an index instead of an in-memory table: (restaurant_id, date,
+    status) for availability, the unique id for single lookups and (customer_id,
+    date, time) for a customer's bookings in date order. The database runs in WAL mode so readers in other
+    processes are not blocked by a booking being written.
+
+    Each thread gets its own connection, so one thread's open transaction never
+    swallows another thread's reads. ``transaction()`` takes the database write
+    lock up front with BEGIN IMMEDIATE, which also serialises other processes.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._schema_ready = False
+        # reservations_version as of our last transaction, to spot other writers
+        self._reservations_version = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._lock:
+                if not self._schema_ready:
+                    conn.executescript(SCHEMA)
+                    _add_missing_columns(conn)
+                    self._schema_ready = True
+                self._connections.append(conn)
+            self._local.conn = conn
+        return conn
+
+    def close(self):
+        """Close every thread's connection."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._schema_ready = False
+            self._local = threading.local()
+
+    @contextmanager
+    def _write(self):
+        """Run the enclosed statements in one IMMEDIATE transaction, or the one already open."""
+        conn = self.conn
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @contextmanager
+    def transaction(self):
+        """
+        Hold the database write lock for the enclosed block. Yields True if
+        another process changed reservations since this one last wrote, so
+        callers can drop anything derived from the old state.
+        """
+        with self._write() as conn:
+            version = _reservations_version(conn)
+            changed = self._reservations_version is not None and version != self._reservations_version
+            self._reservations_version = version
+            yield changed
+
+    def reload(self):
+        """Nothing is cached in memory; kept for interface parity."""
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Reservation]:
+        rows = self.conn.execute(sql, params).fetchall()
+        return [_from_row(row) for row in rows]
+
+    # Restaurants
+
+    def restaurant_records(self) -> List[dict]:
+        """Get restaurants as plain dicts, in the same shape as restaurants.json."""
+        rows = self.conn.execute("SELECT * FROM restaurants ORDER BY rowid").fetchall()
+        records = []
+        for row in rows:
+            record = dict(row)
+            record['tables'] = json.loads(record['tables'])
+            record['operating_hours'] = json.loads(record['operating_hours'])
+            record['turn_times'] = json.loads(record['turn_times'])
+            records.append(record)
+        return records
+
+    def catalog_version(self) -> int:
+        """Counter bumped by triggers whenever the restaurants table changes."""
+        return self.conn.execute(
+            "SELECT value FROM meta WHERE key = 'catalog_version'"
+        ).fetchone()[0]
+
+    def save_restaurants(self, records: List[dict]):
+        """Insert or replace restaurants from restaurants.json-shaped dicts."""
+        rows = [
+            (
+                r['id'], r['name'], r['location'], r['cuisine'], r['price_range'],
+                r['seating_capacity'], json.dumps(r['tables']), json.dumps(r['operating_hours']),
+                r['rating'], r['description'], json.dumps(r.get('turn_times', {}))
+            )
+            for r in records
+        ]
+        with self._write() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO restaurants (id, name, location, cuisine, price_range, "
+                "seating_capacity, tables, operating_hours, rating, description, turn_times) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    # Reservation queries
+
+    def get(self, reservation_id: str) -> Optional[Reservation]:
+        """Get a reservation by id."""
+        found = self._query("SELECT * FROM reservations WHERE id = ?", (reservation_id,))
+        return found[0] if found else None
+
+    def all(self) -> List[Reservation]:
+        """Get every reservation in insertion order."""
+        return self._query("SELECT * FROM reservations ORDER BY seq")
+
+    def for_restaurant(
+        self,
+        restaurant_id: str,
+        date: str,
+        status: Optional[str] = None
+    ) -> List[Reservation]:
+        """Get reservations for a restaurant on a date, optionally by status."""
+        if status is None:
+            return self._query(
+                "SELECT * FROM reservations WHERE restaurant_id = ? AND date = ? ORDER BY seq",
+                (restaurant_id, date)
+            )
+        return self._query(
+            "SELECT * FROM reservations WHERE restaurant_id = ? AND date = ? AND status = ? ORDER BY seq",
+            (restaurant_id, date, status)
+        )
+
+    def for_restaurants(
+        self,
+        restaurant_ids: Iterable[str],
+        dates: Iterable[str],
+        status: Optional[str] = None
+    ) -> Dict[Tuple[str, str], List[Reservation]]:
+        """Get reservations for every restaurant and date pair with one query, keyed by the pair."""
+        restaurant_ids, dates = list(restaurant_ids), list(dates)
+        if not restaurant_ids or not dates:
+            return {}
+        sql = (
+            f"SELECT * FROM reservations WHERE restaurant_id IN ({', '.join('?' for _ in restaurant_ids)}) "
+            f"AND date IN ({', '.join('?' for _ in dates)})"
+        )
+        params = tuple(restaurant_ids) + tuple(dates)
+        if status is not None:
+            sql += " AND status = ?"
+            params += (status,)
+        grouped: Dict[Tuple[str, str], List[Reservation]] = {}
+        for reservation in self._query(sql + " ORDER BY seq", params):
+            grouped.setdefault((reservation.restaurant_id, reservation.date), []).append(reservation)
+        return grouped
+
+    def for_customer(self, customer_id: str, status: Optional[str] = None) -> List[Reservation]:
+        """Get reservations made by a customer, optionally by status, ordered by date and time."""
+        if status is None:
+            return self._query(
+                "SELECT * FROM reservations WHERE customer_id = ? ORDER BY date, time, seq",
+                (customer_id,)
+            )
+        return self._query(
+            "SELECT * FROM reservations WHERE customer_id = ? AND status = ? ORDER BY date, time, seq",
+            (customer_id, status)
+        )
+
+    # Reservation writes
+
+    def write_batch(self, changes: List[Tuple[Optional[Reservation], Reservation]]):
+        """
+        Apply (old, new) pairs in one transaction; old is None for new
+        reservations. Joins the transaction already open on this thread.
+        """
+        columns = RESERVATION_COLUMNS[1:]
+        with self._write() as conn:
+            for old, new in changes:
+                if old is None:
+                    try:
+                        conn.execute(
+                            f"INSERT INTO reservations ({', '.join(RESERVATION_COLUMNS)}) "
+                            f"VALUES ({', '.join('?' for _ in RESERVATION_COLUMNS)})",
+                            _to_row(new)
+                        )
+                    except sqlite3.IntegrityError:
+                        raise ValueError(f"Reservation {new.id} already exists")
+                    continue
+                cursor = conn.execute(
+                    f"UPDATE reservations SET {', '.join(f'{col} = ?' for col in columns)} WHERE id = ?",
+                    _to_row(new)[1:] + (new.id,)
+                )
+                if cursor.rowcount == 0:
+                    raise ValueError(f"Reservation {new.id} does not exist")
+            conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'reservations_version'")
+            self._reservations_version = _reservations_version(conn)
+
+    def add(self, reservation: Reservation):
+        """Add a new reservation."""
+        self.write_batch([(None, reservation)])
+
+    def update(self, reservation: Reservation) -> bool:
+        """Replace an existing reservation. Returns False if the id is unknown."""
+        with self._write():
+            current = self.get(reservation.id)
+            if current is None:
+                return False
+            self.write_batch([(current, reservation)])
+            return True
+
+    def cancel(self, reservation_id: str) -> Optional[Reservation]:
+        """Mark a reservation as cancelled and return the updated copy."""
+        with self._write():
+            reservation = self.get(reservation_id)
+            if reservation is None:
+                return None
+            reservation.status = 'cancelled'
+            self.write_batch([(reservation, reservation)])
+            return reservation
+
+    def import_reservations(self, reservations: List[Reservation]):
+        """Insert or replace reservations in a single transaction."""
+        rows = [_to_row(r) for r in reservations]
+        with self._write() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO reservations ({', '.join(RESERVATION_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in RESERVATION_COLUMNS)})",
+                rows
+            )
+
+
+def _to_row(reservation: Reservation) -> tuple:
+    data = reservation.to_dict()
+    data['table_ids'] = json.dumps(data['table_ids'])
+    return tuple(data[col] for col in RESERVATION_COLUMNS)
+
+def _from_row(row: sqlite3.Row) -> Reservation:
+    data = {col: row[col] for col in RESERVATION_COLUMNS}
+    data['table_ids'] = json.loads(data['table_ids'])
+    return Reservation(**data)
+
+def _reservations_version(conn: sqlite3.Connection) -> int:
+    return conn.execute(
+        "SELECT value FROM meta WHERE key = 'reservations_version'"
+    ).fetchone()[0]
+
+def _add_missing_columns(conn: sqlite3.Connection):
+    for table, columns in ADDED_COLUMNS.items():
+        existing = {row['name'] for row in conn.execute(f"PRAGMA table_info({table})")}
+        for name, definition in columns:
+            if name not in existing:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
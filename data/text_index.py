@@ -0,0 +1,137 @@
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+_WORD = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or place restaurant "
+    "restaurants some something that the to with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased words of the text without stopwords."""
+    return [word for word in _WORD.findall(text.lower()) if word not in _STOPWORDS]
+
+
+class TextIndex:
+    """
+    TF-IDF index over short documents, ranked by cosine similarity.
+
+    Term counts live in a dense NumPy matrix with one row per document and one
+    column per vocabulary term, alongside a document frequency vector. ``set``
+    and ``remove`` update a single row and the frequencies in place; the
+    weighted, normalised matrix is derived from them again on the first query
+    after a change. Rows of removed documents are zeroed and reused.
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self._keys: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._vocabulary: Dict[str, int] = {}
+        self._tf = np.zeros((0, 0), dtype=np.float32)
+        self._df = np.zeros(0, dtype=np.float32)
+        self._weights: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def set(self, key: str, text: str):
+        """Index a document under key, replacing any earlier text for it."""
+        counts = Counter(tokenize(text))
+        for term in counts:
+            if term not in self._vocabulary:
+                self._vocabulary[term] = len(self._vocabulary)
+
+        row = self._rows.get(key)
+        if row is None:
+            row = self._free.pop() if self._free else len(self._keys)
+            if row == len(self._keys):
+                self._keys.append(None)
+            self._rows[key] = row
+            self._keys[row] = key
+        self._reserve(len(self._keys), len(self._vocabulary))
+
+        self._clear_row(row)
+        for term, count in counts.items():
+            # Sublinear term frequency, so repeating a word has diminishing effect
+            self._tf[row, self._vocabulary[term]] = 1 + math.log(count)
+        self._df += self._tf[row] > 0
+        self._weights = None
+
+    def remove(self, key: str):
+        """Drop a document; unknown keys are ignored."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return
+        self._clear_row(row)
+        self._keys[row] = None
+        self._free.append(row)
+        self._weights = None
+
+    def search(
+        self,
+        query: str,
+        k: int,
+        keys: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        (key, cosine similarity) of the k documents most similar to the
+        query, best first, optionally restricted to the given keys. Documents
+        sharing no term with the query are never returned.
+        """
+        columns = [self._vocabulary[t] for t in tokenize(query) if t in self._vocabulary]
+        if not columns or not self._rows:
+            return []
+        matrix, idf = self._weighted()
+
+        vector = np.zeros(len(idf), dtype=np.float32)
+        for column, count in Counter(columns).items():
+            vector[column] = (1 + math.log(count)) * idf[column]
+        vector /= np.linalg.norm(vector)
+        scores = matrix @ vector
+
+        if keys is None:
+            candidates = np.flatnonzero(scores > 0).tolist()
+        else:
+            rows = (self._rows.get(key) for key in keys)
+            candidates = [row for row in rows if row is not None and scores[row] > 0]
+        best = heapq.nlargest(k, candidates, key=scores.__getitem__)
+        return [(self._keys[row], float(scores[row])) for row in best]
+
+    def _weighted(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self._weights is None:
+            rows, columns = len(self._keys), len(self._vocabulary)
+            df = self._df[:columns]
+            # Smoothed idf; a term in every document still counts a little
+            idf = np.log((1 + len(self._rows)) / (1 + df)) + 1
+            matrix = self._tf[:rows, :columns] * idf
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+            self._weights = (matrix, idf.astype(np.float32))
+        return self._weights
+
+    def _clear_row(self, row: int):
+        self._df -= self._tf[row] > 0
+        self._tf[row] = 0
+
+    def _reserve(self, rows: int, columns: int):
+        """Grow the count matrix geometrically so appends stay amortised O(1)."""
+        capacity_rows, capacity_columns = self._tf.shape
+        if rows <= capacity_rows and columns <= capacity_columns:
+            return
+        new_rows = max(rows, capacity_rows * 2 if rows > capacity_rows else capacity_rows, 8)
+        new_columns = max(columns, capacity_columns * 2 if columns > capacity_columns else capacity_columns, 64)
+        tf = np.zeros((new_rows, new_columns), dtype=np.float32)
+        tf[:capacity_rows, :capacity_columns] = self._tf
+        df = np.zeros(new_columns, dtype=np.float32)
+        df[:capacity_columns] = self._df
+        self._tf, self._df = tf, df
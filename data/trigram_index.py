@@ -0,0 +1,56 @@
+import re
+from collections import Counter
+from typing import Dict, FrozenSet, List, Tuple
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """
+    Trigrams of every word in the text, lowercased. Words are padded with two
+    spaces in front and one behind, so short words and word starts still
+    produce grams and punctuation ("west-end") splits words.
+    """
+    grams = set()
+    for word in _WORD.findall(text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+class TrigramIndex:
+    """
+    Fuzzy lookup over a fixed list of strings.
+
+    Each trigram maps to the positions of the strings containing it, so a
+    lookup only touches strings sharing at least one trigram with the query.
+    Similarity is shared trigrams over distinct trigrams in either string
+    (Jaccard), which tolerates typos and transpositions such as "italain".
+    """
+
+    def __init__(self, terms: List[str]):
+        self.terms = list(terms)
+        self._sizes: List[int] = []
+        self._postings: Dict[str, List[int]] = {}
+        for position, term in enumerate(self.terms):
+            grams = trigrams(term)
+            self._sizes.append(len(grams))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def lookup(self, query: str, threshold: float) -> List[Tuple[int, float]]:
+        """(position, similarity) of terms at or above threshold, most similar first."""
+        grams = trigrams(query)
+        if not grams:
+            return []
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+
+        matches = []
+        for position, count in shared.items():
+            similarity = count / (len(grams) + self._sizes[position] - count)
+            if similarity >= threshold:
+                matches.append((position, similarity))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
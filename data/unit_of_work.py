@@ -0,0 +1,157 @@
+from dataclasses import replace
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from models.reservation import Reservation
+
+
+class UnitOfWork:
+    """
+    Reservation changes staged inside one transaction.
+
+    Reads go to the store with staged changes laid over them, so a check made
+    after a staged write sees it. Every staged change is announced to the
+    reservation listeners straight away, which keeps availability structures in
+    step within the transaction; ``rollback`` announces the reverse moves.
+    ``commit`` hands everything to the store as a single write. Only the
+    thread that opened the transaction stages changes; others may read.
+    """
+
+    def __init__(self, store, notify: Callable[[Optional[Reservation], Optional[Reservation]], None]):
+        self.store = store
+        self._notify = notify
+        # id -> (reservation as stored before the transaction, latest staged version)
+        self._staged: Dict[str, Tuple[Optional[Reservation], Reservation]] = {}
+        self._log: List[Tuple[Optional[Reservation], Reservation]] = []
+        self._after_commit: List[Callable[[], None]] = []
+
+    # Reads
+
+    def get(self, reservation_id: str) -> Optional[Reservation]:
+        """Get a reservation by id, as staged in this transaction."""
+        if reservation_id in self._staged:
+            return _copy(self._staged[reservation_id][1])
+        return self.store.get(reservation_id)
+
+    def all(self) -> List[Reservation]:
+        return self._overlay(self.store.all(), lambda r: True)
+
+    def for_restaurant(
+        self,
+        restaurant_id: str,
+        date: str,
+        status: Optional[str] = None
+    ) -> List[Reservation]:
+        return self._overlay(
+            self.store.for_restaurant(restaurant_id, date, status),
+            lambda r: r.restaurant_id == restaurant_id and r.date == date and status in (None, r.status)
+        )
+
+    def for_restaurants(
+        self,
+        restaurant_ids: Iterable[str],
+        dates: Iterable[str],
+        status: Optional[str] = None
+    ) -> Dict[Tuple[str, str], List[Reservation]]:
+        restaurant_ids, dates = set(restaurant_ids), set(dates)
+        grouped = self.store.for_restaurants(restaurant_ids, dates, status)
+        if not self._staged:
+            return grouped
+        keys = set(grouped) | {
+            (latest.restaurant_id, latest.date) for _, latest in list(self._staged.values())
+            if latest.restaurant_id in restaurant_ids and latest.date in dates
+        }
+        result = {}
+        for restaurant_id, date in keys:
+            found = self._overlay(
+                grouped.get((restaurant_id, date), []),
+                lambda r: r.restaurant_id == restaurant_id and r.date == date and status in (None, r.status)
+            )
+            if found:
+                result[(restaurant_id, date)] = found
+        return result
+
+    def for_customer(self, customer_id: str, status: Optional[str] = None) -> List[Reservation]:
+        found = self._overlay(
+            self.store.for_customer(customer_id, status),
+            lambda r: r.customer_id == customer_id and status in (None, r.status)
+        )
+        if self._staged:
+            found.sort(key=lambda r: (r.date, r.time))
+        return found
+
+    def _overlay(self, stored: List[Reservation], matches: Callable[[Reservation], bool]) -> List[Reservation]:
+        if not self._staged:
+            return stored
+        seen = {r.id for r in stored}
+        # Staged versions keep the position of the row they replace
+        result = []
+        for reservation in stored:
+            staged = self._staged.get(reservation.id)
+            if staged is None:
+                result.append(reservation)
+            elif matches(staged[1]):
+                result.append(_copy(staged[1]))
+        for reservation_id, (_, latest) in list(self._staged.items()):
+            if reservation_id not in seen and matches(latest):
+                result.append(_copy(latest))
+        return result
+
+    # Writes
+
+    def add(self, reservation: Reservation):
+        """Stage a new reservation."""
+        if self.get(reservation.id) is not None:
+            raise ValueError(f"Reservation {reservation.id} already exists")
+        self._stage(None, reservation)
+
+    def update(self, reservation: Reservation) -> bool:
+        """Stage a change to an existing reservation. Returns False if the id is unknown."""
+        current = self.get(reservation.id)
+        if current is None:
+            return False
+        self._stage(current, reservation)
+        return True
+
+    def cancel(self, reservation_id: str) -> Optional[Reservation]:
+        """Stage a cancellation and return the updated copy."""
+        reservation = self.get(reservation_id)
+        if reservation is None:
+            return None
+        reservation.status = "cancelled"
+        self._stage(self.get(reservation_id), reservation)
+        return reservation
+
+    def _stage(self, current: Optional[Reservation], reservation: Reservation):
+        staged = _copy(reservation)
+        original = self._staged[reservation.id][0] if reservation.id in self._staged else current
+        self._staged[reservation.id] = (original, staged)
+        self._log.append((current, staged))
+        self._notify(current, _copy(staged))
+
+    # Completion
+
+    def after_commit(self, callback: Callable[[], None]):
+        """Run ``callback`` once the staged changes are written; dropped on rollback."""
+        self._after_commit.append(callback)
+
+    def commit(self):
+        """Write every staged change to the store at once."""
+        if self._staged:
+            self.store.write_batch(list(self._staged.values()))
+        self._staged.clear()
+        self._log.clear()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self):
+        """Discard staged changes and undo what they told the listeners."""
+        self._staged.clear()
+        self._after_commit.clear()
+        for current, staged in reversed(self._log):
+            self._notify(staged, current)
+        self._log.clear()
+
+
+def _copy(reservation: Reservation) -> Reservation:
+    return replace(reservation, table_ids=list(reservation.table_ids))
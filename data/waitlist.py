@@ -0,0 +1,152 @@
+import heapq
+import itertools
+import json
+import os
+import threading
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
+
+from models.waitlist_entry import WaitlistEntry
+from data.file_lock import FileLock
+from utils.time_utils import current_day_and_minute, date_to_ordinal, time_to_minutes
+
+
+class Waitlist:
+    """
+    Waiting parties per (restaurant_id, date), each day kept as a heap ordered
+    by request time.
+
+    Entries that leave the queue are only marked; their heap slots are dropped
+    when they surface at the top, so removal is O(1) and the heap never needs
+    rebuilding. Entries whose requested time has passed are no longer waiting.
+
+    Every change is appended to a JSONL file as the entry's new state, under a
+    lock file shared by every process. Each call first reloads the file if
+    another process changed it, so all of them see one queue and it survives a
+    restart. Once the file holds ``compact_threshold`` lines, mostly for
+    entries that left the queue, it is rewritten with only those still waiting.
+    """
+
+    def __init__(self, filepath: str, compact_threshold: int = 1000):
+        self.filepath = filepath
+        self.compact_threshold = compact_threshold
+        self._file_lock = FileLock(filepath + '.lock')
+        self._lock = threading.Lock()
+        self._entries: Dict[str, WaitlistEntry] = {}
+        self._heaps: Dict[Tuple[str, str], List[Tuple[float, int, str]]] = {}
+        self._counter = itertools.count()
+        # Stat of the file as of our last read or write, to spot other writers
+        self._signature: Optional[tuple] = ()
+        self._records = 0
+
+    def add(self, entry: WaitlistEntry):
+        """Queue a waiting party."""
+        with self._file_lock, self._lock:
+            self._sync()
+            if entry.id in self._entries:
+                raise ValueError(f"Waitlist entry {entry.id} already exists")
+            self._apply(replace(entry))
+            self._append(entry)
+
+    def get(self, entry_id: str) -> Optional[WaitlistEntry]:
+        with self._file_lock, self._lock:
+            self._sync()
+            entry = self._entries.get(entry_id)
+            return replace(entry) if entry else None
+
+    def waiting(self, restaurant_id: str, date: str) -> List[WaitlistEntry]:
+        """Parties still waiting for a restaurant and date, earliest request first."""
+        with self._file_lock, self._lock:
+            self._sync()
+            key = (restaurant_id, date)
+            heap = self._heaps.get(key)
+            if not heap:
+                return []
+            while heap and self._entries[heap[0][2]].status != "waiting":
+                heapq.heappop(heap)
+            if not heap:
+                del self._heaps[key]
+                return []
+            return [
+                replace(self._entries[entry_id]) for _, _, entry_id in sorted(heap)
+                if _is_waiting(self._entries[entry_id])
+            ]
+
+    def mark(self, entry_id: str, status: str, reservation_id: Optional[str] = None) -> bool:
+        """Take an entry out of the queue as promoted or withdrawn."""
+        with self._file_lock, self._lock:
+            self._sync()
+            entry = self._entries.get(entry_id)
+            if entry is None or entry.status != "waiting":
+                return False
+            entry.status = status
+            entry.reservation_id = reservation_id
+            self._append(entry)
+            return True
+
+    # Persistence; callers hold both locks
+
+    def _sync(self):
+        """Reload if another process changed the file since this one last read or wrote it."""
+        signature = _stat(self.filepath)
+        if signature == self._signature:
+            return
+        self._entries.clear()
+        self._heaps.clear()
+        self._records = 0
+        if signature is not None:
+            with open(self.filepath, 'rb') as f:
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # A torn final line from a crash mid-append; it was never acknowledged
+                        break
+                    self._apply(WaitlistEntry(**json.loads(line)))
+                    self._records += 1
+        self._signature = signature
+
+    def _apply(self, entry: WaitlistEntry):
+        current = self._entries.get(entry.id)
+        if current is not None:
+            current.status = entry.status
+            current.reservation_id = entry.reservation_id
+            return
+        self._entries[entry.id] = entry
+        heap = self._heaps.setdefault((entry.restaurant_id, entry.date), [])
+        heapq.heappush(heap, (entry.requested_at, next(self._counter), entry.id))
+
+    def _append(self, entry: WaitlistEntry):
+        os.makedirs(os.path.dirname(self.filepath) or '.', exist_ok=True)
+        with open(self.filepath, 'ab') as f:
+            f.write((json.dumps(entry.to_dict()) + '\n').encode())
+            f.flush()
+            os.fsync(f.fileno())
+        self._signature = _stat(self.filepath)
+        self._records += 1
+        if self._records >= self.compact_threshold:
+            self._compact()
+
+    def _compact(self):
+        """Rewrite the file with only the entries still waiting, once they are the minority."""
+        live = [entry for entry in self._entries.values() if _is_waiting(entry)]
+        if 2 * len(live) > self._records:
+            return
+        tmp_path = self.filepath + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(b''.join((json.dumps(entry.to_dict()) + '\n').encode() for entry in live))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.filepath)
+        self._sync()
+
+
+def _stat(path: str) -> Optional[tuple]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+def _is_waiting(entry: WaitlistEntry) -> bool:
+    """Whether the party still waits and the time it asked for has not passed."""
+    requested = (date_to_ordinal(entry.date), time_to_minutes(entry.time))
+    return entry.status == "waiting" and requested >= current_day_and_minute()
@@ -0,0 +1,27 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from models.reservation import Reservation
+
+@dataclass
+class Hold:
+    id: str
+    restaurant_id: str
+    date: str
+    time: str
+    party_size: int
+    expires_at: float  # time.time() after which the hold lapses
+    table_ids: List[str] = field(default_factory=list)
+
+    def as_reservation(self) -> Reservation:
+        """The tables this hold keeps, in the shape availability checks expect."""
+        return Reservation(
+            id=self.id,
+            restaurant_id=self.restaurant_id,
+            customer_id="",
+            date=self.date,
+            time=self.time,
+            party_size=self.party_size,
+            status="held",
+            table_ids=list(self.table_ids)
+        )
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import List
 
 @dataclass
 class Reservation:
@@ -10,6 +11,7 @@ class Reservation:
     time: str
     party_size: int
     status: str  # confirmed, cancelled, completed
+    table_ids: List[str] = field(default_factory=list)
     
     def to_dict(self) -> dict:
         return {
@@ -19,5 +21,6 @@ class Reservation:
             "date": self.date,
             "time": self.time,
             "party_size": self.party_size,
-            "status": self.status
-        }
\ No newline at end of file
+            "status": self.status,
+            "table_ids": list(self.table_ids)
+        }
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict
 
 @dataclass
@@ -18,4 +18,6 @@ class Restaurant:
     tables: List[Table]
     operating_hours: Dict[str, Dict[str, str]]
     rating: float
-    description: str
\ No newline at end of file
+    description: str
+    # Smallest party size (as a string key) -> minutes a party keeps its table
+    turn_times: Dict[str, int] = field(default_factory=dict)
\ No newline at end of file
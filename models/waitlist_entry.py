@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class WaitlistEntry:
+    id: str
+    restaurant_id: str
+    customer_id: str
+    date: str
+    time: str
+    party_size: int
+    requested_at: float  # time.time() when the party joined the waitlist
+    status: str = "waiting"  # waiting, promoted, withdrawn
+    reservation_id: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "restaurant_id": self.restaurant_id,
+            "customer_id": self.customer_id,
+            "date": self.date,
+            "time": self.time,
+            "party_size": self.party_size,
+            "requested_at": self.requested_at,
+            "status": self.status,
+            "reservation_id": self.reservation_id
+        }
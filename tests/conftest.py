@@ -0,0 +1,91 @@
+import pytest
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data import data_manager
+from data.reservation_store import ReservationStore
+from data.waitlist import Waitlist
+from models.reservation import Reservation
+from models.restaurant import Restaurant, Table
+from tools.availability import availability_cache, hold_registry, occupancy_index
+from utils.time_utils import WEEKDAYS
+
+@pytest.fixture(autouse=True)
+def reset_derived_state():
+    """Tests mock the data layer, so nothing derived from it may leak between them."""
+    occupancy_index.clear()
+    availability_cache.clear()
+    hold_registry.clear()
+    yield
+    occupancy_index.clear()
+    availability_cache.clear()
+    hold_registry.clear()
+
+@pytest.fixture(autouse=True)
+def reservation_store(tmp_path, monkeypatch):
+    """A throwaway store, so no test touches the repo's reservation files or their lock."""
+    store = ReservationStore(str(tmp_path / "reservations.json"))
+    monkeypatch.setattr(data_manager, "reservation_store", store)
+    return store
+
+@pytest.fixture(autouse=True)
+def waitlist(tmp_path, monkeypatch):
+    """A throwaway waitlist beside the throwaway store."""
+    waitlist = Waitlist(str(tmp_path / "waitlist.jsonl"))
+    monkeypatch.setattr("tools.waitlist.waitlist", waitlist)
+    return waitlist
+
+@pytest.fixture
+def restaurant(request, monkeypatch):
+    """
+    A restaurant with one 4-seat table, open 11:00-22:00 every day, that
+    get_restaurant serves. Parametrize indirectly with a dict to override
+    fields; there "tables" is a number of 4-seat tables and "hours" one
+    day's opening hours.
+    """
+    fields = dict(getattr(request, "param", {}))
+    table_count = fields.pop("tables", 1)
+    hours = fields.pop("hours", {"open": "11:00", "close": "22:00"})
+    restaurant = Restaurant(**{
+        "id": "test_rest",
+        "name": "Test Restaurant",
+        "location": "Downtown",
+        "cuisine": "Italian",
+        "price_range": 2,
+        "seating_capacity": 4 * table_count,
+        "tables": [Table(id=f"T{i + 1}", seats=4, description="4-seat table") for i in range(table_count)],
+        "operating_hours": {day: hours for day in WEEKDAYS},
+        "rating": 4.5,
+        "description": "Test restaurant",
+        **fields
+    })
+    monkeypatch.setattr('tools.availability.get_restaurant', lambda rid: restaurant if rid == restaurant.id else None)
+    return restaurant
+
+@pytest.fixture
+def reservation_factory():
+    """
+    Builds confirmed reservations for two at rest_1 on 2030-01-01 18:00;
+    pass the id and any fields to override.
+    """
+    def build(reservation_id, **fields):
+        return Reservation(**{
+            "id": reservation_id,
+            "restaurant_id": "rest_1",
+            "customer_id": "cust1",
+            "date": "2030-01-01",
+            "time": "18:00",
+            "party_size": 2,
+            "status": "confirmed",
+            **fields
+        })
+    return build
+
+@pytest.fixture
+def tomorrow():
+    """Tomorrow's date, the earliest a booking is valid at any time of day."""
+    return (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
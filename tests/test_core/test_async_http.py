@@ -0,0 +1,110 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.async_http import AsyncHTTPClient, AsyncHTTPError
+from core.llm_manager import LLMManager
+
+async def serve(responses, connections, delay=0.0):
+    """Local server answering each request with the next canned response."""
+    async def handle(reader, writer):
+        connections.append(writer)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = next(
+                    int(line.split(b":")[1]) for line in head.split(b"\r\n")
+                    if line.lower().startswith(b"content-length")
+                )
+                await reader.readexactly(length)
+                await asyncio.sleep(delay)
+                writer.write(responses.pop(0))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/v1/chat"
+
+def ok(payload):
+    body = json.dumps(payload).encode()
+    return b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+
+def test_reuses_connections_and_decodes_chunked_bodies():
+    async def scenario():
+        connections = []
+        responses = [
+            ok({"n": 1}),
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\n{\"n\":\r\n2\r\n2}\r\n0\r\n\r\n"
+        ]
+        server, url = await serve(responses, connections)
+        client = AsyncHTTPClient()
+        async with server:
+            first = await client.post(url, json={})
+            second = await client.post(url, json={})
+            await client.aclose()
+        return first.json(), second.json(), len(connections)
+
+    assert asyncio.run(scenario()) == ({"n": 1}, {"n": 2}, 1)
+
+def test_retries_error_statuses():
+    async def scenario():
+        responses = [
+            b"HTTP/1.1 503 Service Unavailable\r\nRetry-After: 0\r\nContent-Length: 0\r\n\r\n",
+            ok({"n": 1})
+        ]
+        server, url = await serve(responses, [])
+        client = AsyncHTTPClient()
+        async with server:
+            response = await client.post(url, json={})
+            await client.aclose()
+        return response.status
+
+    assert asyncio.run(scenario()) == 200
+
+def test_concurrency_is_bounded_and_cancellation_propagates():
+    async def scenario():
+        connections = []
+        server, url = await serve([ok({})] * 10, connections, delay=0.05)
+        client = AsyncHTTPClient(max_concurrency=2)
+        async with server:
+            await asyncio.gather(*(client.post(url, json={}) for _ in range(6)))
+            opened = len(connections)
+
+            task = asyncio.create_task(client.post(url, json={}))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await client.aclose()
+        return opened
+
+    assert asyncio.run(scenario()) == 2
+
+def test_aprocess_message_records_reply():
+    async def scenario():
+        reply = {"choices": [{"message": {"content": "Booked!"}}]}
+        server, url = await serve([ok(reply)], [])
+        manager = LLMManager()
+        manager.api_url = url
+        async with server:
+            response = await manager.aprocess_message("Book a table", "Asha")
+        return response, manager.conversation_state.history[-1]["message"]
+
+    assert asyncio.run(scenario()) == ("Booked!", "Booked!")
+
+def test_transport_failures_raise_async_http_error(monkeypatch):
+    monkeypatch.setattr('core.async_http.Config.LLM_MAX_RETRIES', 0)
+    async def scenario():
+        server = await asyncio.start_server(lambda r, w: w.close(), "127.0.0.1", 0)
+        url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}/"
+        async with server:
+            await AsyncHTTPClient().post(url, json={})
+
+    with pytest.raises(AsyncHTTPError):
+        asyncio.run(scenario())
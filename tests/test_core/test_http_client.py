@@ -0,0 +1,69 @@
+import io
+import pytest
+import requests
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import Config
+from core.http_client import backoff_delay, get_session, post_with_retries, retry_after
+
+def make_response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(b"")
+    response.headers.update(headers or {})
+    return response
+
+class FakeSession:
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+def test_retries_transient_failures_with_timeouts():
+    session = FakeSession([
+        requests.exceptions.ConnectTimeout(),
+        make_response(503),
+        make_response(200)
+    ])
+    delays = []
+    response = post_with_retries("http://llm", json={}, session=session, sleep=delays.append)
+
+    assert response.status_code == 200
+    assert len(delays) == 2
+    assert all(call["timeout"] == (Config.LLM_CONNECT_TIMEOUT, Config.LLM_READ_TIMEOUT) for call in session.calls)
+
+def test_honours_retry_after_and_gives_up():
+    session = FakeSession([make_response(429, {"Retry-After": "2"})] * (Config.LLM_MAX_RETRIES + 1))
+    delays = []
+    response = post_with_retries("http://llm", json={}, session=session, sleep=delays.append)
+
+    assert response.status_code == 429
+    assert delays == [2.0] * Config.LLM_MAX_RETRIES
+
+def test_client_errors_are_not_retried():
+    session = FakeSession([make_response(400)])
+    assert post_with_retries("http://llm", json={}, session=session, sleep=pytest.fail).status_code == 400
+
+def test_connection_errors_raise_after_last_attempt():
+    session = FakeSession([requests.exceptions.ConnectionError()] * (Config.LLM_MAX_RETRIES + 1))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        post_with_retries("http://llm", json={}, session=session, sleep=lambda _: None)
+
+def test_delays_are_bounded():
+    assert all(0 <= backoff_delay(attempt) <= Config.LLM_BACKOFF_MAX for attempt in range(10))
+    assert retry_after("100000") == Config.LLM_RETRY_AFTER_MAX
+    assert retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert retry_after("soon") is None
+
+def test_session_is_shared():
+    assert get_session() is get_session()
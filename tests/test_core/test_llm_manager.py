@@ -0,0 +1,53 @@
+import io
+import json
+import requests
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.http_client import iter_sse_data
+from core.llm_manager import LLMManager
+
+def sse_response(*contents):
+    events = [
+        "data: " + json.dumps({"choices": [{"delta": {"content": content}}]})
+        for content in contents
+    ]
+    body = "\n\n".join(events + ["data: [DONE]", ""])
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body.encode())
+    return response
+
+def test_iter_sse_data_groups_events():
+    lines = [": keep-alive", "data: one", "", "event: x", "data: two", "data:three", "", "data: tail"]
+    assert list(iter_sse_data(lines)) == ["one", "two\nthree", "tail"]
+
+def test_stream_message_yields_chunks_then_records_history(monkeypatch):
+    sent = {}
+    def mock_post(url, json, headers=None, stream=False):
+        sent.update(json)
+        return sse_response("A table ", "is ", "free.")
+    monkeypatch.setattr('core.llm_manager.post_with_retries', mock_post)
+
+    manager = LLMManager()
+    stream = manager.stream_message("Any tables tonight?", "Asha")
+    first = next(stream)
+    assert first == "A table "
+    assert manager.conversation_state.history[-1]["sender"] == "user"
+
+    assert first + "".join(stream) == "A table is free."
+    assert sent["stream"] is True
+    assert manager.conversation_state.history[-1]["message"] == "A table is free."
+
+def test_stream_message_reports_upstream_errors(monkeypatch):
+    def mock_post(url, json, headers=None, stream=False):
+        raise requests.exceptions.ConnectionError()
+    monkeypatch.setattr('core.llm_manager.post_with_retries', mock_post)
+
+    manager = LLMManager()
+    reply = "".join(manager.stream_message("Hello", "Asha"))
+    assert reply.startswith("I apologize")
+    assert manager.conversation_state.history[-1]["message"] == reply
@@ -0,0 +1,55 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.availability_cache import AvailabilityCache
+
+RESTAURANT = object()
+
+def test_hits_and_misses_are_counted():
+    cache = AvailabilityCache()
+    key = ("rest_1", "2030-01-01", "18:00", 2, None)
+
+    value, generation = cache.get(key, RESTAURANT)
+    assert value is None
+    cache.put(key, RESTAURANT, ["18:00"], generation)
+
+    assert cache.get(key, RESTAURANT)[0] == ["18:00"]
+    assert cache.get(key, object())[0] is None
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 1, "max_entries": 4096}
+
+def test_write_invalidates_only_its_day(reservation_factory):
+    cache = AvailabilityCache()
+    keys = [
+        ("rest_1", "2030-01-01", "18:00", 2, None),
+        ("rest_1", "2030-01-02", "18:00", 2, None),
+        ("rest_2", "2030-01-01", "18:00", 2, None),
+    ]
+    for key in keys:
+        cache.put(key, RESTAURANT, ["18:00"], cache.get(key, RESTAURANT)[1])
+
+    cache.apply(None, reservation_factory("res1"))
+
+    assert [cache.get(key, RESTAURANT)[0] for key in keys] == [None, ["18:00"], ["18:00"]]
+
+def test_answer_computed_across_a_write_is_not_stored(reservation_factory):
+    cache = AvailabilityCache()
+    key = ("rest_1", "2030-01-01", "18:00", 2, None)
+    _, generation = cache.get(key, RESTAURANT)
+    cache.apply(None, reservation_factory("res1"))
+    cache.put(key, RESTAURANT, ["18:00"], generation)
+
+    assert cache.get(key, RESTAURANT)[0] is None
+
+def test_least_recently_used_entry_is_evicted():
+    cache = AvailabilityCache(max_entries=2)
+    keys = [("rest_1", "2030-01-01", time, 2, None) for time in ("18:00", "18:30", "19:00")]
+    cache.put(keys[0], RESTAURANT, [], 0)
+    cache.put(keys[1], RESTAURANT, [], 0)
+    cache.get(keys[0], RESTAURANT)
+    cache.put(keys[2], RESTAURANT, [], 0)
+
+    assert cache.get(keys[1], RESTAURANT)[0] is None
+    assert cache.get(keys[0], RESTAURANT)[0] == []
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.catalog import RestaurantCatalog
+from data.sample_data_generator import generate_sample_restaurants
+from data.sqlite_store import SQLiteStore
+from tools.search import dict_to_restaurant
+
+class CountingSource:
+    def __init__(self, records):
+        self.records = records
+        self.signature = 1
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return [dict_to_restaurant(r) for r in self.records]
+
+def make_catalog(count=3):
+    source = CountingSource(generate_sample_restaurants(count))
+    return source, RestaurantCatalog(source.load, lambda: source.signature)
+
+def test_catalog_loads_once_while_unchanged():
+    source, catalog = make_catalog()
+    first = catalog.restaurants()
+    assert catalog.restaurants() is first
+    assert catalog.get("rest_2").id == "rest_2"
+    assert catalog.get("missing") is None
+    assert source.loads == 1
+    assert catalog.version == 1
+
+def test_catalog_reloads_when_signature_changes():
+    source, catalog = make_catalog()
+    catalog.restaurants()
+    source.records = source.records[:1]
+    source.signature = 2
+
+    assert [r.id for r in catalog.restaurants()] == ["rest_1"]
+    assert catalog.get("rest_2") is None
+    assert source.loads == 2
+    assert catalog.version == 2
+
+def test_invalidate_forces_reload():
+    source, catalog = make_catalog()
+    catalog.restaurants()
+    catalog.invalidate()
+    catalog.get("rest_1")
+    assert source.loads == 2
+
+def test_sqlite_catalog_version_tracks_restaurant_writes(tmp_path):
+    store = SQLiteStore(str(tmp_path / "foodiespot.db"))
+    before = store.catalog_version()
+    store.save_restaurants(generate_sample_restaurants(2))
+    assert store.catalog_version() > before
+    store.close()
@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.holds import HoldRegistry
+from models.hold import Hold
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def make_hold(hold_id, expires_at, date="2030-01-01"):
+    return Hold(
+        id=hold_id,
+        restaurant_id="rest_1",
+        date=date,
+        time="18:00",
+        party_size=2,
+        expires_at=expires_at,
+        table_ids=["T1"]
+    )
+
+def test_holds_expire_and_announce_it():
+    clock = FakeClock()
+    changes = []
+    holds = HoldRegistry(lambda old, new: changes.append((old and old.id, new and new.status)), clock=clock)
+    holds.place(make_hold("hold_1", 1060.0))
+    holds.place(make_hold("hold_2", 1300.0, date="2030-01-02"))
+
+    assert [r.id for r in holds.for_day("rest_1", "2030-01-01")] == ["hold_1"]
+    clock.now = 1061.0
+    assert [h.id for h in holds.expire()] == ["hold_1"]
+    assert holds.for_day("rest_1", "2030-01-01") == []
+    assert holds.get("hold_2") is not None
+    assert changes == [(None, "held"), (None, "held"), ("hold_1", None)]
+
+def test_released_hold_does_not_expire_later():
+    clock = FakeClock()
+    changes = []
+    holds = HoldRegistry(lambda old, new: changes.append(old and old.id), clock=clock)
+    holds.place(make_hold("hold_1", 1060.0))
+
+    assert holds.release("hold_1").id == "hold_1"
+    assert holds.release("hold_1") is None
+    clock.now = 2000.0
+    assert holds.expire() == []
+    assert changes == [None, "hold_1"]
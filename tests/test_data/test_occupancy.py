@@ -0,0 +1,158 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from data.occupancy import DayOccupancy, OccupancyIndex, TableSchedule, can_seat_many
+from data.reservation_store import ReservationStore
+from models.restaurant import Restaurant, Table
+from utils.time_utils import time_to_minutes
+
+TABLES = [
+    Table(id="T1", seats=2, description="2-seat table"),
+    Table(id="T2", seats=4, description="4-seat table"),
+    Table(id="T3", seats=8, description="8-seat table")
+]
+
+def make_restaurant(tables=TABLES, turn_times=None):
+    return Restaurant(
+        id="rest_1",
+        name="Test",
+        location="Downtown",
+        cuisine="Italian",
+        price_range=2,
+        seating_capacity=14,
+        tables=tables,
+        operating_hours={},
+        rating=4.0,
+        description="Test restaurant",
+        turn_times=turn_times or {}
+    )
+
+def test_party_goes_to_smallest_fitting_table():
+    day = DayOccupancy(make_restaurant(), 30)
+    assert day.allocate(time_to_minutes("18:00"), 3) == ["T2"]
+    assert day.allocate(time_to_minutes("18:00"), 1) == ["T1"]
+
+def test_tables_are_not_shared_between_parties(reservation_factory):
+    day = DayOccupancy(make_restaurant([Table(id="T1", seats=8, description="8-seat table")]), 30)
+    day.add(reservation_factory("res1", party_size=2, table_ids=["T1"]))
+
+    assert day.allocate(time_to_minutes("18:00"), 2) is None
+    assert day.can_seat([time_to_minutes("18:00"), time_to_minutes("18:30")], 2).tolist() == [False, True]
+
+def test_large_party_combines_adjacent_tables():
+    day = DayOccupancy(make_restaurant(), 30)
+    assert day.allocate(time_to_minutes("18:00"), 10) == ["T2", "T3"]
+    assert day.allocate(time_to_minutes("18:00"), 6) == ["T3"]
+    assert day.allocate(time_to_minutes("18:00"), 15) is None
+    assert day.max_party_size == 14
+
+def test_ignore_lets_a_booking_move_within_its_own_tables(reservation_factory):
+    day = DayOccupancy(make_restaurant([Table(id="T1", seats=4, description="4-seat table")]), 30)
+    day.add(reservation_factory("res1", party_size=4))
+
+    assert day.allocate(time_to_minutes("18:00"), 4) is None
+    assert day.allocate(time_to_minutes("18:00"), 4, ignore="res1") == ["T1"]
+
+def test_booking_blocks_its_table_for_the_whole_turn(reservation_factory):
+    single = [Table(id="T1", seats=8, description="8-seat table")]
+    day = DayOccupancy(make_restaurant(single), 90)
+    day.add(reservation_factory("res1", time="19:00", party_size=2))
+
+    times = [time_to_minutes(t) for t in ("17:30", "18:00", "19:30", "20:00", "20:30")]
+    assert day.can_seat(times, 2).tolist() == [True, False, False, False, True]
+
+def test_turn_time_depends_on_party_size(reservation_factory):
+    single = [Table(id="T1", seats=8, description="8-seat table")]
+    day = DayOccupancy(make_restaurant(single, {"1": 60, "5": 120}), 90)
+    assert [day.turn_time(size) for size in (2, 4, 5, 8)] == [60, 60, 120, 120]
+
+    day.add(reservation_factory("res1", time="19:00", party_size=6))
+    assert day.can_seat([time_to_minutes("20:30"), time_to_minutes("21:00")], 2).tolist() == [False, True]
+
+def test_schedule_detects_overlapping_windows():
+    schedule = TableSchedule()
+    schedule.add(600, 690, "res1")
+    schedule.add(720, 750, "res2")
+    starts = np.array([540, 600, 690, 700, 750])
+    ends = starts + 30
+
+    assert schedule.is_free(starts, ends).tolist() == [True, False, True, False, True]
+    schedule.remove("res2")
+    assert schedule.is_free(starts, ends).tolist() == [True, False, True, True, True]
+
+def test_index_applies_writes_incrementally(reservation_factory):
+    index = OccupancyIndex(30)
+    restaurant = make_restaurant()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return [reservation_factory("res1", party_size=8), reservation_factory("res2", status="cancelled")]
+
+    day = index.get(restaurant, "2030-01-01", load)
+    assert day.allocate(time_to_minutes("18:00"), 8) is None
+
+    moved = reservation_factory("res1", time="19:00", party_size=8)
+    index.apply(reservation_factory("res1", party_size=8), moved)
+    index.apply(None, reservation_factory("res3", party_size=2))
+
+    assert index.get(restaurant, "2030-01-01", load) is day
+    assert day.allocate(time_to_minutes("18:00"), 8) == ["T3"]
+    assert day.allocate(time_to_minutes("19:00"), 8) is None
+    assert len(loads) == 1
+
+def test_cold_load_does_not_block_writers(tmp_path, reservation_factory):
+    # Writers hold the store's file lock, then the index lock in apply
+    index = OccupancyIndex(30)
+    store = ReservationStore(str(tmp_path / "reservations.json"))
+    reader = threading.Thread(
+        target=index.get,
+        args=(make_restaurant(), "2030-01-01", lambda: store.for_restaurant("rest_1", "2030-01-01")),
+        daemon=True
+    )
+
+    def write():
+        with store.transaction():
+            reader.start()
+            # Let the reader reach the file lock before the listener runs
+            time.sleep(0.1)
+            index.apply(None, reservation_factory("res1"))
+
+    writer = threading.Thread(target=write, daemon=True)
+    writer.start()
+    writer.join(5)
+    reader.join(5)
+    assert not writer.is_alive() and not reader.is_alive()
+
+def test_day_built_during_a_write_is_not_kept(reservation_factory):
+    index = OccupancyIndex(30)
+    restaurant = make_restaurant()
+
+    def load():
+        index.apply(None, reservation_factory("res1"))
+        return []
+
+    index.get(restaurant, "2030-01-01", load)
+    loads = []
+    index.get(restaurant, "2030-01-01", lambda: loads.append(1) or [])
+    assert loads == [1]
+
+
+def test_can_seat_many_agrees_with_each_day(reservation_factory):
+    busy = DayOccupancy(make_restaurant(), 90)
+    busy.add(reservation_factory("res1", time="18:00", party_size=4))
+    busy.add(reservation_factory("res2", time="19:30", party_size=8))
+    quiet = DayOccupancy(make_restaurant(), 90)
+    minutes = [time_to_minutes(t) for t in ("17:00", "17:30", "18:00", "19:00", "19:30", "21:00")]
+
+    for party_size in (2, 4, 8, 10, 14):
+        batch = can_seat_many([busy, quiet], minutes, party_size)
+        assert batch[0].tolist() == busy.can_seat(minutes, party_size).tolist()
+        assert batch[1].tolist() == quiet.can_seat(minutes, party_size).tolist()
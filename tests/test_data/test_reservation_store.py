@@ -0,0 +1,157 @@
+import pytest
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.reservation_store import ReservationStore
+
+@pytest.fixture
+def store(tmp_path):
+    return ReservationStore(str(tmp_path / "reservations.json"))
+
+def test_lookups_use_indexes(store, reservation_factory):
+    store.add(reservation_factory("res1"))
+    store.add(reservation_factory("res2", date="2030-01-02"))
+    store.add(reservation_factory("res3", customer_id="cust2"))
+
+    assert [r.id for r in store.for_restaurant("rest_1", "2030-01-01")] == ["res1", "res3"]
+    assert [r.id for r in store.for_customer("cust1")] == ["res1", "res2"]
+    assert store.get("res2").date == "2030-01-02"
+
+    # A customer's bookings come back in date and time order, not insertion order
+    store.add(reservation_factory("res4", date="2029-12-31", time="20:00"))
+    store.add(reservation_factory("res5", date="2029-12-31", time="12:00"))
+    assert [r.id for r in store.for_customer("cust1")] == ["res5", "res4", "res1", "res2"]
+    assert store.get("missing") is None
+
+    grouped = store.for_restaurants(["rest_1", "rest_2"], ["2030-01-01", "2030-01-02"])
+    assert {key: [r.id for r in found] for key, found in grouped.items()} == {
+        ("rest_1", "2030-01-01"): ["res1", "res3"],
+        ("rest_1", "2030-01-02"): ["res2"]
+    }
+
+def test_update_moves_between_indexes(store, reservation_factory):
+    store.add(reservation_factory("res1"))
+    moved = store.get("res1")
+    moved.date = "2030-01-05"
+    assert store.update(moved)
+
+    assert store.for_restaurant("rest_1", "2030-01-01") == []
+    assert [r.id for r in store.for_restaurant("rest_1", "2030-01-05")] == ["res1"]
+
+def test_cancel_and_status_filter(store, reservation_factory):
+    store.add(reservation_factory("res1"))
+    store.add(reservation_factory("res2"))
+    store.cancel("res1")
+
+    confirmed = store.for_restaurant("rest_1", "2030-01-01", status="confirmed")
+    assert [r.id for r in confirmed] == ["res2"]
+
+def test_returned_copies_do_not_touch_indexes(store, reservation_factory):
+    store.add(reservation_factory("res1"))
+    store.get("res1").date = "2030-02-01"
+    assert store.get("res1").date == "2030-01-01"
+
+def test_duplicate_id_rejected(store, reservation_factory):
+    store.add(reservation_factory("res1"))
+    with pytest.raises(ValueError):
+        store.add(reservation_factory("res1"))
+
+def test_writes_persist_and_reload(store, reservation_factory):
+    store.add(reservation_factory("res1"))
+    store.cancel("res1")
+
+    with open(store.filepath) as f:
+        assert json.load(f)[0]["status"] == "cancelled"
+
+    reloaded = ReservationStore(store.filepath)
+    assert reloaded.get("res1").status == "cancelled"
+
+
+def test_journal_appends_instead_of_rewriting(tmp_path, reservation_factory):
+    store = ReservationStore(str(tmp_path / "reservations.json"), journal=True)
+    store.add(reservation_factory("res1"))
+    store.add(reservation_factory("res2"))
+    store.cancel("res1")
+
+    assert not Path(store.filepath).exists()
+    with open(store.journal_path) as f:
+        ops = [json.loads(line)["op"] for line in f]
+    assert ops == ["create", "create", "cancel"]
+
+    replayed = ReservationStore(store.filepath, journal=True)
+    assert replayed.get("res1").status == "cancelled"
+    assert [r.id for r in replayed.for_customer("cust1")] == ["res1", "res2"]
+
+def test_compaction_folds_journal_into_snapshot(tmp_path, reservation_factory):
+    store = ReservationStore(str(tmp_path / "reservations.json"), journal=True)
+    store.add(reservation_factory("res1"))
+    store.compact()
+    store.add(reservation_factory("res2"))
+
+    with open(store.filepath) as f:
+        assert [r["id"] for r in json.load(f)] == ["res1"]
+    with open(store.journal_path) as f:
+        assert len(f.readlines()) == 1
+
+    replayed = ReservationStore(store.filepath, journal=True)
+    assert [r.id for r in replayed.all()] == ["res1", "res2"]
+
+def test_interrupted_compaction_is_recovered(tmp_path, reservation_factory):
+    store = ReservationStore(str(tmp_path / "reservations.json"), journal=True)
+    store.add(reservation_factory("res1"))
+    # Simulate a crash after the journal was rotated but before the snapshot landed
+    store._close_journal()
+    Path(store.journal_path).rename(store.journal_path + ".compacting")
+
+    recovered = ReservationStore(store.filepath, journal=True)
+    assert recovered.get("res1") is not None
+    assert not Path(store.journal_path + ".compacting").exists()
+    with open(store.filepath) as f:
+        assert [r["id"] for r in json.load(f)] == ["res1"]
+
+def test_writes_proceed_while_a_compaction_serialises(tmp_path, monkeypatch, reservation_factory):
+    import threading
+    from data import reservation_store as module
+
+    store = ReservationStore(str(tmp_path / "reservations.json"), journal=True)
+    store.add(reservation_factory("res1"))
+
+    # Stall compaction mid-snapshot; a second store stands in for another process
+    writing, finish = threading.Event(), threading.Event()
+    write_tmp = module._write_snapshot_tmp
+    def stalled(*args):
+        writing.set()
+        assert finish.wait(5)
+        return write_tmp(*args)
+    monkeypatch.setattr(module, "_write_snapshot_tmp", stalled)
+    compaction = threading.Thread(target=store.compact)
+    compaction.start()
+    assert writing.wait(5)
+
+    other = ReservationStore(store.filepath, journal=True)
+    booking = threading.Thread(target=other.add, args=(reservation_factory("res2"),))
+    booking.start()
+    booking.join(5)
+    assert not booking.is_alive(), "write waited for the compaction"
+    # Loading mid-compaction must neither miss records nor fold the live compaction
+    assert [r.id for r in other.all()] == ["res1", "res2"]
+    assert Path(store.journal_path + ".compacting").exists()
+
+    finish.set()
+    compaction.join(5)
+    assert not Path(store.journal_path + ".compacting").exists()
+    with store.transaction():
+        assert [r.id for r in store.all()] == ["res1", "res2"]
+    assert [r.id for r in ReservationStore(store.filepath, journal=True).all()] == ["res1", "res2"]
+
+def test_torn_journal_line_is_ignored(tmp_path, reservation_factory):
+    store = ReservationStore(str(tmp_path / "reservations.json"), journal=True)
+    store.add(reservation_factory("res1"))
+    with open(store.journal_path, "a") as f:
+        f.write('{"op": "create", "reserv')
+
+    assert [r.id for r in ReservationStore(store.filepath, journal=True).all()] == ["res1"]
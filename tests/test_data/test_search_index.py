@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from data.sample_data_generator import generate_sample_restaurants
+from data.search_index import RestaurantSearchIndex
+from tools.search import dict_to_restaurant
+
+def brute_force(restaurants, cuisine, location, price_range, seating_required):
+    results = restaurants
+    if cuisine:
+        results = [r for r in results if r.cuisine.lower() == cuisine.lower()]
+    if location:
+        results = [r for r in results if location.lower() in r.location.lower()]
+    if price_range:
+        results = [r for r in results if r.price_range <= price_range]
+    if seating_required:
+        results = [r for r in results if any(t.seats >= seating_required for t in r.tables)]
+    return results
+
+def test_index_agrees_with_filtering():
+    restaurants = [dict_to_restaurant(r) for r in generate_sample_restaurants(200)]
+    index = RestaurantSearchIndex(restaurants)
+
+    for cuisine in (None, "italian", "Thai", "Klingon"):
+        for location in (None, "Downtown", "town", "Mars"):
+            for price_range in (None, 1, 2, 4):
+                for seating_required in (None, 2, 7, 50):
+                    query = (cuisine, location, price_range, seating_required)
+                    matched = [restaurants[i] for i in np.flatnonzero(index.match(*query))]
+                    assert matched == brute_force(restaurants, *query), query
+
+def test_max_table_size_column():
+    restaurants = [dict_to_restaurant(r) for r in generate_sample_restaurants(5)]
+    index = RestaurantSearchIndex(restaurants)
+    assert index.max_table_size.tolist() == [max(t.seats for t in r.tables) for r in restaurants]
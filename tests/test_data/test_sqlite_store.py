@@ -0,0 +1,98 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.data_manager import save_json
+from data.migrate_to_sqlite import migrate_json_to_sqlite
+from data.reservation_store import ReservationStore
+from data.sample_data_generator import generate_sample_restaurants
+from data.sqlite_store import SQLiteStore
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteStore(str(tmp_path / "foodiespot.db"))
+    yield store
+    store.close()
+
+def test_wal_mode_enabled(store):
+    assert store.conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+def test_reservation_queries(store, reservation_factory):
+    store.add(reservation_factory("res1"))
+    store.add(reservation_factory("res2", status="cancelled"))
+    store.add(reservation_factory("res3", date="2030-01-02", customer_id="cust2"))
+
+    confirmed = store.for_restaurant("rest_1", "2030-01-01", status="confirmed")
+    assert [r.id for r in confirmed] == ["res1"]
+    assert [r.id for r in store.for_customer("cust1")] == ["res1", "res2"]
+    assert store.get("res3").date == "2030-01-02"
+
+    store.add(reservation_factory("res4", date="2029-12-31"))
+    assert [r.id for r in store.for_customer("cust1")] == ["res4", "res1", "res2"]
+
+    grouped = store.for_restaurants(["rest_1"], ["2030-01-01", "2030-01-02"], status="confirmed")
+    assert {key: [r.id for r in found] for key, found in grouped.items()} == {
+        ("rest_1", "2030-01-01"): ["res1"],
+        ("rest_1", "2030-01-02"): ["res3"]
+    }
+
+    with pytest.raises(ValueError):
+        store.add(reservation_factory("res1"))
+
+def test_update_and_cancel(store, reservation_factory):
+    store.add(reservation_factory("res1"))
+    moved = store.get("res1")
+    moved.time = "19:30"
+    assert store.update(moved)
+    assert store.cancel("res1").status == "cancelled"
+    assert store.get("res1").time == "19:30"
+    assert not store.update(reservation_factory("missing"))
+
+def test_availability_query_uses_index(store):
+    plan = store.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM reservations WHERE restaurant_id = ? AND date = ? AND status = ?",
+        ("rest_1", "2030-01-01", "confirmed")
+    ).fetchall()
+    assert any("idx_reservations_restaurant_date_status" in row["detail"] for row in plan)
+
+def test_migrate_from_json(tmp_path, reservation_factory):
+    restaurants_file = str(tmp_path / "restaurants.json")
+    reservations_file = str(tmp_path / "reservations.json")
+    restaurants = generate_sample_restaurants(3)
+    save_json(restaurants_file, restaurants)
+    json_store = ReservationStore(reservations_file)
+    json_store.add(reservation_factory("res1"))
+
+    db_path = str(tmp_path / "foodiespot.db")
+    assert migrate_json_to_sqlite(db_path, restaurants_file, reservations_file) == (3, 1)
+    # Running it again replaces rather than duplicates
+    migrate_json_to_sqlite(db_path, restaurants_file, reservations_file)
+
+    store = SQLiteStore(db_path)
+    assert store.restaurant_records() == restaurants
+    assert [r.id for r in store.all()] == ["res1"]
+    store.close()
+
+def test_table_ids_round_trip_and_old_schema_upgrade(tmp_path, reservation_factory):
+    import sqlite3
+    db_path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE reservations (seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL UNIQUE, "
+        "restaurant_id TEXT NOT NULL, customer_id TEXT NOT NULL, date TEXT NOT NULL, "
+        "time TEXT NOT NULL, party_size INTEGER NOT NULL, status TEXT NOT NULL)"
+    )
+    conn.execute("INSERT INTO reservations VALUES (1, 'old', 'rest_1', 'c', '2030-01-01', '18:00', 2, 'confirmed')")
+    conn.commit()
+    conn.close()
+
+    store = SQLiteStore(db_path)
+    assert store.get("old").table_ids == []
+    seated = reservation_factory("res1")
+    seated.table_ids = ["T2", "T3"]
+    store.add(seated)
+    assert store.get("res1").table_ids == ["T2", "T3"]
+    store.close()
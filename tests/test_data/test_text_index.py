@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.text_index import TextIndex, tokenize
+
+def build():
+    index = TextIndex()
+    index.set("a", "A cozy romantic Italian bistro with candlelit tables")
+    index.set("b", "Modern Thai kitchen with a lively bar")
+    index.set("c", "Casual Thai street food")
+    return index
+
+def test_tokenize_drops_case_punctuation_and_stopwords():
+    assert tokenize("A Cozy, romantic place!") == ["cozy", "romantic"]
+
+def test_ranks_by_cosine_similarity():
+    index = build()
+    assert [key for key, _ in index.search("cozy romantic place", 5)] == ["a"]
+    assert [key for key, _ in index.search("modern thai", 5)] == ["b", "c"]
+    assert index.search("sushi", 5) == []
+    assert index.search("thai", 5, keys=["a", "c"])[0][0] == "c"
+
+def test_updates_match_a_fresh_build():
+    index = build()
+    index.set("b", "Elegant French dining room")
+    index.remove("c")
+    index.set("d", "Casual Thai street food")
+
+    fresh = TextIndex()
+    fresh.set("a", "A cozy romantic Italian bistro with candlelit tables")
+    fresh.set("b", "Elegant French dining room")
+    fresh.set("d", "Casual Thai street food")
+
+    for query in ("thai", "elegant french", "cozy bistro", "street food"):
+        got, expected = index.search(query, 5), fresh.search(query, 5)
+        assert [k for k, _ in got] == [k for k, _ in expected]
+        assert np.allclose([s for _, s in got], [s for _, s in expected])
+    assert len(index) == 3 and "c" not in index
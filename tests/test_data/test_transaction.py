@@ -0,0 +1,85 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data import data_manager
+from data.reservation_store import ReservationStore
+from data.sqlite_store import SQLiteStore
+
+@pytest.fixture(params=["json", "sqlite"])
+def open_store(request, tmp_path):
+    """Opens a store on a shared path; two calls act like two processes."""
+    stores = []
+
+    def open_store():
+        if request.param == "json":
+            store = ReservationStore(str(tmp_path / "reservations.json"), journal=True)
+        else:
+            store = SQLiteStore(str(tmp_path / "foodiespot.db"))
+        stores.append(store)
+        return store
+
+    yield open_store
+    for store in stores:
+        if isinstance(store, SQLiteStore):
+            store.close()
+
+@pytest.fixture
+def events(open_store, monkeypatch):
+    monkeypatch.setattr(data_manager, "reservation_store", open_store())
+    seen = []
+    monkeypatch.setattr(data_manager, "_reservation_listeners", [lambda old, new: seen.append((old, new))])
+    monkeypatch.setattr(data_manager, "_reload_listeners", [lambda: seen.append("reload")])
+    return seen
+
+def test_commit_writes_staged_changes_once(events, monkeypatch, reservation_factory):
+    store = data_manager.reservation_store
+    batches = []
+    write_batch = store.write_batch
+    monkeypatch.setattr(store, "write_batch", lambda changes: (batches.append(changes), write_batch(changes)))
+
+    with data_manager.transaction() as uow:
+        uow.add(reservation_factory("res1"))
+        data_manager.save_reservation(reservation_factory("res2"))
+        data_manager.update_reservation(reservation_factory("res1", time="19:00"))
+        # Reads inside the transaction see staged writes
+        assert [r.time for r in data_manager.get_restaurant_reservations("rest_1", "2030-01-01")] == ["19:00", "18:00"]
+        assert store.get("res1") is None
+
+    assert len(batches) == 1
+    assert store.get("res1").time == "19:00"
+    assert len(events) == 3
+
+def test_rollback_discards_and_undoes_notifications(events, reservation_factory):
+    data_manager.save_reservation(reservation_factory("res1"))
+    events.clear()
+
+    with pytest.raises(RuntimeError):
+        with data_manager.transaction() as uow:
+            uow.cancel("res1")
+            uow.add(reservation_factory("res2"))
+            raise RuntimeError("boom")
+
+    assert data_manager.get_reservation("res1").status == "confirmed"
+    assert data_manager.get_reservation("res2") is None
+    # Undo notifications replay the staged moves in reverse
+    assert [(old and old.status, new and new.id) for old, new in events] == [
+        ("confirmed", "res1"), (None, "res2"), ("confirmed", None), ("cancelled", "res1")
+    ]
+
+def test_writes_from_another_process_trigger_a_reload(events, open_store, reservation_factory):
+    data_manager.save_reservation(reservation_factory("res1"))
+    other = open_store()
+    other.add(reservation_factory("res2"))
+
+    with data_manager.transaction() as uow:
+        assert uow.get("res2") is not None
+
+    assert "reload" in events
+    events.clear()
+    with data_manager.transaction():
+        pass
+    assert events == []
@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.trigram_index import TrigramIndex, trigrams
+
+def test_trigrams_split_words_and_ignore_case():
+    assert trigrams("West-End") == trigrams("west end")
+    assert "  w" in trigrams("west")
+    assert trigrams("--") == frozenset()
+
+def test_lookup_ranks_by_similarity_above_threshold():
+    index = TrigramIndex(["Italian", "Indian", "Japanese", "Thai"])
+    matches = index.lookup("italain", 0.3)
+    assert [position for position, _ in matches] == [0]
+    assert index.lookup("italian", 0.3)[0] == (0, 1.0)
+    assert index.lookup("klingon", 0.3) == []
+    # Lowering the threshold admits weaker matches, still best first
+    loose = index.lookup("indain", 0.1)
+    assert loose[0][0] == 1
+    assert all(a[1] >= b[1] for a, b in zip(loose, loose[1:]))
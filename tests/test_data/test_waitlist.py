@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.waitlist import Waitlist
+from models.waitlist_entry import WaitlistEntry
+
+def make_entry(entry_id, date="2030-01-01", requested_at=1.0):
+    return WaitlistEntry(
+        id=entry_id,
+        restaurant_id="rest_1",
+        customer_id="cust1",
+        date=date,
+        time="18:00",
+        party_size=2,
+        requested_at=requested_at
+    )
+
+def test_processes_share_one_queue(tmp_path):
+    path = str(tmp_path / "waitlist.jsonl")
+    first, second = Waitlist(path), Waitlist(path)
+
+    first.add(make_entry("wait1", requested_at=2.0))
+    second.add(make_entry("wait2", requested_at=1.0))
+    assert [e.id for e in first.waiting("rest_1", "2030-01-01")] == ["wait2", "wait1"]
+
+    assert first.mark("wait2", "promoted", "res1")
+    assert not second.mark("wait2", "withdrawn")
+    assert second.get("wait2").reservation_id == "res1"
+
+    # A restart reads the same queue back
+    assert [e.id for e in Waitlist(path).waiting("rest_1", "2030-01-01")] == ["wait1"]
+
+def test_parties_whose_time_has_passed_are_not_waiting(tmp_path):
+    waitlist = Waitlist(str(tmp_path / "waitlist.jsonl"))
+    waitlist.add(make_entry("wait1", date="2020-01-01"))
+
+    assert waitlist.waiting("rest_1", "2020-01-01") == []
+
+def test_compaction_keeps_only_waiting_entries(tmp_path):
+    path = tmp_path / "waitlist.jsonl"
+    waitlist = Waitlist(str(path), compact_threshold=4)
+    other = Waitlist(str(path))
+    waitlist.add(make_entry("wait1"))
+    waitlist.add(make_entry("wait2"))
+    other.get("wait1")
+    waitlist.mark("wait1", "withdrawn")
+    waitlist.mark("wait2", "promoted", "res1")
+    waitlist.add(make_entry("wait3"))
+
+    assert len(path.read_text().splitlines()) == 1
+    assert [e.id for e in other.waiting("rest_1", "2030-01-01")] == ["wait3"]
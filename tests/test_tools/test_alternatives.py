@@ -0,0 +1,86 @@
+from pathlib import Path
+import sys
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import Config
+from tools.alternatives import find_alternatives
+from models.reservation import Reservation
+
+pytestmark = pytest.mark.parametrize(
+    "restaurant",
+    [{"id": "rest_1", "name": "Main", "hours": {"open": "18:00", "close": "20:00"}, "rating": 4.0}],
+    indirect=True
+)
+
+@pytest.fixture
+def restaurants(restaurant):
+    return [
+        restaurant,
+        replace(restaurant, id="rest_2", name="Sister", rating=4.5),
+        replace(restaurant, id="rest_3", name="Elsewhere", location="Uptown"),
+    ]
+
+@pytest.fixture
+def bookings(restaurants, monkeypatch):
+    """Reservations by (restaurant_id, date); empty unless a test fills it."""
+    booked = {}
+    by_id = {r.id: r for r in restaurants}
+    monkeypatch.setattr('tools.availability.get_restaurant', by_id.get)
+    monkeypatch.setattr('tools.search.get_restaurants', lambda: restaurants)
+    monkeypatch.setattr('tools.alternatives.get_restaurants', lambda: restaurants)
+    monkeypatch.setattr(
+        'tools.availability.get_restaurant_reservations',
+        lambda restaurant_id, date, status=None: booked.get((restaurant_id, date), [])
+    )
+    return booked
+
+def block(restaurant_id, date, time):
+    return Reservation(
+        id=f"{restaurant_id}_{date}_{time}",
+        restaurant_id=restaurant_id,
+        customer_id="cust1",
+        date=date,
+        time=time,
+        party_size=4,
+        status="confirmed"
+    )
+
+def day_after(days):
+    return (datetime.now() + timedelta(days=days)).strftime("%Y-%m-%d")
+
+def test_nearest_times_come_first(bookings):
+    tomorrow = day_after(1)
+    # 90-minute turn from 18:00 blocks the table until 19:30
+    bookings[("rest_1", tomorrow)] = [block("rest_1", tomorrow, "18:00")]
+
+    found = find_alternatives("rest_1", tomorrow, "19:00", 4, k=2)
+
+    assert [(a["restaurant_id"], a["date"], a["time"]) for a in found] == [
+        ("rest_1", tomorrow, "19:30"),
+        ("rest_1", tomorrow, "20:00"),
+    ]
+
+def test_falls_back_to_next_day_then_sister(bookings, monkeypatch):
+    monkeypatch.setattr(Config, "ALTERNATIVE_SEARCH_DAYS", 1)
+    tomorrow, later = day_after(1), day_after(2)
+    bookings[("rest_1", tomorrow)] = [block("rest_1", tomorrow, "18:00"), block("rest_1", tomorrow, "19:30")]
+
+    found = find_alternatives("rest_1", tomorrow, "19:00", 4, k=6)
+
+    assert [(a["restaurant_id"], a["date"]) for a in found][:5] == [("rest_1", later)] * 5
+    assert found[0]["time"] == "19:00"
+    assert (found[5]["restaurant_id"], found[5]["date"], found[5]["time"]) == ("rest_2", tomorrow, "19:00")
+
+def test_restaurant_may_be_named(bookings):
+    found = find_alternatives("main", day_after(1), "19:00", 4, k=1)
+
+    assert found[0]["restaurant_id"] == "rest_1"
+
+def test_unknown_restaurant(bookings):
+    with pytest.raises(ValueError):
+        find_alternatives("missing", day_after(1), "19:00", 4)
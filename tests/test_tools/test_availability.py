@@ -36,14 +36,14 @@ def sample_restaurant():
     )
 
 def test_check_availability_basic(sample_restaurant, monkeypatch):
-    def mock_get_restaurants():
-        return [sample_restaurant]
+    def mock_get_restaurant(restaurant_id):
+        return sample_restaurant if restaurant_id == sample_restaurant.id else None
     
-    def mock_get_reservations():
+    def mock_get_restaurant_reservations(restaurant_id, date, status=None):
         return []
     
-    monkeypatch.setattr('tools.availability.get_restaurants', mock_get_restaurants)
-    monkeypatch.setattr('tools.availability.get_reservations', mock_get_reservations)
+    monkeypatch.setattr('tools.availability.get_restaurant', mock_get_restaurant)
+    monkeypatch.setattr('tools.availability.get_restaurant_reservations', mock_get_restaurant_reservations)
     
     tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
     available_times = check_availability(
@@ -57,13 +57,13 @@ def test_check_availability_basic(sample_restaurant, monkeypatch):
     assert "18:00" in available_times
 
 def test_check_availability_full_booking(sample_restaurant, monkeypatch):
-    def mock_get_restaurants():
-        return [sample_restaurant]
+    def mock_get_restaurant(restaurant_id):
+        return sample_restaurant if restaurant_id == sample_restaurant.id else None
     
     from models.reservation import Reservation
     tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
     
-    def mock_get_reservations():
+    def mock_get_restaurant_reservations(restaurant_id, date, status=None):
         return [
             Reservation(
                 id="res1",
@@ -85,8 +85,8 @@ def test_check_availability_full_booking(sample_restaurant, monkeypatch):
             )
         ]
     
-    monkeypatch.setattr('tools.availability.get_restaurants', mock_get_restaurants)
-    monkeypatch.setattr('tools.availability.get_reservations', mock_get_reservations)
+    monkeypatch.setattr('tools.availability.get_restaurant', mock_get_restaurant)
+    monkeypatch.setattr('tools.availability.get_restaurant_reservations', mock_get_restaurant_reservations)
     
     available_times = check_availability(
         restaurant_id="test_rest",
@@ -95,4 +95,95 @@ def test_check_availability_full_booking(sample_restaurant, monkeypatch):
         party_size=4
     )
     
-    assert "18:00" not in available_times
\ No newline at end of file
+    assert "18:00" not in available_times
+
+def test_booking_blocks_tables_for_its_turn_time(sample_restaurant, monkeypatch):
+    from models.reservation import Reservation
+    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+
+    def mock_get_restaurant(restaurant_id):
+        return sample_restaurant
+
+    def mock_get_restaurant_reservations(restaurant_id, date, status=None):
+        return [
+            Reservation(id="res1", restaurant_id="test_rest", customer_id="cust1",
+                        date=tomorrow, time="18:00", party_size=4, status="confirmed"),
+            Reservation(id="res2", restaurant_id="test_rest", customer_id="cust2",
+                        date=tomorrow, time="18:00", party_size=6, status="confirmed")
+        ]
+
+    monkeypatch.setattr('tools.availability.get_restaurant', mock_get_restaurant)
+    monkeypatch.setattr('tools.availability.get_restaurant_reservations', mock_get_restaurant_reservations)
+
+    # The default 90 minute turn keeps both tables busy until 19:30
+    available_times = check_availability(
+        restaurant_id="test_rest",
+        date=tomorrow,
+        time="18:30",
+        party_size=4
+    )
+
+    assert available_times == ["19:30"]
+
+def test_check_availability_many_matches_single_checks(sample_restaurant, monkeypatch):
+    from dataclasses import replace
+    from models.reservation import Reservation
+    from tools.availability import check_availability_many
+    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    day_after = (datetime.now() + timedelta(days=2)).strftime("%Y-%m-%d")
+    other = replace(sample_restaurant, id="other_rest", tables=[Table(id="T1", seats=4, description="4-seat table")])
+    restaurants = {r.id: r for r in (sample_restaurant, other)}
+    reservations = [
+        Reservation(id="res1", restaurant_id="test_rest", customer_id="c", date=tomorrow,
+                    time="19:00", party_size=6, status="confirmed", table_ids=["T2"]),
+        Reservation(id="res2", restaurant_id="other_rest", customer_id="c", date=day_after,
+                    time="18:00", party_size=2, status="confirmed"),
+        Reservation(id="res3", restaurant_id="other_rest", customer_id="c", date=tomorrow,
+                    time="18:00", party_size=4, status="cancelled")
+    ]
+    fetches = []
+
+    def mock_get_restaurant(restaurant_id):
+        return restaurants.get(restaurant_id)
+
+    def mock_get_restaurant_reservations(restaurant_id, date, status=None):
+        return [r for r in reservations if r.restaurant_id == restaurant_id and r.date == date]
+
+    def mock_get_reservations_by_restaurant_date(restaurant_ids, dates, status=None):
+        fetches.append(1)
+        grouped = {}
+        for r in reservations:
+            if r.restaurant_id in restaurant_ids and r.date in dates:
+                grouped.setdefault((r.restaurant_id, r.date), []).append(r)
+        return grouped
+
+    monkeypatch.setattr('tools.availability.get_restaurant', mock_get_restaurant)
+    monkeypatch.setattr('tools.availability.get_restaurant_reservations', mock_get_restaurant_reservations)
+    monkeypatch.setattr('tools.availability.get_reservations_by_restaurant_date', mock_get_reservations_by_restaurant_date)
+
+    result = check_availability_many(["test_rest", "other_rest"], [tomorrow, day_after], ("17:00", "21:00"), 4)
+    assert len(fetches) == 1
+
+    from tools.availability import occupancy_index
+    occupancy_index.clear()
+    for r, restaurant_id in enumerate(result["restaurant_ids"]):
+        for d, date in enumerate(result["dates"]):
+            for t, time in enumerate(result["times"]):
+                single = time in check_availability(restaurant_id, date, time, 4)
+                assert result["available"][r][d][t] == single, (restaurant_id, date, time)
+
+    # T1 still seats four while the six-top is taken
+    assert result["available"][0][0][result["times"].index("19:00")]
+    assert not result["available"][1][1][result["times"].index("18:00")]
+
+def test_check_availability_by_restaurant_name(sample_restaurant, monkeypatch):
+    monkeypatch.setattr('tools.availability.get_restaurant',
+                        lambda rid: sample_restaurant if rid == sample_restaurant.id else None)
+    monkeypatch.setattr('tools.availability.get_restaurant_reservations',
+                        lambda restaurant_id, date, status=None: [])
+    monkeypatch.setattr('tools.search.get_restaurants', lambda: [sample_restaurant])
+
+    tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
+    assert "18:00" in check_availability("test restaurnt", tomorrow, "18:00", 4)
+    with pytest.raises(ValueError):
+        check_availability("Nowhere Diner", tomorrow, "18:00", 4)
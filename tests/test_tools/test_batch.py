@@ -0,0 +1,68 @@
+from pathlib import Path
+import sys
+import pytest
+from dataclasses import replace
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data import data_manager
+from tools.reservation import make_reservations_batch
+
+# Two 4-seat tables
+pytestmark = pytest.mark.parametrize("restaurant", [{"tables": 2}], indirect=True)
+
+@pytest.fixture
+def store(restaurant, reservation_store, monkeypatch):
+    monkeypatch.setattr('tools.search.get_restaurants', lambda: [restaurant])
+    return reservation_store
+
+@pytest.fixture
+def party(tomorrow):
+    def party(party_size, time="18:00"):
+        return {"restaurant_id": "test_rest", "date": tomorrow, "time": time, "party_size": party_size}
+    return party
+
+def test_batch_books_every_item_with_one_write(store, monkeypatch, party):
+    writes = []
+    write_batch = store.write_batch
+    monkeypatch.setattr(store, "write_batch", lambda changes: (writes.append(len(changes)), write_batch(changes)))
+
+    results = make_reservations_batch([party(4), party(4)], customer_details={"id": "corp"})
+
+    assert [r["success"] for r in results] == [True, True]
+    assert sorted(r["reservation"].table_ids[0] for r in results) == ["T1", "T2"]
+    assert writes == [2]
+    assert len(data_manager.get_customer_reservations("corp")) == 2
+
+def test_batch_is_all_or_nothing(store, party):
+    # The third party no longer fits once the first two are seated
+    results = make_reservations_batch([party(4), party(4), party(4), {"restaurant_id": "test_rest"}])
+
+    assert [r["success"] for r in results] == [False] * 4
+    assert results[0]["error"] == "Not booked because another item failed"
+    assert results[2]["error"] == "Slot not available"
+    assert results[3]["error"] == "Missing field: date"
+    assert store.all() == []
+
+def test_items_must_name_the_restaurant_exactly(store, party):
+    results = make_reservations_batch([dict(party(4), restaurant_id="test restaurnt")])
+
+    assert not results[0]["success"]
+    assert results[0]["error"] == "Restaurant not found: test restaurnt. Did you mean: Test Restaurant (test_rest)"
+    assert store.all() == []
+
+    results = make_reservations_batch([dict(party(4), restaurant_id="test restaurant")])
+    # Stored under the canonical id, so it counts against that restaurant's tables
+    assert results[0]["reservation"].restaurant_id == "test_rest"
+    assert make_reservations_batch([party(4), party(4)])[1]["error"] == "Slot not available"
+
+def test_items_may_not_name_an_ambiguous_restaurant(store, restaurant, monkeypatch, party):
+    twin = replace(restaurant, id="test_rest_2")
+    monkeypatch.setattr('tools.search.get_restaurants', lambda: [restaurant, twin])
+
+    results = make_reservations_batch([dict(party(4), restaurant_id="Test Restaurant")])
+
+    assert results[0]["error"] == (
+        "Several restaurants are named Test Restaurant: Test Restaurant (test_rest), Test Restaurant (test_rest_2)"
+    )
@@ -0,0 +1,48 @@
+from pathlib import Path
+import sys
+import pytest
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data.reservation_store import ReservationStore
+from tools.availability import check_availability, hold_registry
+from tools.holds import confirm_hold, hold_slot, release_hold
+
+@pytest.fixture
+def one_table(restaurant, monkeypatch):
+    saved = []
+    monkeypatch.setattr('tools.availability.get_restaurant_reservations', lambda rid, date, status=None: [])
+    monkeypatch.setattr('tools.holds.save_reservation', saved.append)
+    return saved
+
+def test_hold_blocks_the_slot_until_released(one_table, tomorrow):
+    hold = hold_slot("test_rest", tomorrow, "18:00", 4, ttl=60)
+
+    assert hold.table_ids == ["T1"]
+    assert "18:00" not in check_availability("test_rest", tomorrow, "18:00", 4)
+    assert hold_slot("test_rest", tomorrow, "18:00", 4) is None
+
+    assert release_hold(hold.id)
+    assert "18:00" in check_availability("test_rest", tomorrow, "18:00", 4)
+
+def test_confirm_turns_hold_into_reservation(one_table, tomorrow):
+    hold = hold_slot("test_rest", tomorrow, "18:00", 2, ttl=60)
+    reservation = confirm_hold(hold.id, {"id": "cust1"})
+
+    assert one_table == [reservation]
+    assert reservation.table_ids == ["T1"] and reservation.status == "confirmed"
+    assert hold_registry.get(hold.id) is None
+    assert confirm_hold(hold.id, {"id": "cust1"}) is None
+
+def test_confirm_fails_if_another_process_booked_the_tables(restaurant, reservation_store, reservation_factory, tomorrow):
+    hold = hold_slot("test_rest", tomorrow, "18:00", 2, ttl=60)
+
+    # A second store on the same file stands in for another process
+    ReservationStore(reservation_store.filepath).add(reservation_factory(
+        "res_other", restaurant_id="test_rest", customer_id="cust2", date=tomorrow, time="18:30", table_ids=["T1"]
+    ))
+
+    assert confirm_hold(hold.id, {"id": "cust1"}) is None
+    assert hold_registry.get(hold.id) is None
+    assert [r.id for r in reservation_store.for_restaurant("test_rest", tomorrow)] == ["res_other"]
@@ -0,0 +1,49 @@
+import pytest
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import Config
+from tools.planner import find_tables
+from data.sample_data_generator import generate_sample_restaurants
+
+@pytest.fixture
+def sample_data(monkeypatch):
+    restaurants = generate_sample_restaurants(20)
+    fetched = []
+    def mock_get_reservations_by_restaurant_date(restaurant_ids, dates, status=None):
+        fetched.append(set(restaurant_ids))
+        return {}
+    monkeypatch.setattr('tools.search.get_restaurants', lambda: restaurants)
+    monkeypatch.setattr('tools.availability.get_reservations_by_restaurant_date',
+                        mock_get_reservations_by_restaurant_date)
+    monkeypatch.setattr('tools.availability.get_restaurant_reservations',
+                        lambda restaurant_id, date, status=None: [])
+    return restaurants, fetched
+
+def test_stops_once_enough_tables_are_found(sample_data, tomorrow):
+    restaurants, fetched = sample_data
+    results = find_tables(date=tomorrow, time="19:00", party_size=4)
+
+    assert len(results) == Config.MAX_SEARCH_RESULTS
+    assert all("19:00" in result["available_times"] for result in results)
+    # Every candidate was free, so only the first batch was ever loaded
+    assert sum(len(ids) for ids in fetched) == Config.MAX_SEARCH_RESULTS
+
+def test_skips_closed_and_unmatched_restaurants(sample_data, tomorrow):
+    restaurants, _ = sample_data
+    for restaurant in restaurants:
+        restaurant["cuisine"] = "Thai"
+    restaurants[0]["cuisine"] = restaurants[1]["cuisine"] = "Mexican"
+    restaurants[1]["operating_hours"] = {
+        day: {} for day in restaurants[1]["operating_hours"]
+    }
+
+    results = find_tables("Mexican", date=tomorrow, time="19:00", party_size=2)
+    assert [result["restaurant"].id for result in results] == [restaurants[0]["id"]]
+
+def test_rejects_invalid_party_size(sample_data, tomorrow):
+    with pytest.raises(ValueError):
+        find_tables(date=tomorrow, time="19:00", party_size=0)
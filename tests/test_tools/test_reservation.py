@@ -1,12 +1,18 @@
 import pytest
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 import sys
 from pathlib import Path
 
 # Add parent directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from tools.reservation import make_reservation, modify_reservation, cancel_reservation
+from tools.reservation import (
+    make_reservation,
+    modify_reservation,
+    cancel_reservation,
+    list_customer_reservations
+)
 from models.reservation import Reservation
 
 @pytest.fixture
@@ -26,11 +32,16 @@ def test_make_reservation(monkeypatch):
     def mock_check_availability(*args, **kwargs):
         return ["18:00"]
     
+    def mock_assign_tables(*args, **kwargs):
+        return ["T2"]
+    
     def mock_save_reservation(reservation):
         pass
     
     monkeypatch.setattr('tools.reservation.check_availability', mock_check_availability)
+    monkeypatch.setattr('tools.reservation.assign_tables', mock_assign_tables)
     monkeypatch.setattr('tools.reservation.save_reservation', mock_save_reservation)
+    monkeypatch.setattr('tools.reservation.resolve_restaurant', lambda rid, exact=False: SimpleNamespace(id=rid))
     
     tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d")
     reservation = make_reservation(
@@ -44,19 +55,24 @@ def test_make_reservation(monkeypatch):
     assert reservation is not None
     assert reservation.status == "confirmed"
     assert reservation.party_size == 4
+    assert reservation.table_ids == ["T2"]
 
 def test_modify_reservation(sample_reservation, monkeypatch):
-    def mock_get_reservations():
-        return [sample_reservation]
+    def mock_get_reservation(reservation_id):
+        return sample_reservation if reservation_id == sample_reservation.id else None
     
     def mock_check_availability(*args, **kwargs):
         return ["19:00"]
     
+    def mock_assign_tables(*args, **kwargs):
+        return ["T3"]
+    
     def mock_update_reservation(reservation):
         pass
     
-    monkeypatch.setattr('tools.reservation.get_reservations', mock_get_reservations)
+    monkeypatch.setattr('tools.reservation.get_reservation', mock_get_reservation)
     monkeypatch.setattr('tools.reservation.check_availability', mock_check_availability)
+    monkeypatch.setattr('tools.reservation.assign_tables', mock_assign_tables)
     monkeypatch.setattr('tools.reservation.update_reservation', mock_update_reservation)
     
     modified = modify_reservation(
@@ -66,16 +82,38 @@ def test_modify_reservation(sample_reservation, monkeypatch):
     
     assert modified is not None
     assert modified.time == "19:00"
+    assert modified.table_ids == ["T3"]
 
 def test_cancel_reservation(sample_reservation, monkeypatch):
-    def mock_get_reservations():
-        return [sample_reservation]
+    def mock_get_reservation(reservation_id):
+        return sample_reservation if reservation_id == sample_reservation.id else None
     
     def mock_update_reservation(reservation):
         pass
     
-    monkeypatch.setattr('tools.reservation.get_reservations', mock_get_reservations)
+    monkeypatch.setattr('tools.reservation.get_reservation', mock_get_reservation)
     monkeypatch.setattr('tools.reservation.update_reservation', mock_update_reservation)
     
     result = cancel_reservation("test_res")
-    assert result is True
\ No newline at end of file
+    assert result is True
+
+def test_list_customer_reservations(sample_reservation, monkeypatch):
+    yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    past = Reservation(
+        id="old_res",
+        restaurant_id="test_rest",
+        customer_id="test_cust",
+        date=yesterday,
+        time="18:00",
+        party_size=2,
+        status="confirmed"
+    )
+    
+    def mock_get_customer_reservations(customer_id, status=None):
+        return [past, sample_reservation] if customer_id == "test_cust" else []
+    
+    monkeypatch.setattr('tools.reservation.get_customer_reservations', mock_get_customer_reservations)
+    
+    assert [r.id for r in list_customer_reservations("test_cust")] == ["test_res"]
+    assert [r.id for r in list_customer_reservations("test_cust", upcoming_only=False)] == ["old_res", "test_res"]
+    assert list_customer_reservations("someone_else") == []
@@ -5,7 +5,13 @@ from pathlib import Path
 # Add parent directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from tools.search import search_restaurants
+from app.config import Config
+from tools.search import (
+    search_restaurants,
+    search_restaurants_page,
+    search_restaurants_by_description,
+    find_restaurants_by_name
+)
 from data.sample_data_generator import generate_sample_restaurants
 
 @pytest.fixture
@@ -30,4 +36,69 @@ def test_search_by_price_range(sample_data):
 
 def test_search_by_seating(sample_data):
     results = search_restaurants(seating_required=6)
-    assert all(any(t.seats >= 6 for t in r.tables) for r in results)
\ No newline at end of file
+    assert all(any(t.seats >= 6 for t in r.tables) for r in results)
+
+def test_index_is_rebuilt_when_catalog_changes(sample_data, monkeypatch):
+    first = search_restaurants()
+    assert search_restaurants() == first
+
+    monkeypatch.setattr('tools.search.get_restaurants', lambda: sample_data[:3])
+    assert len(search_restaurants()) == 3
+
+def test_results_are_ranked_and_capped(sample_data):
+    results = search_restaurants()
+    assert len(results) == Config.MAX_SEARCH_RESULTS
+    assert [r.rating for r in results] == sorted((r["rating"] for r in sample_data), reverse=True)[:len(results)]
+
+def test_cursor_pages_through_every_match(sample_data):
+    seen, cursor = [], None
+    while True:
+        page = search_restaurants_page(limit=3, cursor=cursor)
+        seen.extend(r.id for r in page["results"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(r["id"] for r in sample_data)
+    assert len(seen) == len(set(seen))
+    with pytest.raises(ValueError):
+        search_restaurants_page(cuisine="Italian", cursor=search_restaurants_page(limit=3)["next_cursor"])
+
+def test_misspelt_cuisine_and_location_still_match(sample_data):
+    sample_data[0].update(cuisine="Italian", location="West End")
+    results = search_restaurants(cuisine="italain", location="west-end")
+    assert results
+    assert all(r.cuisine == "Italian" and r.location == "West End" for r in results)
+
+def test_find_restaurants_by_name(sample_data):
+    # Generated names repeat, so give every row its own before renaming one
+    for i, restaurant in enumerate(sample_data):
+        restaurant["name"] = f"Diner {i}"
+    sample_data[3]["name"] = "Bella Italia Kitchen"
+    assert find_restaurants_by_name("bela italia")[0].id == sample_data[3]["id"]
+    assert find_restaurants_by_name("zzzz") == []
+
+def test_search_by_description(sample_data):
+    sample_data[0].update(cuisine="Thai", description="Candlelit, romantic rooftop with modern Thai plates.")
+    results = search_restaurants_by_description("romantic rooftop")
+    assert results[0].id == sample_data[0]["id"]
+    narrowed = search_restaurants_by_description("romantic rooftop", cuisine="Mexican")
+    assert sample_data[0]["id"] not in [r.id for r in narrowed]
+
+def test_text_index_catches_up_once_under_concurrent_sessions(sample_data, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+    from data.text_index import TextIndex
+
+    calls = []
+    set_text = TextIndex.set
+    def counting_set(self, key, text):
+        calls.append(key)
+        set_text(self, key, text)
+    monkeypatch.setattr(TextIndex, "set", counting_set)
+
+    sample_data[0]["description"] = "A sunny rooftop terrace."
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: search_restaurants_by_description("rooftop terrace"), range(16)))
+
+    assert all(r[0].id == sample_data[0]["id"] for r in results)
+    assert calls.count(sample_data[0]["id"]) == 1
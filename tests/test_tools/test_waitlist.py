@@ -0,0 +1,44 @@
+from pathlib import Path
+import sys
+import pytest
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from data import data_manager
+from tools.reservation import cancel_reservation, make_reservation, modify_reservation
+from tools.waitlist import join_waitlist, leave_waitlist
+
+# A single 4-seat table backed by the throwaway reservation store
+pytestmark = pytest.mark.usefixtures("restaurant")
+
+def test_cancellation_promotes_first_fitting_party(tomorrow, waitlist):
+    booked = make_reservation("test_rest", tomorrow, "18:00", 4, {"id": "cust1"})
+    too_big = join_waitlist("test_rest", tomorrow, "18:00", 6, {"id": "cust2"})
+    first = join_waitlist("test_rest", tomorrow, "18:00", 2, {"id": "cust3"})
+    second = join_waitlist("test_rest", tomorrow, "18:00", 2, {"id": "cust4"})
+
+    assert cancel_reservation(booked.id)
+
+    promoted = waitlist.get(first.id)
+    assert promoted.status == "promoted"
+    reservation = data_manager.get_reservation(promoted.reservation_id)
+    assert (reservation.customer_id, reservation.time, reservation.table_ids) == ("cust3", "18:00", ["T1"])
+    assert waitlist.get(second.id).status == "waiting"
+    assert waitlist.get(too_big.id).status == "waiting"
+
+def test_moving_a_booking_promotes_into_its_old_slot(tomorrow, waitlist):
+    booked = make_reservation("test_rest", tomorrow, "18:00", 4, {"id": "cust1"})
+    entry = join_waitlist("test_rest", tomorrow, "18:00", 4, {"id": "cust2"})
+
+    assert modify_reservation(booked.id, new_time="20:00") is not None
+    assert waitlist.get(entry.id).status == "promoted"
+
+def test_withdrawn_party_is_skipped(tomorrow, waitlist):
+    booked = make_reservation("test_rest", tomorrow, "18:00", 4, {"id": "cust1"})
+    entry = join_waitlist("test_rest", tomorrow, "18:00", 4, {"id": "cust2"})
+    assert leave_waitlist(entry.id)
+
+    cancel_reservation(booked.id)
+    assert waitlist.get(entry.id).status == "withdrawn"
+    assert data_manager.get_customer_reservations("cust2") == []
@@ -0,0 +1,38 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+from utils.id_generator import IdGenerator
+
+def test_ids_are_unique_and_sorted_within_a_millisecond_burst():
+    generator = IdGenerator(worker_id=7, prefix="res_")
+    ids = [generator.next_id() for _ in range(10000)]
+
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+    assert all(len(i) == len(ids[0]) for i in ids)
+
+def test_workers_never_collide():
+    first, second = IdGenerator(worker_id=1), IdGenerator(worker_id=2)
+    ids = {first.next_id() for _ in range(2000)} | {second.next_id() for _ in range(2000)}
+    assert len(ids) == 4000
+
+def test_worker_id_range_is_checked():
+    with pytest.raises(ValueError):
+        IdGenerator(worker_id=1024)
+
+def test_leased_worker_ids_are_unique(tmp_path):
+    from data.data_manager import lease_worker_id
+
+    # Both processes would derive 5 from their pids; the second gets the next free id
+    first, first_lease = lease_worker_id(str(tmp_path), 5)
+    second, second_lease = lease_worker_id(str(tmp_path), 5)
+    assert (first, second) == (5, 6)
+
+    first_lease.release()
+    third, _ = lease_worker_id(str(tmp_path), 5)
+    assert third == 5
@@ -0,0 +1,47 @@
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import pytest
+
+from utils.time_utils import (
+    date_to_ordinal,
+    get_time_slots,
+    minutes_to_time,
+    operating_window,
+    ordinal_to_date,
+    slot_minutes,
+    time_to_minutes,
+    weekday_name
+)
+
+def test_time_round_trip():
+    assert time_to_minutes("00:00") == 0
+    assert time_to_minutes("19:30") == 1170
+    assert minutes_to_time(1170) == "19:30"
+    for bad in ("24:00", "7pm", "12:60", "", "1230"):
+        with pytest.raises(ValueError):
+            time_to_minutes(bad)
+
+def test_ordinals_match_calendar():
+    ordinal = date_to_ordinal("2030-01-05")
+    assert ordinal == date(2030, 1, 5).toordinal()
+    assert ordinal_to_date(ordinal + 1) == "2030-01-06"
+    assert weekday_name(ordinal) == "Saturday"
+    with pytest.raises(ValueError):
+        date_to_ordinal("2030-02-30")
+
+def test_slots_on_and_off_the_grid():
+    assert slot_minutes(1080, 1170, 30) == (1080, 1110, 1140, 1170)
+    assert slot_minutes(1095, 1170, 30) == (1095, 1125, 1155)
+    assert slot_minutes(1200, 1170, 30) == ()
+    assert get_time_slots("18:00", "19:00") == ["18:00", "18:30", "19:00"]
+
+def test_operating_window_per_weekday():
+    hours = {"Monday": {"open": "11:00", "close": "22:00"}, "Tuesday": {}}
+    assert operating_window(hours, "Monday") == (660, 1320)
+    assert operating_window(hours, "Tuesday") is None
+    assert operating_window(hours, "Sunday") is None
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from utils.timer_wheel import TimerWheel
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+def test_keys_fire_once_their_deadline_passes():
+    clock = FakeClock()
+    wheel = TimerWheel(slots=8, clock=clock)
+    wheel.schedule("a", 1002.5)
+    wheel.schedule("b", 1001.0)
+
+    clock.now = 1002.0
+    assert wheel.advance() == ["b"]
+    clock.now = 1003.0
+    assert wheel.advance() == ["a"]
+    assert len(wheel) == 0
+
+def test_deadlines_beyond_one_turn_wait_for_their_tick():
+    clock = FakeClock()
+    wheel = TimerWheel(slots=8, clock=clock)
+    wheel.schedule("far", 1020.0)  # shares a bucket with tick 1004 and 1012
+
+    clock.now = 1012.0
+    assert wheel.advance() == []
+    clock.now = 1100.0
+    assert wheel.advance() == ["far"]
+
+def test_cancel_and_reschedule():
+    clock = FakeClock()
+    wheel = TimerWheel(slots=8, clock=clock)
+    wheel.schedule("a", 1001.0)
+    wheel.schedule("b", 1001.0)
+    assert wheel.cancel("a")
+    assert not wheel.cancel("a")
+    wheel.schedule("b", 1005.0)
+
+    clock.now = 1002.0
+    assert wheel.advance() == []
+    clock.now = 1005.0
+    assert wheel.advance() == ["b"]
@@ -0,0 +1,111 @@
+import heapq
+from typing import Dict, Iterator, List
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import Config
+from models.restaurant import Restaurant
+from data.data_manager import get_restaurants
+from tools.availability import get_day_occupancy, resolve_restaurant
+from utils.validators import validate_datetime
+from utils.time_utils import (
+    current_day_and_minute,
+    date_to_ordinal,
+    minutes_to_time,
+    operating_window,
+    ordinal_to_date,
+    slot_minutes,
+    time_to_minutes,
+    weekday_name
+)
+
+def find_alternatives(
+    restaurant_id: str,
+    date: str,
+    time: str,
+    party_size: int,
+    k: int = 3
+) -> List[Dict]:
+    """
+    Find up to k bookable slots close to a requested one.
+
+    Candidates are ranked by restaurant (the requested one first, then others
+    with the same cuisine and location by rating), then by how many days after
+    the requested date, then by distance from the requested time. Each
+    restaurant-day is only loaded once the search reaches it, and the search
+    stops as soon as k slots are found. restaurant_id may also be a restaurant
+    name, matched approximately as for check_availability.
+    """
+    valid, error = validate_datetime(date, time)
+    if not valid:
+        raise ValueError(error)
+
+    restaurant = resolve_restaurant(restaurant_id)
+
+    sisters = sorted(
+        (
+            r for r in get_restaurants()
+            if r.id != restaurant.id
+            and r.cuisine.lower() == restaurant.cuisine.lower()
+            and r.location.lower() == restaurant.location.lower()
+        ),
+        key=lambda r: -r.rating
+    )
+    candidates = [restaurant] + sisters
+
+    first_day = date_to_ordinal(date)
+    requested = time_to_minutes(time)
+    last_day = first_day + Config.ALTERNATIVE_SEARCH_DAYS
+
+    # Entries are (priority, slot); a slot of None stands for a restaurant-day
+    # not yet loaded, whose priority is a lower bound on any slot it yields.
+    heap = [((rank, 0, 0, -1), (rank, first_day, None, None)) for rank in range(len(candidates))]
+
+    results = []
+    while heap and len(results) < k:
+        priority, (rank, day, minute, slots) = heapq.heappop(heap)
+        if minute is not None:
+            results.append({
+                "restaurant_id": candidates[rank].id,
+                "restaurant_name": candidates[rank].name,
+                "date": ordinal_to_date(day),
+                "time": minutes_to_time(minute)
+            })
+            _push_next(heap, rank, day, first_day, requested, slots)
+            continue
+
+        # Expand a restaurant-day into its free slots, closest first
+        if day < last_day:
+            heapq.heappush(heap, ((rank, day + 1 - first_day, 0, -1), (rank, day + 1, None, None)))
+        slots = _free_slots(candidates[rank], day, requested, party_size)
+        _push_next(heap, rank, day, first_day, requested, slots)
+
+    return results
+
+def _push_next(heap: list, rank: int, day: int, first_day: int, requested: int, slots: Iterator[int]):
+    minute = next(slots, None)
+    if minute is not None:
+        priority = (rank, day - first_day, abs(minute - requested), minute)
+        heapq.heappush(heap, (priority, (rank, day, minute, slots)))
+
+def _free_slots(restaurant: Restaurant, day: int, requested: int, party_size: int) -> Iterator[int]:
+    """Bookable start minutes on a day, ordered by distance from the requested time."""
+    hours = operating_window(restaurant.operating_hours, weekday_name(day))
+    if not hours:
+        return iter(())
+    minutes = slot_minutes(hours[0], hours[1], Config.TIME_SLOT_INTERVAL)
+    today, now = current_day_and_minute()
+    if day == today:
+        minutes = [m for m in minutes if m > now]
+    if not minutes:
+        return iter(())
+
+    occupancy = get_day_occupancy(restaurant, ordinal_to_date(day))
+    free = occupancy.can_seat(minutes, party_size)
+    return iter(sorted(
+        (m for m, ok in zip(minutes, free) if ok),
+        key=lambda m: (abs(m - requested), m)
+    ))
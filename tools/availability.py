@@ -1,25 +1,106 @@
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from app.config import Config
+from models.reservation import Reservation
 from models.restaurant import Restaurant
-from data.data_manager import get_restaurants, get_reservations
+from data.data_manager import (
+    add_reload_listener,
+    add_reservation_listener,
+    get_restaurant,
+    get_restaurant_reservations,
+    get_reservations_by_restaurant_date
+)
+from data.availability_cache import AvailabilityCache
+from data.holds import HoldRegistry
+from data.occupancy import DayOccupancy, OccupancyIndex, can_seat_many
+from tools.search import get_search_index, resolve_restaurant_id
 from utils.validators import validate_datetime
-from utils.time_utils import get_time_slots
+from utils.time_utils import (
+    current_day_and_minute,
+    date_to_ordinal,
+    minutes_to_time,
+    operating_window,
+    slot_minutes,
+    time_to_minutes,
+    weekday_name
+)
+
+# Per-restaurant, per-day table assignments; kept current by reservation writes
+occupancy_index = OccupancyIndex(Config.DEFAULT_TURN_TIME, Config.MAX_COMBINED_TABLES)
+add_reservation_listener(occupancy_index.apply)
+
+# Answers to repeated check_availability calls; a write drops its restaurant-day
+availability_cache = AvailabilityCache(Config.AVAILABILITY_CACHE_SIZE)
+add_reservation_listener(availability_cache.apply)
+add_reload_listener(occupancy_index.clear)
+add_reload_listener(availability_cache.invalidate_all)
+
+def _hold_changed(old: Optional[Reservation], new: Optional[Reservation]):
+    occupancy_index.apply(old, new)
+    availability_cache.apply(old, new)
+
+# Tentative holds count against availability until confirmed or expired
+hold_registry = HoldRegistry(_hold_changed)
+
+def get_day_occupancy(restaurant: Restaurant, date: str) -> DayOccupancy:
+    """Get table assignments for a restaurant on a date, including live holds."""
+    hold_registry.expire()
+    return occupancy_index.get(
+        restaurant,
+        date,
+        lambda: (
+            get_restaurant_reservations(restaurant.id, date, status="confirmed")
+            + hold_registry.for_day(restaurant.id, date)
+        )
+    )
+
+def resolve_restaurant(restaurant_id: str, exact: bool = False) -> Restaurant:
+    """
+    Get a restaurant by id, or failing that by name. Tools that accept either
+    resolve once and use the returned restaurant's id from then on. Reads match
+    the name approximately; bookings pass exact=True, which accepts only a name
+    belonging to exactly one restaurant and otherwise names the candidates.
+    """
+    restaurant = get_restaurant(restaurant_id)
+    if not restaurant:
+        resolved = _exactly_named(restaurant_id) if exact else resolve_restaurant_id(restaurant_id)
+        restaurant = get_restaurant(resolved) if resolved else None
+    if not restaurant:
+        raise ValueError("Restaurant not found")
+    return restaurant
+
+def _exactly_named(name: str) -> str:
+    """Id of the one restaurant with this name, ignoring case; ValueError otherwise."""
+    matches = [r for r, _ in get_search_index().find_by_name(name, Config.FUZZY_MATCH_THRESHOLD)]
+    named = [r for r in matches if r.name.strip().lower() == name.strip().lower()]
+    if len(named) == 1:
+        return named[0].id
+    candidates = ", ".join(f"{r.name} ({r.id})" for r in (named or matches)[:Config.MAX_SEARCH_RESULTS])
+    if named:
+        raise ValueError(f"Several restaurants are named {name}: {candidates}")
+    if candidates:
+        raise ValueError(f"Restaurant not found: {name}. Did you mean: {candidates}")
+    raise ValueError("Restaurant not found")
 
 def check_availability(
     restaurant_id: str,
     date: str,
     time: str,
-    party_size: int
+    party_size: int,
+    ignore_reservation_id: Optional[str] = None
 ) -> List[str]:
     """
     Check available time slots for a given restaurant and party size.
     Returns list of available times around the requested time.
+    Pass ignore_reservation_id when moving a booking so it does not block itself.
+    restaurant_id may also be a restaurant name, matched approximately.
     """
     # Validate inputs
     valid, error = validate_datetime(date, time)
@@ -27,61 +108,151 @@ def check_availability(
         raise ValueError(error)
 
     # Get restaurant and current reservations
-    restaurant = next((r for r in get_restaurants() if r.id == restaurant_id), None)
-    if not restaurant:
-        raise ValueError("Restaurant not found")
+    restaurant = resolve_restaurant(restaurant_id)
+    return restaurant_availability(restaurant, date, time, party_size, ignore_reservation_id)
 
+def restaurant_availability(
+    restaurant: Restaurant,
+    date: str,
+    time: str,
+    party_size: int,
+    ignore_reservation_id: Optional[str] = None
+) -> List[str]:
+    """check_availability for a restaurant already in hand; inputs must be validated."""
+    hold_registry.expire()
+    key = (restaurant.id, date, time, party_size, ignore_reservation_id)
+    cached, generation = availability_cache.get(key, restaurant)
+    if cached is not None:
+        return cached
+
+    available = _available_slots(restaurant, date, time, party_size, ignore_reservation_id)
+    availability_cache.put(key, restaurant, available, generation)
+    return available
+
+def _available_slots(
+    restaurant: Restaurant,
+    date: str,
+    time: str,
+    party_size: int,
+    ignore_reservation_id: Optional[str]
+) -> List[str]:
     # Check if restaurant has tables that can accommodate the party
-    suitable_tables = [t for t in restaurant.tables if t.seats >= party_size]
-    if not suitable_tables:
+    occupancy = get_day_occupancy(restaurant, date)
+    if party_size > occupancy.max_party_size:
         return []
 
-    # Get existing reservations for the date
-    existing_reservations = [
-        r for r in get_reservations()
-        if r.restaurant_id == restaurant_id and r.date == date and r.status == "confirmed"
-    ]
-
-    # Get day of week for operating hours
-    day_of_week = datetime.strptime(date, "%Y-%m-%d").strftime("%A")
-    operating_hours = restaurant.operating_hours.get(day_of_week, {})
-    if not operating_hours:
+    # Get operating hours for the day of week
+    hours = operating_window(restaurant.operating_hours, weekday_name(date_to_ordinal(date)))
+    if not hours:
         return []
 
-    # Generate time slots around requested time
-    requested_dt = datetime.strptime(time, "%H:%M")
-    start_time = (requested_dt - timedelta(hours=1)).strftime("%H:%M")
-    end_time = (requested_dt + timedelta(hours=1)).strftime("%H:%M")
-    
-    # Ensure we're within operating hours
-    start_time = max(start_time, operating_hours["open"])
-    end_time = min(end_time, operating_hours["close"])
-    
-    potential_slots = get_time_slots(start_time, end_time)
-    available_slots = []
-
-    # Check each time slot
-    for slot in potential_slots:
-        total_seats_available = sum(table.seats for table in suitable_tables)
-        
-        # Subtract seats that are already reserved
-        for reservation in existing_reservations:
-            if reservation.time == slot:
-                total_seats_available -= reservation.party_size
-
-        # If we have enough seats available, add the slot
-        if total_seats_available >= party_size:
-            available_slots.append(slot)
-
-    return available_slots
+    # Generate slots within an hour of the requested time, inside operating hours
+    requested = time_to_minutes(time)
+    start = max(requested - 60, hours[0])
+    end = min(requested + 60, hours[1])
+    potential_slots = slot_minutes(start, end, Config.TIME_SLOT_INTERVAL)
+
+    # Check every slot at once against the per-table schedules for the day
+    can_seat = occupancy.can_seat(potential_slots, party_size, ignore_reservation_id)
+
+    return [minutes_to_time(slot) for slot, ok in zip(potential_slots, can_seat) if ok]
+
+def check_availability_many(
+    restaurant_ids: List[str],
+    dates: List[str],
+    time_window: Tuple[str, str],
+    party_size: int
+) -> Dict:
+    """
+    Check availability for several restaurants and dates in one pass.
+    time_window is a (start, end) pair of HH:MM times. Returns the candidate
+    times and an availability matrix indexed [restaurant][date][time].
+    """
+    start_time, end_time = time_window
+    for date in dates:
+        valid, error = validate_datetime(date, end_time)
+        if not valid:
+            raise ValueError(error)
+
+    restaurants = []
+    for restaurant_id in restaurant_ids:
+        restaurant = get_restaurant(restaurant_id)
+        if not restaurant:
+            raise ValueError(f"Restaurant not found: {restaurant_id}")
+        restaurants.append(restaurant)
+
+    minutes = np.array(
+        slot_minutes(time_to_minutes(start_time), time_to_minutes(end_time), Config.TIME_SLOT_INTERVAL),
+        dtype=np.int64
+    )
+
+    # Reservations for every pair not already indexed come from a single fetch
+    pairs = [(restaurant, date) for restaurant in restaurants for date in dates]
+    days = get_days_occupancy(pairs)
+    available = can_seat_many(days, minutes, party_size)
+
+    # Restrict each row to its operating hours and to times not already past
+    today, now = current_day_and_minute()
+    ordinals = {date: date_to_ordinal(date) for date in dates}
+    for row, (restaurant, date) in enumerate(pairs):
+        hours = operating_window(restaurant.operating_hours, weekday_name(ordinals[date]))
+        if not hours:
+            available[row] = False
+            continue
+        available[row] &= (minutes >= hours[0]) & (minutes <= hours[1])
+        if ordinals[date] == today:
+            available[row] &= minutes > now
+
+    return {
+        "restaurant_ids": [r.id for r in restaurants],
+        "dates": list(dates),
+        "times": [minutes_to_time(m) for m in minutes.tolist()],
+        "available": available.reshape(len(restaurants), len(dates), len(minutes)).tolist()
+    }
+
+def get_days_occupancy(pairs: List[Tuple[Restaurant, str]]) -> List[DayOccupancy]:
+    """get_day_occupancy for several restaurant-days, loading the missing ones in one fetch."""
+    hold_registry.expire()
+    return occupancy_index.get_many(pairs, _load_days)
+
+def _load_days(keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Reservation]]:
+    """Confirmed reservations and live holds for several (restaurant_id, date) pairs."""
+    loaded = get_reservations_by_restaurant_date(
+        {restaurant_id for restaurant_id, _ in keys},
+        {date for _, date in keys},
+        status="confirmed"
+    )
+    for key in keys:
+        held = hold_registry.for_day(*key)
+        if held:
+            loaded[key] = loaded.get(key, []) + held
+    return loaded
+
+def assign_tables(
+    restaurant_id: str,
+    date: str,
+    time: str,
+    party_size: int,
+    ignore_reservation_id: Optional[str] = None
+) -> Optional[List[str]]:
+    """
+    Choose the tables a party would be seated at: the smallest free table that
+    fits, or the smallest run of adjacent tables. Returns None if nothing fits.
+    restaurant_id may also be a restaurant name, as for check_availability.
+    """
+    restaurant = resolve_restaurant(restaurant_id)
+    return get_day_occupancy(restaurant, date).allocate(time_to_minutes(time), party_size, ignore_reservation_id)
 
 def is_table_available(
     table: 'Table',
     time_slot: str,
-    existing_reservations: List['Reservation']
+    existing_reservations: List['Reservation'],
+    turn_time: int = Config.DEFAULT_TURN_TIME
 ) -> bool:
-    """Check if a specific table is available at a given time."""
+    """Check if a specific table is free for a full turn starting at time_slot."""
+    start = time_to_minutes(time_slot)
     return not any(
-        reservation.time == time_slot
+        table.id in reservation.table_ids
+        and abs(time_to_minutes(reservation.time) - start) < turn_time
         for reservation in existing_reservations
     )
\ No newline at end of file
@@ -0,0 +1,102 @@
+from typing import Dict, Optional
+import time as _time
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import Config
+from models.hold import Hold
+from models.reservation import Reservation
+from tools.availability import (
+    assign_tables,
+    check_availability,
+    get_day_occupancy,
+    hold_registry,
+    resolve_restaurant
+)
+from data.data_manager import new_reservation_id, save_reservation, transaction
+from utils.validators import validate_datetime, validate_party_size
+from utils.time_utils import time_to_minutes
+from utils.id_generator import IdGenerator, default_worker_id
+
+# Holds live only in this process, so their ids need not be unique across workers
+hold_ids = IdGenerator(default_worker_id(Config.WORKER_ID), prefix="hold_")
+
+def hold_slot(
+    restaurant_id: str,
+    date: str,
+    time: str,
+    party_size: int,
+    ttl: int = Config.HOLD_TTL_SECONDS
+) -> Optional[Hold]:
+    """
+    Hold tables for a party for ttl seconds while the booking is confirmed.
+    Returns None if the slot is not available.
+    """
+    if not validate_party_size(party_size):
+        raise ValueError("Invalid party size")
+    if not 0 < ttl <= Config.MAX_HOLD_TTL_SECONDS:
+        raise ValueError(f"Hold time must be between 1 and {Config.MAX_HOLD_TTL_SECONDS} seconds")
+
+    valid, error = validate_datetime(date, time)
+    if not valid:
+        raise ValueError(error)
+    restaurant_id = resolve_restaurant(restaurant_id, exact=True).id
+
+    with transaction():
+        if time not in check_availability(restaurant_id, date, time, party_size):
+            return None
+        table_ids = assign_tables(restaurant_id, date, time, party_size)
+        if not table_ids:
+            return None
+
+        hold = Hold(
+            id=hold_ids.next_id(),
+            restaurant_id=restaurant_id,
+            date=date,
+            time=time,
+            party_size=party_size,
+            expires_at=_time.time() + ttl,
+            table_ids=table_ids
+        )
+        hold_registry.place(hold)
+    return hold
+
+def confirm_hold(hold_id: str, customer_details: Dict) -> Optional[Reservation]:
+    """
+    Turn a live hold into a confirmed reservation on the same tables.
+    Returns None if the hold has expired or does not exist, or if another
+    process booked its tables meanwhile, in which case the hold is released.
+    """
+    with transaction():
+        hold = hold_registry.get(hold_id)
+        if hold is None:
+            return None
+
+        # Holds are per process, so check the tables against what is committed
+        occupancy = get_day_occupancy(resolve_restaurant(hold.restaurant_id), hold.date)
+        if not occupancy.tables_free(hold.table_ids, time_to_minutes(hold.time), hold.party_size, hold.id):
+            hold_registry.release(hold_id)
+            return None
+
+        reservation = Reservation(
+            id=new_reservation_id(),
+            restaurant_id=hold.restaurant_id,
+            customer_id=customer_details.get('id', 'unknown'),
+            date=hold.date,
+            time=hold.time,
+            party_size=hold.party_size,
+            status='confirmed',
+            table_ids=hold.table_ids
+        )
+        save_reservation(reservation)
+
+    # Released only once the reservation is written, so the tables are never free in between
+    hold_registry.release(hold_id)
+    return reservation
+
+def release_hold(hold_id: str) -> bool:
+    """Give up a hold before it expires."""
+    return hold_registry.release(hold_id) is not None
@@ -0,0 +1,76 @@
+import heapq
+from typing import Dict, List, Optional
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import Config
+from tools.availability import get_days_occupancy, restaurant_availability
+from tools.search import get_search_index
+from utils.validators import validate_datetime, validate_party_size
+from utils.time_utils import date_to_ordinal, operating_window, time_to_minutes, weekday_name
+
+def find_tables(
+    cuisine: Optional[str] = None,
+    location: Optional[str] = None,
+    price_range: Optional[int] = None,
+    *,
+    date: str,
+    time: str,
+    party_size: int
+) -> List[Dict]:
+    """
+    Find restaurants matching the criteria that can seat the party around the
+    requested time, best first, as dicts of restaurant and available_times.
+
+    Filters run cheapest first: the search index bitsets, then a bound on
+    the largest party the tables could seat, then opening hours. Survivors are
+    probed in score order, a batch at a time with one reservation fetch per
+    batch, until Config.MAX_SEARCH_RESULTS bookable restaurants are found.
+    """
+    valid, error = validate_datetime(date, time)
+    if not valid:
+        raise ValueError(error)
+    if not validate_party_size(party_size):
+        raise ValueError(f"Party size must be between {Config.MIN_PARTY_SIZE} and {Config.MAX_PARTY_SIZE}")
+    if price_range is not None and price_range < 1:
+        raise ValueError("Price range must be a positive integer")
+
+    index = get_search_index()
+    mask = index.match(
+        cuisine, location, price_range,
+        fuzzy=True, threshold=Config.FUZZY_MATCH_THRESHOLD
+    )
+    # No party is seated across more than MAX_COMBINED_TABLES tables
+    mask = mask & (index.max_table_size * Config.MAX_COMBINED_TABLES >= party_size)
+
+    weekday = weekday_name(date_to_ordinal(date))
+    requested = time_to_minutes(time)
+    scores = index.scores(price_range, party_size, Config.SEARCH_SCORE_WEIGHTS)
+    ranked = [
+        (-scores[i], i) for i in np.flatnonzero(mask).tolist()
+        if _open_near(index.restaurants[i].operating_hours, weekday, requested)
+    ]
+    heapq.heapify(ranked)
+
+    results = []
+    while ranked and len(results) < Config.MAX_SEARCH_RESULTS:
+        batch = [
+            index.restaurants[heapq.heappop(ranked)[1]]
+            for _ in range(min(Config.MAX_SEARCH_RESULTS - len(results), len(ranked)))
+        ]
+        get_days_occupancy([(restaurant, date) for restaurant in batch])
+        for restaurant in batch:
+            times = restaurant_availability(restaurant, date, time, party_size)
+            if times:
+                results.append({"restaurant": restaurant, "available_times": times})
+    return results
+
+def _open_near(operating_hours: Dict, weekday: str, requested: int) -> bool:
+    """Whether the restaurant is open within an hour of the requested minute."""
+    hours = operating_window(operating_hours, weekday)
+    return bool(hours) and hours[0] <= requested + 60 and requested - 60 <= hours[1]
@@ -1,5 +1,5 @@
-from typing import Optional, Dict
-from datetime import datetime
+from typing import Optional, Dict, List
+from dataclasses import replace
 import sys
 from pathlib import Path
 
@@ -7,14 +7,19 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from models.reservation import Reservation
-from tools.availability import check_availability
+from tools.availability import assign_tables, check_availability, resolve_restaurant
+from tools.waitlist import promote_waitlist
 from data.data_manager import (
-    get_reservations,
+    get_customer_reservations,
+    get_reservation,
     save_reservation,
     update_reservation,
-    get_restaurants
+    get_restaurants,
+    new_reservation_id,
+    transaction
 )
 from utils.validators import validate_datetime, validate_party_size
+from utils.time_utils import current_day_and_minute, minutes_to_time, ordinal_to_date
 
 def make_reservation(
     restaurant_id: str,
@@ -25,6 +30,7 @@ def make_reservation(
 ) -> Optional[Reservation]:
     """
     Create a new reservation if the slot is available.
+    restaurant_id may also be the exact name of a single restaurant.
     """
     # Validate inputs
     if not validate_party_size(party_size):
@@ -34,27 +40,82 @@ def make_reservation(
     if not valid:
         raise ValueError(error)
 
-    # Check availability
-    available_times = check_availability(restaurant_id, date, time, party_size)
-    if time not in available_times:
-        return None
-
-    # Create reservation
-    reservation_id = f"res_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    reservation = Reservation(
-        id=reservation_id,
-        restaurant_id=restaurant_id,
-        customer_id=customer_details.get('id', 'unknown'),
-        date=date,
-        time=time,
-        party_size=party_size,
-        status='confirmed'
-    )
-
-    # Save reservation
-    save_reservation(reservation)
+    # Only an unambiguous name is booked; the booking stores the id
+    restaurant_id = resolve_restaurant(restaurant_id, exact=True).id
+
+    # Check and book under one lock so no other session takes the table in between
+    with transaction():
+        available_times = check_availability(restaurant_id, date, time, party_size)
+        if time not in available_times:
+            return None
+
+        # Seat the party at concrete tables
+        table_ids = assign_tables(restaurant_id, date, time, party_size)
+        if not table_ids:
+            return None
+
+        # Create reservation
+        reservation_id = new_reservation_id()
+        reservation = Reservation(
+            id=reservation_id,
+            restaurant_id=restaurant_id,
+            customer_id=customer_details.get('id', 'unknown'),
+            date=date,
+            time=time,
+            party_size=party_size,
+            status='confirmed',
+            table_ids=table_ids
+        )
+
+        # Save reservation
+        save_reservation(reservation)
     return reservation
 
+class _BatchFailed(Exception):
+    """Raised inside a batch's transaction to roll every item back."""
+
+def make_reservations_batch(
+    reservations: List[Dict],
+    customer_details: Optional[Dict] = None
+) -> List[Dict]:
+    """
+    Book several parties, all or nothing, with a single write.
+
+    Each item has restaurant_id, date, time, party_size and optionally its own
+    customer_details (else the shared one is used). Every item is checked
+    against the same snapshot, later items seeing the tables taken by earlier
+    ones. Returns one result per item: {"success", "reservation", "error"}.
+    If any item fails, none are booked.
+    """
+    results = [{"success": False, "reservation": None, "error": None} for _ in reservations]
+    try:
+        with transaction():
+            for item, result in zip(reservations, results):
+                try:
+                    reservation = make_reservation(
+                        restaurant_id=item["restaurant_id"],
+                        date=item["date"],
+                        time=item["time"],
+                        party_size=item["party_size"],
+                        customer_details=item.get("customer_details") or customer_details or {}
+                    )
+                except KeyError as e:
+                    result["error"] = f"Missing field: {e.args[0]}"
+                except ValueError as e:
+                    result["error"] = str(e)
+                else:
+                    if reservation is None:
+                        result["error"] = "Slot not available"
+                    else:
+                        result.update(success=True, reservation=reservation)
+            if not all(result["success"] for result in results):
+                raise _BatchFailed()
+    except _BatchFailed:
+        for result in results:
+            if result["success"]:
+                result.update(success=False, reservation=None, error="Not booked because another item failed")
+    return results
+
 def modify_reservation(
     reservation_id: str,
     new_time: Optional[str] = None,
@@ -64,47 +125,89 @@ def modify_reservation(
     """
     Modify an existing reservation.
     """
-    # Get existing reservation
-    reservations = get_reservations()
-    reservation = next((r for r in reservations if r.id == reservation_id), None)
-    if not reservation:
-        return None
-
-    # Update fields if provided
-    if new_time:
-        # Check availability for new time
-        available_times = check_availability(
-            reservation.restaurant_id,
-            new_date or reservation.date,
-            new_time,
-            new_party_size or reservation.party_size
-        )
-        if new_time not in available_times:
+    with transaction():
+        # Get existing reservation
+        reservation = get_reservation(reservation_id)
+        if not reservation:
             return None
-        reservation.time = new_time
+        previous = replace(reservation)
+
+        # Update fields if provided
+        if new_time:
+            # Check availability for new time
+            available_times = check_availability(
+                reservation.restaurant_id,
+                new_date or reservation.date,
+                new_time,
+                new_party_size or reservation.party_size,
+                ignore_reservation_id=reservation.id
+            )
+            if new_time not in available_times:
+                return None
+            reservation.time = new_time
     
-    if new_date:
-        valid, error = validate_datetime(new_date, reservation.time)
-        if not valid:
-            raise ValueError(error)
-        reservation.date = new_date
+        if new_date:
+            valid, error = validate_datetime(new_date, reservation.time)
+            if not valid:
+                raise ValueError(error)
+            reservation.date = new_date
     
-    if new_party_size:
-        reservation.party_size = new_party_size
+        if new_party_size:
+            reservation.party_size = new_party_size
 
-    # Update reservation
-    update_reservation(reservation)
-    return reservation
+        # Move the booking onto tables that fit its new date, time and size
+        if new_time or new_date or new_party_size:
+            table_ids = assign_tables(
+                reservation.restaurant_id,
+                reservation.date,
+                reservation.time,
+                reservation.party_size,
+                ignore_reservation_id=reservation.id
+            )
+            if not table_ids:
+                return None
+            reservation.table_ids = table_ids
+
+        # Update reservation
+        update_reservation(reservation)
+
+        # Offer whatever the move freed up to waiting parties
+        if previous.status == "confirmed" and (
+            previous.date, previous.time, previous.party_size
+        ) != (reservation.date, reservation.time, reservation.party_size):
+            promote_waitlist(previous.restaurant_id, previous.date, previous.party_size)
+        return reservation
 
 def cancel_reservation(reservation_id: str) -> bool:
     """
     Cancel an existing reservation.
     """
-    reservations = get_reservations()
-    reservation = next((r for r in reservations if r.id == reservation_id), None)
-    if not reservation:
-        return False
-
-    reservation.status = "cancelled"
-    update_reservation(reservation)
-    return True
\ No newline at end of file
+    with transaction():
+        reservation = get_reservation(reservation_id)
+        if not reservation:
+            return False
+
+        was_confirmed = reservation.status == "confirmed"
+        reservation.status = "cancelled"
+        update_reservation(reservation)
+
+        # Offer the freed tables to waiting parties
+        if was_confirmed:
+            promote_waitlist(reservation.restaurant_id, reservation.date, reservation.party_size)
+        return True
+
+def list_customer_reservations(
+    customer_id: str,
+    status: Optional[str] = None,
+    upcoming_only: bool = True
+) -> List[Reservation]:
+    """
+    List a customer's reservations ordered by date and time, optionally by
+    status. By default only bookings that have not started yet are shown.
+    """
+    reservations = get_customer_reservations(customer_id, status)
+    if upcoming_only:
+        today, minute = current_day_and_minute()
+        now = (ordinal_to_date(today), minutes_to_time(minute))
+        reservations = [r for r in reservations if (r.date, r.time) >= now]
+    return reservations
@@ -1,12 +1,33 @@
 from typing import List, Optional, Union, Dict
+import base64
+import hashlib
+import json
 import sys
+import threading
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to Python path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from app.config import Config
 from models.restaurant import Restaurant, Table
 from data.data_manager import get_restaurants
+from data.search_index import RestaurantSearchIndex
+from data.text_index import TextIndex
+
+# (catalog list the index was built from, index); the catalog hands out the
+# same list object until it reloads, so identity marks the catalog version
+_search_index = (None, None)
+
+# Names and descriptions, updated in place when the catalog changes;
+# _text_indexed holds the text each restaurant id was last indexed with
+_text_index = TextIndex()
+_text_indexed: Dict[str, str] = {}
+_text_index_built_from = None
+# Sessions share the index; one of them at a time brings it up to date
+_text_index_lock = threading.Lock()
 
 def dict_to_restaurant(restaurant_dict: Dict) -> Restaurant:
     """Convert a dictionary to a Restaurant object."""
@@ -23,9 +44,45 @@ def dict_to_restaurant(restaurant_dict: Dict) -> Restaurant:
         tables=tables,
         operating_hours=restaurant_dict['operating_hours'],
         rating=restaurant_dict['rating'],
-        description=restaurant_dict['description']
+        description=restaurant_dict['description'],
+        turn_times=restaurant_dict.get('turn_times', {})
     )
 
+def get_search_index() -> RestaurantSearchIndex:
+    """Get the search index for the current catalog, building it on first use."""
+    global _search_index
+    restaurants = get_restaurants()
+    built_from, index = _search_index
+    if built_from is not restaurants:
+        index = RestaurantSearchIndex([
+            dict_to_restaurant(r) if isinstance(r, dict) else r
+            for r in restaurants
+        ])
+        _search_index = (restaurants, index)
+    return index
+
+def get_text_index() -> TextIndex:
+    """
+    Get the description index for the current catalog. When the catalog
+    reloads only restaurants whose name or description changed are reindexed.
+    """
+    global _text_index_built_from
+    index = get_search_index()
+    if _text_index_built_from is not index:
+        with _text_index_lock:
+            # Another session may have caught up while we waited
+            if _text_index_built_from is not index:
+                current = {r.id: f"{r.name}. {r.description}" for r in index.restaurants}
+                for restaurant_id in _text_indexed.keys() - current.keys():
+                    _text_index.remove(restaurant_id)
+                    del _text_indexed[restaurant_id]
+                for restaurant_id, text in current.items():
+                    if _text_indexed.get(restaurant_id) != text:
+                        _text_index.set(restaurant_id, text)
+                        _text_indexed[restaurant_id] = text
+                _text_index_built_from = index
+    return _text_index
+
 def search_restaurants(
     cuisine: Optional[str] = None,
     location: Optional[str] = None,
@@ -34,28 +91,105 @@ def search_restaurants(
 ) -> List[Restaurant]:
     """
     Search restaurants based on various criteria.
+    Returns the best Config.MAX_SEARCH_RESULTS matches, highest score first.
     """
+    return search_restaurants_page(cuisine, location, price_range, seating_required)["results"]
 
+def search_restaurants_page(
+    cuisine: Optional[str] = None,
+    location: Optional[str] = None,
+    price_range: Optional[int] = None,
+    seating_required: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Config.MAX_SEARCH_RESULTS
+) -> Dict:
+    """
+    One page of ranked search results. Pass the returned next_cursor back with
+    the same criteria to get the following page; it is None on the last page.
+    """
     if price_range is not None and price_range < 1:
         raise ValueError("Price range must be a positive integer")
     if seating_required is not None and seating_required < 1:
         raise ValueError("Seating required must be a positive integer")
+    if not 1 <= limit <= Config.MAX_SEARCH_RESULTS:
+        raise ValueError(f"Limit must be between 1 and {Config.MAX_SEARCH_RESULTS}")
 
-    restaurants = get_restaurants()
+    query = _query_digest(cuisine, location, price_range, seating_required)
+    offset = _decode_cursor(cursor, query) if cursor else 0
+
+    index = get_search_index()
+    mask = index.match(
+        cuisine, location, price_range, seating_required,
+        fuzzy=True, threshold=Config.FUZZY_MATCH_THRESHOLD
+    )
+    scores = index.scores(price_range, seating_required, Config.SEARCH_SCORE_WEIGHTS)
+    # Only the pages up to this one are ever ranked
+    ranked = index.top(mask, scores, offset + limit + 1)
+
+    page = [index.restaurants[i] for i in ranked[offset:offset + limit]]
+    more = len(ranked) > offset + limit
+    return {
+        "results": page,
+        "next_cursor": _encode_cursor(offset + limit, query) if more else None
+    }
+
+def search_restaurants_by_description(
+    query: str,
+    cuisine: Optional[str] = None,
+    location: Optional[str] = None,
+    price_range: Optional[int] = None,
+    seating_required: Optional[int] = None
+) -> List[Restaurant]:
+    """
+    Restaurants whose name and description best match free text such as
+    "cozy romantic place", optionally narrowed by the usual criteria.
+    """
+    if not query or not query.strip():
+        raise ValueError("Search text is required")
+    index = get_search_index()
+    text_index = get_text_index()
+
+    keys = None
+    if cuisine or location or price_range or seating_required:
+        mask = index.match(
+            cuisine, location, price_range, seating_required,
+            fuzzy=True, threshold=Config.FUZZY_MATCH_THRESHOLD
+        )
+        keys = [index.restaurants[i].id for i in np.flatnonzero(mask)]
+
+    by_id = {r.id: r for r in index.restaurants}
+    with _text_index_lock:
+        # Updates resize the matrix in place, so never read it mid-update
+        ranked = text_index.search(query, Config.MAX_SEARCH_RESULTS, keys)
+    return [by_id[restaurant_id] for restaurant_id, _ in ranked]
+
+def find_restaurants_by_name(name: str) -> List[Restaurant]:
+    """
+    Restaurants whose name is close to the given one, best match first.
+    Tolerates typos and partial names.
+    """
+    if not name or not name.strip():
+        raise ValueError("Restaurant name is required")
+    matches = get_search_index().find_by_name(name, Config.FUZZY_MATCH_THRESHOLD)
+    return [restaurant for restaurant, _ in matches[:Config.MAX_SEARCH_RESULTS]]
+
+def resolve_restaurant_id(name_or_id: str) -> Optional[str]:
+    """Id of the restaurant best matching a name, or None if nothing is close."""
+    matches = get_search_index().find_by_name(name_or_id, Config.FUZZY_MATCH_THRESHOLD)
+    return matches[0][0].id if matches else None
+
+def _query_digest(*criteria) -> str:
+    normalised = [c.lower() if isinstance(c, str) else c for c in criteria]
+    return hashlib.sha1(json.dumps(normalised).encode()).hexdigest()[:12]
+
+def _encode_cursor(offset: int, query: str) -> str:
+    return base64.urlsafe_b64encode(json.dumps([offset, query]).encode()).decode()
 
-    # Convert dictionaries to Restaurant objects if needed
-    results = [
-        dict_to_restaurant(r) if isinstance(r, dict) else r 
-        for r in restaurants
-    ]
-
-    if cuisine:
-        results = [r for r in results if r.cuisine.lower() == cuisine.lower()]
-    if location:
-        results = [r for r in results if location.lower() in r.location.lower()]
-    if price_range:
-        results = [r for r in results if r.price_range <= price_range]
-    if seating_required:
-        results = [r for r in results if any(t.seats >= seating_required for t in r.tables)]
-
-    return results
\ No newline at end of file
+def _decode_cursor(cursor: str, query: str) -> int:
+    try:
+        offset, cursor_query = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if cursor_query != query or not isinstance(offset, int) or offset < 0:
+        raise ValueError("Cursor does not belong to this search")
+    return offset
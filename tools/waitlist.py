@@ -0,0 +1,101 @@
+from typing import Dict, List, Optional
+import os
+import time as _time
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.config import Config
+from models.reservation import Reservation
+from models.waitlist_entry import WaitlistEntry
+from tools.availability import assign_tables, check_availability, resolve_restaurant
+from data.data_manager import new_reservation_id, save_reservation, store_directory, transaction
+from data.waitlist import Waitlist
+from utils.validators import validate_datetime, validate_party_size
+from utils.id_generator import IdGenerator, default_worker_id
+
+# Shared with every process using the same reservation store
+waitlist = Waitlist(os.path.join(store_directory(), 'waitlist.jsonl'))
+waitlist_ids = IdGenerator(default_worker_id(Config.WORKER_ID), prefix="wait_")
+
+def join_waitlist(
+    restaurant_id: str,
+    date: str,
+    time: str,
+    party_size: int,
+    customer_details: Dict
+) -> WaitlistEntry:
+    """
+    Put a party on the waitlist for a full slot. It is booked automatically
+    if a cancellation or change frees a table at that time.
+    """
+    if not validate_party_size(party_size):
+        raise ValueError("Invalid party size")
+
+    valid, error = validate_datetime(date, time)
+    if not valid:
+        raise ValueError(error)
+
+    restaurant_id = resolve_restaurant(restaurant_id, exact=True).id
+
+    entry = WaitlistEntry(
+        id=waitlist_ids.next_id(),
+        restaurant_id=restaurant_id,
+        customer_id=customer_details.get('id', 'unknown'),
+        date=date,
+        time=time,
+        party_size=party_size,
+        requested_at=_time.time()
+    )
+    waitlist.add(entry)
+    return entry
+
+def leave_waitlist(entry_id: str) -> bool:
+    """Take a party off the waitlist."""
+    return waitlist.mark(entry_id, "withdrawn")
+
+def promote_waitlist(restaurant_id: str, date: str, freed_party_size: Optional[int] = None) -> List[Reservation]:
+    """
+    Book waiting parties into capacity freed on a restaurant's date.
+
+    Parties no larger than the booking that freed the space go first, since
+    they fit the tables it left; within that, earliest request first. Parties
+    whose time has passed are skipped. Runs in the caller's transaction when
+    there is one, and entries only leave the waitlist once the bookings are
+    committed, so another process promoting at the same time sees them gone.
+    """
+    promoted = []
+    with transaction() as uow:
+        candidates = waitlist.waiting(restaurant_id, date)
+        if freed_party_size is not None:
+            candidates.sort(key=lambda entry: entry.party_size > freed_party_size)
+
+        for entry in candidates:
+            try:
+                available = check_availability(restaurant_id, date, entry.time, entry.party_size)
+            except ValueError:
+                # The requested time passed since the waitlist was read
+                continue
+            if entry.time not in available:
+                continue
+            table_ids = assign_tables(restaurant_id, date, entry.time, entry.party_size)
+            if not table_ids:
+                continue
+
+            reservation = Reservation(
+                id=new_reservation_id(),
+                restaurant_id=restaurant_id,
+                customer_id=entry.customer_id,
+                date=date,
+                time=entry.time,
+                party_size=entry.party_size,
+                status='confirmed',
+                table_ids=table_ids
+            )
+            save_reservation(reservation)
+            uow.after_commit(lambda entry_id=entry.id, reservation_id=reservation.id:
+                             waitlist.mark(entry_id, "promoted", reservation_id))
+            promoted.append(reservation)
+    return promoted
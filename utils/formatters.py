@@ -17,5 +17,6 @@ def format_reservation_info(reservation: Reservation) -> str:
     📅 Date: {reservation.date}
     🕒 Time: {reservation.time}
     👥 Party Size: {reservation.party_size}
+    🪑 Tables: {', '.join(reservation.table_ids) or 'To be assigned'}
     Status: {reservation.status.capitalize()}
     """
\ No newline at end of file
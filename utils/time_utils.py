@@ -1,4 +1,14 @@
-from datetime import datetime, timedelta
+import time as _time
+from collections import OrderedDict
+from datetime import date as _date, datetime
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Times are handled as minutes since midnight and dates as proleptic Gregorian
+# ordinals (date.toordinal()); strings only appear at the edges.
+MINUTES_PER_DAY = 24 * 60
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+_TIME_LABELS = tuple(f"{m // 60:02d}:{m % 60:02d}" for m in range(MINUTES_PER_DAY))
 
 def parse_time_slot(time_str: str) -> datetime:
     """Convert time string to datetime object."""
@@ -7,23 +17,100 @@ def parse_time_slot(time_str: str) -> datetime:
     except ValueError:
         raise ValueError("Invalid time format. Please use HH:MM format.")
 
+@lru_cache(maxsize=4096)
+def time_to_minutes(time_str: str) -> int:
+    """Convert an HH:MM string to minutes since midnight."""
+    hours, sep, minutes = time_str.partition(":")
+    if (
+        not sep
+        or not (hours.isdigit() and 1 <= len(hours) <= 2)
+        or not (minutes.isdigit() and 1 <= len(minutes) <= 2)
+        or int(hours) > 23
+        or int(minutes) > 59
+    ):
+        raise ValueError("Invalid time format. Please use HH:MM format.")
+    return int(hours) * 60 + int(minutes)
+
+def minutes_to_time(minutes: int) -> str:
+    """Convert minutes since midnight to an HH:MM string."""
+    if 0 <= minutes < MINUTES_PER_DAY:
+        return _TIME_LABELS[minutes]
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+@lru_cache(maxsize=4096)
+def date_to_ordinal(date_str: str) -> int:
+    """Convert a YYYY-MM-DD string to a day ordinal."""
+    try:
+        year, month, day = date_str.split("-")
+        return _date(int(year), int(month), int(day)).toordinal()
+    except (TypeError, ValueError):
+        raise ValueError("Invalid date format. Please use YYYY-MM-DD format.")
+
+def ordinal_to_date(ordinal: int) -> str:
+    """Convert a day ordinal back to a YYYY-MM-DD string."""
+    return _date.fromordinal(ordinal).isoformat()
+
+def weekday_name(ordinal: int) -> str:
+    """Name of the weekday for a day ordinal; ordinal 1 (0001-01-01) is a Monday."""
+    return WEEKDAYS[(ordinal - 1) % 7]
+
+@lru_cache(maxsize=None)
+def day_slots(interval: int) -> Tuple[int, ...]:
+    """Start minute of every slot in a day for the given interval."""
+    return tuple(range(0, MINUTES_PER_DAY, interval))
+
+def slot_minutes(start: int, end: int, interval: int = 30) -> Tuple[int, ...]:
+    """Slot start minutes from start to end inclusive, stepping by interval."""
+    if start % interval == 0:
+        # On the interval grid, so slice the precomputed table
+        return day_slots(interval)[start // interval:max(end, start - 1) // interval + 1]
+    return tuple(range(start, end + 1, interval))
+
 def get_time_slots(start_time: str, end_time: str, interval: int = 30) -> list[str]:
     """Generate time slots between start and end time."""
-    start = parse_time_slot(start_time)
-    end = parse_time_slot(end_time)
-    
-    slots = []
-    current = start
-    while current <= end:
-        slots.append(current.strftime("%H:%M"))
-        current += timedelta(minutes=interval)
-    
-    return slots
+    start = time_to_minutes(start_time)
+    end = time_to_minutes(end_time)
+    return [_TIME_LABELS[m] for m in slot_minutes(start, end, interval)]
+
+# Identity-keyed, since the catalog shares restaurant objects until it reloads
+_operating_windows: "OrderedDict[int, tuple]" = OrderedDict()
+_OPERATING_WINDOWS_MAX = 4096
+
+def operating_window(
+    operating_hours: Dict[str, Dict[str, str]],
+    weekday: str
+) -> Optional[Tuple[int, int]]:
+    """
+    Opening and closing minute for a weekday, or None when closed. Each
+    operating_hours dict is parsed once and its windows cached per weekday.
+    """
+    entry = _operating_windows.get(id(operating_hours))
+    if entry is None or entry[0] is not operating_hours:
+        windows = {
+            day: (time_to_minutes(hours["open"]), time_to_minutes(hours["close"]))
+            for day, hours in operating_hours.items()
+            if hours
+        }
+        entry = (operating_hours, windows)
+        _operating_windows[id(operating_hours)] = entry
+        if len(_operating_windows) > _OPERATING_WINDOWS_MAX:
+            _operating_windows.popitem(last=False)
+    return entry[1].get(weekday)
+
+_clock = (None, (0, 0))
+
+def current_day_and_minute() -> Tuple[int, int]:
+    """Today's ordinal and the current minute of the day, recomputed at most once a second."""
+    global _clock
+    second = int(_time.time())
+    if _clock[0] != second:
+        now = datetime.now()
+        _clock = (second, (now.toordinal(), now.hour * 60 + now.minute))
+    return _clock[1]
 
 def is_valid_date(date_str: str) -> bool:
     """Check if date string is valid and not in the past."""
     try:
-        date = datetime.strptime(date_str, "%Y-%m-%d")
-        return date.date() >= datetime.now().date()
+        return date_to_ordinal(date_str) >= current_day_and_minute()[0]
     except ValueError:
-        return False
\ No newline at end of file
+        return False
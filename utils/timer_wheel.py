@@ -0,0 +1,80 @@
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel with lazy advancement.
+
+    A deadline is hashed into one of ``slots`` buckets by its tick, so
+    scheduling and cancelling are O(1). Nothing runs in the background:
+    ``advance()`` walks only the buckets for ticks that passed since the last
+    call (at most one full turn) and returns the keys that are due. Entries
+    further out than one turn share a bucket with nearer ones and are simply
+    left in place until their own tick comes round.
+    """
+
+    def __init__(
+        self,
+        tick_seconds: float = 1.0,
+        slots: int = 512,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.tick_seconds = tick_seconds
+        self.slots = slots
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: List[Dict[Hashable, int]] = [{} for _ in range(slots)]
+        self._deadlines: Dict[Hashable, int] = {}
+        self._current_tick = self._tick(clock())
+
+    def _tick(self, seconds: float) -> int:
+        return int(seconds // self.tick_seconds)
+
+    def _deadline_tick(self, seconds: float) -> int:
+        # Rounded up, so nothing fires before its deadline
+        return int(-(-seconds // self.tick_seconds))
+
+    def schedule(self, key: Hashable, deadline: float):
+        """Fire ``key`` once the clock reaches ``deadline`` (replacing any earlier schedule)."""
+        tick = max(self._deadline_tick(deadline), self._current_tick + 1)
+        with self._lock:
+            self._remove(key)
+            self._buckets[tick % self.slots][key] = tick
+            self._deadlines[key] = tick
+
+    def cancel(self, key: Hashable) -> bool:
+        """Forget ``key``. Returns False if it was not scheduled."""
+        with self._lock:
+            return self._remove(key)
+
+    def _remove(self, key: Hashable) -> bool:
+        tick = self._deadlines.pop(key, None)
+        if tick is None:
+            return False
+        del self._buckets[tick % self.slots][key]
+        return True
+
+    def advance(self, now: Optional[float] = None) -> List[Hashable]:
+        """Move the wheel to ``now`` and return the keys that came due, earliest first."""
+        target = self._tick(self._clock() if now is None else now)
+        with self._lock:
+            if target <= self._current_tick:
+                return []
+            first = self._current_tick + 1
+            # After a full turn every bucket has been visited once
+            ticks = range(first, min(target, first + self.slots - 1) + 1)
+            due = []
+            for tick in ticks:
+                bucket = self._buckets[tick % self.slots]
+                expired = [key for key, deadline in bucket.items() if deadline <= target]
+                for key in expired:
+                    due.append((bucket.pop(key), key))
+                    del self._deadlines[key]
+            self._current_tick = target
+            due.sort(key=lambda item: item[0])
+            return [key for _, key in due]
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
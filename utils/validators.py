@@ -1,6 +1,6 @@
-from datetime import datetime
 from typing import Optional
 from app.config import Config
+from utils.time_utils import current_day_and_minute, date_to_ordinal, time_to_minutes
 
 def validate_party_size(party_size: int) -> bool:
     """Validate party size is within acceptable range."""
@@ -9,9 +9,9 @@ def validate_party_size(party_size: int) -> bool:
 def validate_datetime(date: str, time: str) -> tuple[bool, Optional[str]]:
     """Validate date and time format and values."""
     try:
-        full_datetime = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
-        if full_datetime < datetime.now():
-            return False, "Cannot make reservations in the past"
-        return True, None
+        requested = (date_to_ordinal(date), time_to_minutes(time))
     except ValueError:
-        return False, "Invalid date or time format"
\ No newline at end of file
+        return False, "Invalid date or time format"
+    if requested < current_day_and_minute():
+        return False, "Cannot make reservations in the past"
+    return True, None